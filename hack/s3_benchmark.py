@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the gardenlinux.s3 transfer paths against a local S3 stand-in.
+
+By default a moto server (requires "moto[server]") is started on a free local
+port. Use "--endpoint-url" to benchmark against another S3-compatible service
+like MinIO or "--in-process" to use moto without HTTP. Peak RSS reported for
+moto includes the objects it stores as it runs within this process.
+
+Results are reported as JSON containing throughput, S3 request counts and
+peak RSS for each combination of concurrency and multipart chunk size.
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from resource import RUSAGE_SELF, getrusage
+from tempfile import TemporaryDirectory
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
+
+from gardenlinux.s3 import S3Artifacts, SessionCache
+
+CNAME = "container-amd64-1234.1-abc123lo"
+MIB = 1024 * 1024
+REGION = "us-east-1"
+
+RELEASE_DATA = """
+GARDENLINUX_CNAME="container-amd64-1234.1"
+GARDENLINUX_VERSION=1234.1
+GARDENLINUX_COMMIT_ID="abc123lo"
+GARDENLINUX_COMMIT_ID_LONG="abc123long"
+GARDENLINUX_PLATFORM="container"
+GARDENLINUX_FEATURES=""
+"""
+
+
+class RequestCounter(object):
+    """
+    Counts S3 HTTP requests sent by operation name.
+    """
+
+    def __init__(self) -> None:
+        self._counter: Counter[str] = Counter()
+        self._lock = Lock()
+
+    def __call__(self, event_name: str, **kwargs: Any) -> None:
+        with self._lock:
+            self._counter[event_name.rsplit(".", 1)[-1]] += 1
+
+    def reset(self) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(self._counter)
+            self._counter.clear()
+
+        return counts
+
+
+class RssSampler(object):
+    """
+    Samples the resident set size of this process in the background as
+    getrusage() only reports the peak of the whole process lifetime.
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self._interval = interval
+        self._peak = 0
+        self._stopped = Event()
+        self._thread = Thread(target=self._run, daemon=True)
+
+    @property
+    def peak(self) -> int:
+        return max(self._peak, self._get_rss())
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._peak = max(self._peak, self._get_rss())
+
+    @staticmethod
+    def _get_rss() -> int:
+        try:
+            with open("/proc/self/statm", "r") as fp:
+                return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            # ru_maxrss is given in KiB on Linux
+            return getrusage(RUSAGE_SELF).ru_maxrss * 1024
+
+
+@contextmanager
+def measure(
+    results: Dict[str, Any], name: str, counter: RequestCounter, size: int = 0
+) -> Iterator[None]:
+    """
+    Records duration, throughput, S3 requests and peak RSS of the block.
+    """
+
+    counter.reset()
+
+    with RssSampler() as sampler:
+        start = perf_counter()
+        yield
+        duration = perf_counter() - start
+
+    results[name] = {
+        "seconds": round(duration, 3),
+        "bytes": size,
+        "throughput_mib_s": round(size / MIB / duration, 2) if size > 0 else None,
+        "requests": counter.reset(),
+        "peak_rss_mib": round(sampler.peak / MIB, 1),
+    }
+
+
+def generate_artifacts(
+    artifacts_dir: Path, artifact_count: int, artifact_size: int
+) -> int:
+    """
+    Generates incompressible artifacts of the size given in MiB.
+    """
+
+    (artifacts_dir / f"{CNAME}.release").write_text(RELEASE_DATA)
+    block = os.urandom(MIB)
+
+    for index in range(artifact_count):
+        with (artifacts_dir / f"{CNAME}.artifact{index}.raw").open("wb") as fp:
+            for block_index in range(artifact_size):
+                fp.write(block_index.to_bytes(8, "little") + block[8:])
+
+    return sum(artifact.stat().st_size for artifact in artifacts_dir.iterdir())
+
+
+def run_scenario(
+    s3_resource_config: Dict[str, Any],
+    bucket_name: str,
+    artifacts_dir: Path,
+    artifacts_size: int,
+    concurrency: int,
+    chunksize: int,
+    listing_keys: int,
+) -> Dict[str, Any]:
+    """
+    Runs upload, download and listing benchmarks for one configuration.
+    """
+
+    SessionCache.get_client(s3_resource_config, concurrency).create_bucket(
+        Bucket=bucket_name
+    )
+
+    artifacts = S3Artifacts(
+        bucket_name,
+        s3_resource_config=s3_resource_config,
+        max_pool_connections=concurrency,
+    )
+
+    # Count requests of the client actually used by the code measured
+    events = artifacts.bucket.meta.client.meta.events
+
+    counter = RequestCounter()
+    events.register("request-created.s3", counter)
+
+    transfer_config = S3Artifacts.get_transfer_config(chunksize, concurrency)
+    results: Dict[str, Any] = {"concurrency": concurrency, "chunksize": chunksize}
+
+    try:
+        with measure(results, "upload_from_directory", counter, artifacts_size):
+            artifacts.upload_from_directory(
+                CNAME, artifacts_dir, transfer_config=transfer_config
+            )
+
+        with TemporaryDirectory() as download_dir:
+            with measure(results, "download_to_directory", counter, artifacts_size):
+                artifacts.download_to_directory(
+                    CNAME, download_dir, transfer_config=transfer_config
+                )
+
+            with measure(results, "download_to_directory_unchanged", counter):
+                artifacts.download_to_directory(
+                    CNAME, download_dir, transfer_config=transfer_config
+                )
+
+        for index in range(listing_keys):
+            artifacts.bucket.put_object(Key=f"objects/listing/{index:08d}", Body=b"")
+
+        with TemporaryDirectory() as cache_dir:
+            cache_file = Path(cache_dir, "s3.cache")
+
+            with measure(results, "read_cache_file_or_filter_cold", counter):
+                artifacts.bucket.read_cache_file_or_filter(
+                    cache_file, Prefix="objects/"
+                )
+
+            with measure(results, "read_cache_file_or_filter_cached", counter):
+                artifacts.bucket.read_cache_file_or_filter(
+                    cache_file, Prefix="objects/"
+                )
+
+            with measure(results, "read_cache_file_or_filter_incremental", counter):
+                artifacts.bucket.read_cache_file_or_filter(
+                    cache_file, 0, Prefix="objects/"
+                )
+    finally:
+        events.unregister("request-created.s3", counter)
+
+    return results
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser("s3_benchmark")
+
+    stand_in = parser.add_mutually_exclusive_group()
+
+    stand_in.add_argument(
+        "--endpoint-url",
+        dest="endpoint_url",
+        help="S3-compatible endpoint to use instead of starting a moto server.",
+    )
+
+    stand_in.add_argument(
+        "--in-process",
+        action="store_true",
+        dest="in_process",
+        help="Use moto in-process without HTTP instead of starting a moto server.",
+    )
+
+    parser.add_argument(
+        "--artifacts",
+        type=int,
+        default=2,
+        dest="artifact_count",
+        help="Number of artifacts to generate.",
+    )
+
+    parser.add_argument(
+        "--artifact-size",
+        type=int,
+        default=256,
+        dest="artifact_size",
+        help="Size of each artifact generated in MiB.",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[4, 10],
+        dest="concurrency",
+        help="Maximum number of concurrent S3 requests to benchmark.",
+    )
+
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        nargs="+",
+        default=[8, 64],
+        dest="chunksizes",
+        help="Multipart chunk sizes in MiB to benchmark.",
+    )
+
+    parser.add_argument(
+        "--listing-keys",
+        type=int,
+        default=1000,
+        dest="listing_keys",
+        help="Number of additional empty objects to benchmark listings with.",
+    )
+
+    parser.add_argument(
+        "--output", dest="output", help="File to write the JSON results to."
+    )
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = get_parser().parse_args(argv)
+    s3_resource_config: Dict[str, Any] = {"region_name": REGION}
+
+    with ExitStack() as stack:
+        if args.in_process:
+            from moto import mock_aws
+
+            stack.enter_context(mock_aws())
+            stand_in = "moto (in-process)"
+        elif args.endpoint_url is not None:
+            s3_resource_config["endpoint_url"] = args.endpoint_url
+            stand_in = args.endpoint_url
+        else:
+            try:
+                from moto.server import ThreadedMotoServer
+            except ImportError:
+                sys.exit('Starting a moto server requires "moto[server]"')
+
+            server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+            server.start()
+            stack.callback(server.stop)
+
+            host, port = server.get_host_and_port()
+            stand_in = f"http://{host}:{port}"
+
+            s3_resource_config.update(
+                endpoint_url=stand_in,
+                aws_access_key_id="benchmark",
+                aws_secret_access_key="benchmark",
+            )
+
+        artifacts_dir = Path(stack.enter_context(TemporaryDirectory()))
+
+        artifacts_size = generate_artifacts(
+            artifacts_dir, args.artifact_count, args.artifact_size
+        )
+
+        scenarios = []
+
+        for concurrency in args.concurrency:
+            for chunksize in args.chunksizes:
+                scenarios.append(
+                    run_scenario(
+                        s3_resource_config,
+                        f"gl-s3-benchmark-{len(scenarios)}",
+                        artifacts_dir,
+                        artifacts_size,
+                        concurrency,
+                        chunksize * MIB,
+                        args.listing_keys,
+                    )
+                )
+
+    report = json.dumps(
+        {
+            "stand_in": stand_in,
+            "artifacts": args.artifact_count,
+            "artifact_size_mib": args.artifact_size,
+            "scenarios": scenarios,
+        },
+        indent=2,
+    )
+
+    if args.output is None:
+        print(report)
+    else:
+        Path(args.output).write_text(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,12 @@
 deb sources
 """
 
-import re
-from typing import TextIO
+from collections.abc import Iterable
+from functools import partial
+from io import BufferedIOBase
+from typing import IO, Optional, TextIO
+
+from ..constants import GL_DEB_PACKAGES_CHUNK_SIZE
 
 
 class Debsrc:
@@ -58,27 +62,6 @@ class DebsrcFile(dict[str, Debsrc]):
                  Apache License, Version 2.0
     """
 
-    __re = re.compile(
-        r"""
-        ^(?:
-            Package:\s*(?P<source>[a-z0-9.-]+)
-            |
-            Version:\s*(?P<version>[A-Za-z0-9.+~:-]+)
-            |
-            Extra-Source-Only:\s*(?P<eso>yes)
-            |
-            (?P<eoe>)
-            |
-            # All other fields
-            [A-Za-z0-9-]+:.*
-            |
-            # Continuation field
-            \s+.*
-        )$
-    """,
-        re.VERBOSE,
-    )
-
     def read(self, f: TextIO) -> None:
         """
         Read and parse the given TextIO data to extract deb sources.
@@ -88,23 +71,67 @@ class DebsrcFile(dict[str, Debsrc]):
         :since: 0.7.0
         """
 
-        parsed_source = parsed_version = None
+        self._read_chunks(
+            chunk.encode("utf-8")
+            for chunk in iter(partial(f.read, GL_DEB_PACKAGES_CHUNK_SIZE), "")
+        )
+
+    def read_binary(
+        self,
+        fp: BufferedIOBase | IO[bytes],
+        chunk_size: int = GL_DEB_PACKAGES_CHUNK_SIZE,
+    ) -> None:
+        """
+        Read and parse the given binary stream, e.g. a decompressed HTTP
+        response, in chunks to extract deb sources. Only one stanza is kept in
+        memory at a time.
+
+        :param fp:         Binary stream to parse
+        :param chunk_size: Number of bytes to read at once
 
-        for line in f.readlines():
-            if match := self.__re.match(line):
-                if i := match["source"]:
-                    parsed_source = i
-                elif i := match["version"]:
-                    parsed_version = i
-                elif match["eso"]:
-                    parsed_source = parsed_version = None
-                elif match["eoe"] is not None:
-                    self._set_source(parsed_source, parsed_version)
-                    parsed_source = parsed_version = None
-            else:
-                raise RuntimeError(f"Unable to read line: {line}")
+        :since: 1.0.0
+        """
+
+        self._read_chunks(iter(partial(fp.read, chunk_size), b""))
+
+    def _read_chunks(self, chunks: Iterable[bytes]) -> None:
+        """
+        Splits the given chunks into stanzas separated by blank lines and
+        parses them.
 
-        self._set_source(parsed_source, parsed_version)
+        :param chunks: Chunks of deb sources data
+
+        :since: 1.0.0
+        """
+
+        pending = b""
+
+        for chunk in chunks:
+            stanzas = (pending + chunk).split(b"\n\n")
+            pending = stanzas.pop()
+
+            for stanza in stanzas:
+                self._read_stanza(stanza)
+
+        self._read_stanza(pending)
+
+    def _read_stanza(self, stanza: bytes) -> None:
+        """
+        Parses the given stanza and sets its deb source.
+
+        :param stanza: Stanza data
+
+        :since: 1.0.0
+        """
+
+        if DebsrcFile._get_field(stanza, b"Extra-Source-Only:") == b"yes":
+            return
+
+        source = DebsrcFile._get_field(stanza, b"Package:")
+        version = DebsrcFile._get_field(stanza, b"Version:")
+
+        if source is not None and version is not None:
+            self._set_source(source.decode("utf-8"), version.decode("utf-8"))
 
     def _set_source(self, source: str | None, version: str | None) -> None:
         """
@@ -118,3 +145,30 @@ class DebsrcFile(dict[str, Debsrc]):
                 deb_source=source,
                 deb_version=version,
             )
+
+    @staticmethod
+    def _get_field(stanza: bytes, prefix: bytes) -> Optional[bytes]:
+        """
+        Returns the value of the single-line field starting with the prefix
+        given.
+
+        :param stanza: Stanza data
+        :param prefix: Field name including the colon
+
+        :return: (bytes) Field value; None if not found
+        :since: 1.0.0
+        """
+
+        if stanza.startswith(prefix):
+            start = len(prefix)
+        else:
+            start = stanza.find(b"\n" + prefix)
+
+            if start < 0:
+                return None
+
+            start += len(prefix) + 1
+
+        end = stanza.find(b"\n", start)
+
+        return stanza[start : end if end >= 0 else None].strip()
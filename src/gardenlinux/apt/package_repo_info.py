@@ -108,8 +108,29 @@ def compare_repo(
     :since:  0.7.0
     """
 
-    packages_a = dict(a.get_packages_versions())
-    packages_b = dict(b.get_packages_versions())
+    return compare_packages_versions(
+        a.get_packages_versions(), b.get_packages_versions(), available_in_both
+    )
+
+
+def compare_packages_versions(
+    packages_versions_a: list[tuple[str, str]],
+    packages_versions_b: list[tuple[str, str]],
+    available_in_both: Optional[bool] = False,
+) -> list[tuple[str, str | None, str | None]]:
+    """
+    Compares differences between package versions lists given.
+
+    :param packages_versions_a: (package, version) tuples of the first repo
+    :param packages_versions_b: (package, version) tuples of the second repo
+    :param available_in_both:   Compare packages available in both repos only
+
+    :return: (list) Differences between repo a and repo b
+    :since:  1.0.0
+    """
+
+    packages_a = dict(packages_versions_a)
+    packages_b = dict(packages_versions_b)
     if available_in_both:
         all_names = set(packages_a.keys()).intersection(set(packages_b.keys()))
     else:
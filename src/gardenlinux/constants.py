@@ -146,10 +146,17 @@ GL_MEDIA_TYPE_LOOKUP = {
 }
 
 GL_BUG_REPORT_URL = "https://github.com/gardenlinux/gardenlinux/issues"
+GL_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "gardenlinux"
+)
 GL_COMMIT_SPECIAL_VALUES = ("local",)
 GL_CONTAINER_REGISTRY_BASE_URL = "ghcr.io/gardenlinux/gardenlinux"
+GL_DEB_PACKAGES_CHUNK_SIZE = 64 * 1024
 GL_DEB_REPO_BASE_URL = "https://packages.gardenlinux.io/gardenlinux"
 GL_DISTRIBUTION_NAME = "Garden Linux"
+# Features graphs of Git trees kept in memory for reuse by features.Parser
+GL_FEATURES_GRAPHS_CACHE_SIZE = 16
+GL_GIT_MIRROR_CACHE_DIR = GL_CACHE_DIR / "git"
 GL_HOME_URL = "https://gardenlinux.io"
 GL_PLATFORM_FRANKENSTEIN = "frankenstein"
 GL_RELEASE_ID = "gardenlinux"
@@ -160,15 +167,36 @@ OCI_ANNOTATION_SIGNATURE_KEY = "io.gardenlinux.oci.signature"
 OCI_ANNOTATION_SIGNED_STRING_KEY = "io.gardenlinux.oci.signed-string"
 OCI_IMAGE_INDEX_MEDIA_TYPE = "application/vnd.oci.image.index.v1+json"
 
+REQUESTS_BACKOFF_FACTOR = 0.5
+REQUESTS_MAX_RETRIES = 3
+REQUESTS_POOL_MAXSIZE = 10
+REQUESTS_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 REQUESTS_TIMEOUTS = (5, 60)  # connect, read
 
+S3_DELETE_OBJECTS_MAX_KEYS = 1000
 S3_DOWNLOADS_DIR = Path(os.path.dirname(__file__)) / ".." / "s3_downloads"
+# SHA256 digest of empty input published by releases before digests were fixed
+S3_LEGACY_SHA256SUM = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+# boto3 default S3 transfer values
+S3_MAX_CONCURRENCY = 10
+# Shared S3 clients serve S3_MAX_CONCURRENCY transfer threads besides concurrent
+# listing and get_object requests (botocore defaults to 10 pooled connections)
+S3_MAX_POOL_CONNECTIONS = 32
+# boto3 default S3 transfer values
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
 
 GARDENLINUX_GITHUB_RELEASE_BUCKET_NAME = "gardenlinux-github-releases"
+GITHUB_RATE_LIMIT_WAIT_SECONDS = 60
+GITHUB_RESPONSE_CACHE_PER_PAGE = 100
+GITHUB_UPLOAD_MAX_ATTEMPTS = 5
+GITHUB_UPLOAD_MAX_WORKERS = 4
 GLVD_BASE_URL = "https://security.gardenlinux.org/v1"
 
 PODMAN_CONNECTION_MAX_IDLE_SECONDS = 3
+PODMAN_MAX_PARALLEL_OPERATIONS = 4
 PODMAN_FS_CHANGE_ADDED = "added"
 PODMAN_FS_CHANGE_DELETED = "deleted"
 PODMAN_FS_CHANGE_MODIFIED = "modified"
 PODMAN_FS_CHANGE_UNSUPPORTED = "unsupported"
+PODMAN_STREAM_CHUNK_SIZE = 64 * 1024
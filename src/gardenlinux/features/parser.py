@@ -6,15 +6,23 @@ Features parser based on networkx.Digraph
 
 import logging
 import os
+from collections import OrderedDict
 from functools import reduce
 from glob import glob
 from pathlib import Path
+from threading import Lock
 from typing import Any, Callable, Dict, List, Optional, Set
 
 import networkx
 import yaml
-
-from ..constants import BARE_FLAVOR_FEATURE_CONTENT, BARE_FLAVOR_LIBC_FEATURE_CONTENT
+from pygit2 import Commit, Tree
+
+from ..constants import (
+    BARE_FLAVOR_FEATURE_CONTENT,
+    BARE_FLAVOR_LIBC_FEATURE_CONTENT,
+    GL_FEATURES_GRAPHS_CACHE_SIZE,
+)
+from ..git import Repository
 from ..logger import LoggerSetup
 
 
@@ -36,38 +44,80 @@ class Parser(object):
     Default GardenLinux root directory
     """
 
+    _GRAPHS: OrderedDict[str, networkx.DiGraph] = OrderedDict()
+    """
+    Features graphs built from Git by ID of the features tree, least recently
+    used first
+    """
+
+    _GRAPHS_LOCK: Lock = Lock()
+    """
+    Lock guarding the features graphs cache
+    """
+
     def __init__(
         self,
         gardenlinux_root: Optional[str] = None,
         feature_dir_name: str = "features",
         logger: Optional[logging.Logger] = None,
+        repository: Optional[Repository] = None,
+        commit: str = "HEAD",
     ):
         """
         Constructor __init__(Parser)
 
+        Features are read from the Git object database at the commit given
+        instead of the GardenLinux root directory if a repository is given.
+
         :param gardenlinux_root: GardenLinux root directory
         :param feature_dir_name: Name of the features directory
         :param logger: Logger instance
+        :param repository: Git repository to read features from
+        :param commit: Git commit ID, branch, tag or reference to read features at
 
         :since: 0.7.0
         """
 
-        if gardenlinux_root is None:
-            gardenlinux_root = Parser._GARDENLINUX_ROOT
+        if logger is None or not logger.hasHandlers():
+            logger = LoggerSetup.get_logger("gardenlinux.features")
+
+        features_tree: Optional[Tree] = None
+
+        if repository is None:
+            if gardenlinux_root is None:
+                gardenlinux_root = Parser._GARDENLINUX_ROOT
 
-        feature_base_dir = Path(gardenlinux_root).resolve() / feature_dir_name
+            feature_base_dir = Path(gardenlinux_root).resolve() / feature_dir_name
 
-        if not os.access(feature_base_dir, os.R_OK):
-            raise ValueError(
-                "Feature directory given is invalid: {0}".format(feature_base_dir)
+            if not os.access(feature_base_dir, os.R_OK):
+                raise ValueError(
+                    "Feature directory given is invalid: {0}".format(feature_base_dir)
+                )
+        else:
+            feature_base_dir = Path(feature_dir_name)
+            resolved_commit = repository.resolve_refish(commit)[0].peel(Commit)
+            commit = str(resolved_commit.id)
+            tree = resolved_commit.tree
+
+            features_tree_entry = (
+                tree[feature_dir_name] if feature_dir_name in tree else None
             )
 
-        if logger is None or not logger.hasHandlers():
-            logger = LoggerSetup.get_logger("gardenlinux.features")
+            if not isinstance(features_tree_entry, Tree):
+                raise ValueError(
+                    "Feature directory given is invalid: {0} at {1}".format(
+                        feature_base_dir, commit
+                    )
+                )
+
+            features_tree = features_tree_entry
 
+        self._commit = commit
         self._feature_base_dir = feature_base_dir
+        self._features_tree = features_tree
         self._graph = None
         self._logger = logger
+        self._repository = repository
 
         self._logger.debug(
             "features.Parser initialized for directory: {0}".format(feature_base_dir)
@@ -83,35 +133,41 @@ class Parser(object):
         """
 
         if self._graph is None:
-            feature_yaml_files = glob("{0}/*/info.yaml".format(self._feature_base_dir))
-            features = [self._read_feature_yaml(i) for i in feature_yaml_files]
-
-            feature_graph = networkx.DiGraph()
+            if self._features_tree is None:
+                feature_yaml_files = glob(
+                    "{0}/*/info.yaml".format(self._feature_base_dir)
+                )
 
-            for feature in features:
-                feature_graph.add_node(feature["name"], content=feature["content"])
+                features = [self._read_feature_yaml(i) for i in feature_yaml_files]
+                self._graph = self._get_features_graph(features)
+            else:
+                tree_id = str(self._features_tree.id)
 
-            for node in feature_graph.nodes():
-                node_features = self._get_node_features(feature_graph.nodes[node])
+                with Parser._GRAPHS_LOCK:
+                    graph = Parser._GRAPHS.get(tree_id)
 
-                for attr in node_features:
-                    if attr not in ["include", "exclude"]:
-                        continue
+                    if graph is not None:
+                        Parser._GRAPHS.move_to_end(tree_id)
 
-                    for ref in node_features[attr]:
-                        if not os.path.isfile(
-                            "{0}/{1}/info.yaml".format(self._feature_base_dir, ref)
-                        ):
-                            raise ValueError(
-                                f"feature {node} references feature {ref}, but {self._feature_base_dir}/{ref}/info.yaml does not exist"
-                            )
+                if graph is None:
+                    # Built outside of the lock to not serialize reading Git trees
+                    graph = self._get_features_graph(
+                        self._read_feature_yamls_from_git()
+                    )
 
-                        feature_graph.add_edge(node, ref, attr=attr)
+                    with Parser._GRAPHS_LOCK:
+                        Parser._GRAPHS[tree_id] = graph
+                        Parser._GRAPHS.move_to_end(tree_id)
 
-            if not networkx.is_directed_acyclic_graph(feature_graph):
-                raise ValueError("Graph is not directed acyclic graph")
+                        while len(Parser._GRAPHS) > GL_FEATURES_GRAPHS_CACHE_SIZE:
+                            Parser._GRAPHS.popitem(last=False)
+                else:
+                    self._logger.debug(
+                        "Reusing features graph for tree: {0}".format(tree_id)
+                    )
 
-            self._graph = feature_graph
+                # Graphs are extended by the special "bare" features on demand
+                self._graph = graph.copy()
 
         return self._graph
 
@@ -345,6 +401,41 @@ class Parser(object):
 
         return node.get("content", {}).get("features", {})  # type: ignore[no-any-return]
 
+    def _get_features_graph(self, features: List[Dict[str, Any]]) -> networkx.DiGraph:
+        """
+        Returns the features graph for the features content given.
+
+        :param features: Features content dictionaries
+
+        :return: (networkx.DiGraph) Features graph
+        :since:  1.0.0
+        """
+
+        feature_graph = networkx.DiGraph()
+
+        for feature in features:
+            feature_graph.add_node(feature["name"], content=feature["content"])
+
+        for node in feature_graph.nodes():
+            node_features = self._get_node_features(feature_graph.nodes[node])
+
+            for attr in node_features:
+                if attr not in ["include", "exclude"]:
+                    continue
+
+                for ref in node_features[attr]:
+                    if ref not in feature_graph:
+                        raise ValueError(
+                            f"feature {node} references feature {ref}, but {self._feature_base_dir}/{ref}/info.yaml does not exist"
+                        )
+
+                    feature_graph.add_edge(node, ref, attr=attr)
+
+        if not networkx.is_directed_acyclic_graph(feature_graph):
+            raise ValueError("Graph is not directed acyclic graph")
+
+        return feature_graph
+
     def _read_feature_yaml(self, feature_yaml_file: str) -> Dict[str, Any]:
         """
         Reads and returns the content of the given features file.
@@ -362,6 +453,35 @@ class Parser(object):
 
         return {"name": name, "content": content}
 
+    def _read_feature_yamls_from_git(self) -> List[Dict[str, Any]]:
+        """
+        Reads and returns the content of all features files at the commit
+        given from the Git object database.
+
+        :return: (list) Features content dictionaries
+        :since:  1.0.0
+        """
+
+        assert self._repository is not None and self._features_tree is not None
+
+        names = [entry.name for entry in self._features_tree if isinstance(entry, Tree)]
+
+        feature_yaml_files = self._repository.read_files(
+            [
+                "{0}/{1}/info.yaml".format(self._feature_base_dir, name)
+                for name in names
+            ],
+            self._commit,
+        )
+
+        features = []
+
+        for name, data in zip(names, feature_yaml_files.values()):
+            if data is not None:
+                features.append({"name": name, "content": yaml.safe_load(data)})
+
+        return features
+
     @staticmethod
     def get_flavor_from_feature_set(sorted_features: List[str]) -> str:
         """
@@ -26,7 +26,7 @@ def generate(args: argparse.Namespace) -> None:
     :since: 1.0.0
     """
 
-    comparator = Comparator(nightly=args.nightly)
+    comparator = Comparator(nightly=args.nightly, cache_dir=args.cache_dir)
 
     files, whitelist = comparator.generate(args.a, args.b)
 
@@ -94,6 +94,7 @@ def main() -> None:
     generate_parser = subparser.add_parser("generate")
     generate_parser.add_argument("--nightly", action="store_true")
     generate_parser.add_argument("--out")
+    generate_parser.add_argument("--cache-dir")
     generate_parser.add_argument("a")
     generate_parser.add_argument("b")
     generate_parser.set_defaults(func=generate)
@@ -9,8 +9,11 @@ import importlib
 import importlib.resources
 import json
 import re
-from os import PathLike
+from hashlib import file_digest, sha256
+from os import PathLike, replace
 from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, Optional
 
 from ...constants import (
     PODMAN_FS_CHANGE_ADDED,
@@ -33,26 +36,35 @@ class Comparator(object):
                  Apache License, Version 2.0
     """
 
-    def __init__(self, nightly: bool = False, whitelist: list[str] = []):
+    def __init__(
+        self,
+        nightly: bool = False,
+        whitelist: list[str] = [],
+        cache_dir: Optional[PathLike[str] | str] = None,
+    ):
         """
         Constructor __init__(Comparator)
 
         :param nightly:                 Flag indicating if the nightlywhitelist should be used
         :param whitelst:                Additional whitelist
+        :param cache_dir:               Directory to cache comparison results in
 
         :since: 1.0.0
         """
 
-        self.whitelist = whitelist
+        self.whitelist = list(whitelist)
+        self._cache_dir = None if cache_dir is None else Path(cache_dir)
 
         if nightly:
             self.whitelist += json.loads(
                 importlib.resources.read_text(__name__, "nightly_whitelist.json")
             )
 
-    @PodmanContext.wrap
     def generate(
-        self, a: PathLike[str], b: PathLike[str], podman: PodmanContext
+        self,
+        a: PathLike[str],
+        b: PathLike[str],
+        podman: Optional[PodmanContext] = None,
     ) -> tuple[list[str], bool]:
         """
         Compare two .tar/.oci images with each other
@@ -64,9 +76,49 @@ class Comparator(object):
         :since: 1.0.0
         """
 
-        if filecmp.cmp(a, b, shallow=False):
+        cache_file = None
+
+        if self._cache_dir is not None:
+            cache_file = self._get_cache_file(a, b)
+
+            if cache_file is None:
+                return [], False
+
+            if cache_file.exists():
+                with cache_file.open("r") as fp:
+                    cached_result = json.loads(fp.read())
+
+                return cached_result["differences"], cached_result["whitelist"]
+        elif filecmp.cmp(a, b, shallow=False):
             return [], False
 
+        kwargs: Dict[str, Any] = {}
+
+        if podman is not None:
+            kwargs["podman"] = podman
+
+        differences, whitelist = self._compare(a, b, **kwargs)
+
+        if cache_file is not None:
+            self._write_cache_file(cache_file, differences, whitelist)
+
+        return differences, whitelist
+
+    @PodmanContext.wrap
+    def _compare(
+        self, a: PathLike[str], b: PathLike[str], podman: PodmanContext
+    ) -> tuple[list[str], bool]:
+        """
+        Compare the filesystems of two .tar/.oci images using podman.
+
+        :param a:                       First .tar/.oci file
+        :param b:                       Second .tar/.oci file
+        :param podman:                  Podman context
+
+        :return: list[Path], bool       Filtered list of paths with different content and flag indicating if whitelist was applied
+        :since: 1.0.0
+        """
+
         a = Path(a)
         a_image_id = None
 
@@ -93,21 +145,27 @@ class Comparator(object):
 
             image = podman_api.get_image(a_image_id, podman=podman)
 
-            result = image.get_filesystem_changes(
-                parent_layer_image_id=b_image_id, podman=podman
-            )
-
-            differences = (
-                result[PODMAN_FS_CHANGE_ADDED] + result[PODMAN_FS_CHANGE_DELETED]
-            )
-
+            added = []
+            deleted = []
+            modified = []
             whitelist = False
 
-            for entry in result[PODMAN_FS_CHANGE_MODIFIED]:
-                if not any(re.match(pattern, entry) for pattern in self.whitelist):
-                    differences.append(entry)
-                else:
-                    whitelist = True
+            whitelist_patterns = [re.compile(pattern) for pattern in self.whitelist]
+
+            for kind, entry in image.iter_filesystem_changes(
+                podman, parent_layer_image_id=b_image_id
+            ):
+                if kind == PODMAN_FS_CHANGE_ADDED:
+                    added.append(entry)
+                elif kind == PODMAN_FS_CHANGE_DELETED:
+                    deleted.append(entry)
+                elif kind == PODMAN_FS_CHANGE_MODIFIED:
+                    if not any(pattern.match(entry) for pattern in whitelist_patterns):
+                        modified.append(entry)
+                    else:
+                        whitelist = True
+
+            differences = added + deleted + modified
         finally:
             if a_image_id is not None:
                 podman.images.remove(a_image_id)
@@ -115,3 +173,58 @@ class Comparator(object):
                 podman.images.remove(b_image_id)
 
         return differences, whitelist
+
+    def _get_cache_file(self, a: PathLike[str], b: PathLike[str]) -> Optional[Path]:
+        """
+        Returns the cache file for the comparison of the given files. The cache
+        key is based on the SHA256 digests of both files and the whitelist.
+
+        :param a:                       First .tar/.oci file
+        :param b:                       Second .tar/.oci file
+
+        :return: (Path) Cache file path; None if both files are identical
+        :since: 1.0.0
+        """
+
+        assert self._cache_dir is not None
+
+        with open(a, "rb") as fp:
+            a_digest = file_digest(fp, "sha256").hexdigest()
+
+        with open(b, "rb") as fp:
+            b_digest = file_digest(fp, "sha256").hexdigest()
+
+        if a_digest == b_digest:
+            return None
+
+        whitelist_digest = sha256(
+            json.dumps(self.whitelist).encode("utf-8")
+        ).hexdigest()
+
+        cache_key = sha256(
+            f"{a_digest}:{b_digest}:{whitelist_digest}".encode("utf-8")
+        ).hexdigest()
+
+        return self._cache_dir.joinpath(f"{cache_key}.json")
+
+    def _write_cache_file(
+        self, cache_file: Path, differences: list[str], whitelist: bool
+    ) -> None:
+        """
+        Writes the comparison result to the given cache file atomically.
+
+        :param cache_file:              Cache file path
+        :param differences:             Filtered list of paths with different content
+        :param whitelist:               Flag indicating if whitelist was applied
+
+        :since: 1.0.0
+        """
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(
+            "w", dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as fp:
+            fp.write(json.dumps({"differences": differences, "whitelist": whitelist}))
+
+        replace(fp.name, cache_file)
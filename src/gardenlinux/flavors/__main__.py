@@ -8,7 +8,6 @@ gl-flavors-parse main entrypoint
 import json
 from argparse import ArgumentParser
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Any, List, Tuple
 
 from ..constants import GL_REPOSITORY_URL
@@ -150,15 +149,16 @@ def main() -> None:
     try:
         flavors_data = _get_flavors_file_data(Path(Repository().root, "flavors.yaml"))
     except RuntimeError:
-        with TemporaryDirectory() as git_directory:
-            repo = Repository.checkout_repo_sparse(
-                git_directory,
-                ["flavors.yaml"],
-                repo_url=GL_REPOSITORY_URL,
-                commit=args.commit,
+        flavors_file_data = Repository.read_files_from_url(
+            ["flavors.yaml"], repo_url=GL_REPOSITORY_URL, commit=args.commit
+        )["flavors.yaml"]
+
+        if flavors_file_data is None:
+            raise RuntimeError(
+                f"Error: flavors.yaml does not exist in {GL_REPOSITORY_URL}"
             )
 
-            flavors_data = _get_flavors_file_data(Path(repo.root, "flavors.yaml"))
+        flavors_data = flavors_file_data.decode("utf-8")
 
     combinations = Parser(flavors_data).filter(
         include_only_patterns=args.include_only,
@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from fcntl import LOCK_EX, flock
+from hashlib import sha256
 from logging import Logger
 from os import PathLike, environ
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pygit2 import Oid
+from pygit2 import Blob, Commit, GitError, Oid
 from pygit2 import Repository as _Repository
 from pygit2 import init_repository
 
-from ..constants import GL_REPOSITORY_URL
+from ..constants import GL_GIT_MIRROR_CACHE_DIR, GL_REPOSITORY_URL
 from ..logger import LoggerSetup
 from .remote_callbacks import RemoteCallbacks
 
@@ -52,6 +56,7 @@ class Repository(_Repository):  # type: ignore[misc]
 
         _Repository.__init__(self, git_directory, **kwargs)
 
+        self._blobs: Dict[Oid, bytes] = {}
         self._git_directory = git_directory
         self._logger = logger
 
@@ -111,6 +116,58 @@ class Repository(_Repository):  # type: ignore[misc]
 
         return repo
 
+    def fetch_mirror(self) -> None:
+        """
+        Fetches all branches and tags of "origin" into this mirror. Only
+        objects missing locally are transferred.
+
+        :since: 1.0.0
+        """
+
+        with Repository._lock_mirror(Path(self.path)):
+            self.remotes["origin"].fetch(
+                callbacks=RemoteCallbacks(
+                    username=environ.get("GITHUB_TOKEN"), password="x-oauth-basic"
+                )
+            )
+
+        self._logger.debug(f"Updated Git mirror {self.path}")
+
+    def read_files(
+        self, paths: Iterable[str], refish: str = "HEAD"
+    ) -> Dict[str, Optional[bytes]]:
+        """
+        Returns the data of the files given at a commit or reference read from
+        the Git object database without a checkout. Blobs are cached by ID.
+
+        :param paths:  File paths relative to the repository root
+        :param refish: Commit ID, branch, tag or reference
+
+        :return: (dict) File data or None if not a file at the commit given
+        :since:  1.0.0
+        """
+
+        tree = self.resolve_refish(refish)[0].peel(Commit).tree
+        files: Dict[str, Optional[bytes]] = {}
+
+        for path in paths:
+            try:
+                entry = tree[path]
+            except KeyError:
+                files[path] = None
+                continue
+
+            if not isinstance(entry, Blob):
+                files[path] = None
+                continue
+
+            if entry.id not in self._blobs:
+                self._blobs[entry.id] = entry.data
+
+            files[path] = self._blobs[entry.id]
+
+        return files
+
     @staticmethod
     def checkout_repo(
         git_directory: PathLike[str] | str,
@@ -119,15 +176,31 @@ class Repository(_Repository):  # type: ignore[misc]
         commit: Optional[str] = None,
         pathspecs: Optional[List[str]] = None,
         logger: Optional[Logger] = None,
+        use_mirror: bool = True,
+        shallow: bool = False,
         **kwargs: Any,
     ) -> Any:
         """
         Returns the root Git `Repo` instance.
 
+        Objects are read from a persistent local mirror of the repository URL
+        given by default. The mirror is only updated if the commit requested
+        is not available locally.
+
+        A shallow checkout fetches only the commit or branch head requested
+        with depth 1 instead, bypassing the mirror. The checkout falls back
+        to the full history if the remote does not support it.
+
+        :param use_mirror: True to serve the checkout from the local mirror
+        :param shallow:    True to fetch the commit requested only
+
         :return: (object) Git `Repo` instance
         :since:  0.10.0
         """
 
+        if logger is None or not logger.hasHandlers():
+            logger = LoggerSetup.get_logger("gardenlinux.git")
+
         git_directory = Path(git_directory)
 
         if not git_directory.is_dir() or git_directory.match("/*"):
@@ -136,11 +209,62 @@ class Repository(_Repository):  # type: ignore[misc]
             )
 
         repo = init_repository(git_directory, origin_url=repo_url)
-        repo.remotes["origin"].fetch(
-            callbacks=RemoteCallbacks(
-                username=environ.get("GITHUB_TOKEN"), password="x-oauth-basic"
+        fetched = False
+        mirror = None
+
+        if shallow:
+            if commit is None:
+                refspec = f"+refs/heads/{branch}:refs/remotes/origin/{branch}"
+            else:
+                refspec = commit
+
+            try:
+                repo.remotes["origin"].fetch(
+                    [refspec],
+                    callbacks=RemoteCallbacks(
+                        username=environ.get("GITHUB_TOKEN"), password="x-oauth-basic"
+                    ),
+                    depth=1,
+                )
+
+                logger.debug(f"Fetched {refspec} of {repo_url} with depth 1")
+            except GitError as exc:
+                logger.warning(
+                    f"Shallow fetch of {repo_url} failed, falling back to full history: {exc}"
+                )
+            else:
+                fetched = True
+
+        if use_mirror and not fetched:
+            try:
+                mirror = Repository.get_updated_mirror(repo_url, commit, logger)
+            except (GitError, OSError) as exc:
+                logger.warning(f"Failed to use Git mirror for {repo_url}: {exc}")
+                mirror = None
+
+        if mirror is not None:
+            Path(repo.path, "objects", "info", "alternates").write_text(
+                f"{Path(mirror.path, 'objects')}\n"
             )
-        )
+
+            # Reopen the repository to read objects of the mirror added
+            repo = _Repository(git_directory)
+
+            for name in mirror.references:
+                if name.startswith(("refs/remotes/origin/", "refs/tags/")):
+                    repo.references.create(
+                        name, mirror.references[name].target, force=True
+                    )
+
+            logger.debug(f"Checking out {repo_url} from Git mirror {mirror.path}")
+        elif not fetched:
+            repo.remotes["origin"].fetch(
+                callbacks=RemoteCallbacks(
+                    username=environ.get("GITHUB_TOKEN"), password="x-oauth-basic"
+                )
+            )
+
+            logger.debug(f"Fetched full history of {repo_url}")
 
         if commit is None:
             refish = f"origin/{branch}"
@@ -163,11 +287,16 @@ class Repository(_Repository):  # type: ignore[misc]
         branch: str = "main",
         commit: Optional[str] = None,
         logger: Optional[Logger] = None,
+        use_mirror: bool = True,
+        shallow: bool = False,
         **kwargs: Any,
     ) -> Any:
         """
         Sparse checkout given Git repository and return the `Repository` instance.
 
+        :param use_mirror: True to serve the checkout from the local mirror
+        :param shallow:    True to fetch the commit requested only
+
         :return: (object) Git `Repository` instance
         :since:  0.10.0
         """
@@ -180,4 +309,106 @@ class Repository(_Repository):  # type: ignore[misc]
             commit=commit,
             pathspecs=pathspecs,
             logger=logger,
+            use_mirror=use_mirror,
+            shallow=shallow,
+        )
+
+    @staticmethod
+    def get_mirror(
+        repo_url: str = GL_REPOSITORY_URL,
+        cache_dir: Optional[PathLike[str] | str] = None,
+        logger: Optional[Logger] = None,
+    ) -> "Repository":
+        """
+        Returns the persistent local bare mirror of the repository URL given.
+        It is created empty if it does not exist yet.
+
+        :param repo_url:  Git repository URL
+        :param cache_dir: Directory containing Git mirrors
+        :param logger:    Logger instance
+
+        :return: (object) Git mirror `Repository` instance
+        :since:  1.0.0
+        """
+
+        if cache_dir is None:
+            cache_dir = GL_GIT_MIRROR_CACHE_DIR
+
+        mirror_dir = Path(
+            cache_dir, f"{sha256(repo_url.encode('utf-8')).hexdigest()[:16]}.git"
+        )
+
+        with Repository._lock_mirror(mirror_dir):
+            if not mirror_dir.exists():
+                init_repository(mirror_dir, bare=True, origin_url=repo_url)
+
+        return Repository(mirror_dir, logger)
+
+    @staticmethod
+    def get_updated_mirror(
+        repo_url: str = GL_REPOSITORY_URL,
+        commit: Optional[str] = None,
+        logger: Optional[Logger] = None,
+    ) -> "Repository":
+        """
+        Returns the local mirror of the repository URL given. It is updated
+        unless the commit given is already available locally.
+
+        :param repo_url: Git repository URL
+        :param commit:   Git commit ID required
+        :param logger:   Logger instance
+
+        :return: (object) Git mirror `Repository` instance
+        :since:  1.0.0
+        """
+
+        mirror = Repository.get_mirror(repo_url, logger=logger)
+
+        if commit is None or commit not in mirror:
+            mirror.fetch_mirror()
+
+        return mirror
+
+    @staticmethod
+    def read_files_from_url(
+        paths: Iterable[str],
+        repo_url: str = GL_REPOSITORY_URL,
+        branch: str = "main",
+        commit: Optional[str] = None,
+        logger: Optional[Logger] = None,
+    ) -> Dict[str, Optional[bytes]]:
+        """
+        Returns the data of the files given at a commit or branch of the
+        repository URL given read from its local mirror.
+
+        :param paths:    File paths relative to the repository root
+        :param repo_url: Git repository URL
+        :param branch:   Git branch used if no commit is given
+        :param commit:   Git commit ID
+
+        :return: (dict) File data or None if not a file at the commit given
+        :since:  1.0.0
+        """
+
+        mirror = Repository.get_updated_mirror(repo_url, commit, logger)
+
+        return mirror.read_files(
+            paths, f"origin/{branch}" if commit is None else commit
         )
+
+    @staticmethod
+    @contextmanager
+    def _lock_mirror(mirror_dir: Path) -> Iterator[None]:
+        """
+        Locks the Git mirror given exclusively for concurrent processes.
+
+        :param mirror_dir: Git mirror directory
+
+        :since: 1.0.0
+        """
+
+        mirror_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        with mirror_dir.with_suffix(".lock").open("w") as fp:
+            flock(fp, LOCK_EX)
+            yield
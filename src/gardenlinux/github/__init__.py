@@ -5,5 +5,6 @@ GitHub module
 """
 
 from .client import Client
+from .response_cache import ResponseCache
 
-__all__ = ["Client"]
+__all__ = ["Client", "ResponseCache"]
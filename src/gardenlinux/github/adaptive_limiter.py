@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+Adaptive concurrency limiter
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Condition
+
+
+class AdaptiveLimiter(object):
+    """
+    Limits the number of concurrent operations. The limit is halved whenever
+    a rate limit is hit and slowly grows back to the maximum afterwards.
+
+    :author:     Garden Linux Maintainers
+    :copyright:  Copyright 2024 SAP SE
+    :package:    gardenlinux
+    :subpackage: github
+    :since:      1.0.0
+    :license:    https://www.apache.org/licenses/LICENSE-2.0
+                 Apache License, Version 2.0
+    """
+
+    def __init__(self, max_limit: int):
+        """
+        Constructor __init__(AdaptiveLimiter)
+
+        :param max_limit: Maximum number of concurrent operations
+
+        :since: 1.0.0
+        """
+
+        if max_limit < 1:
+            raise ValueError("Concurrency limit must be at least 1")
+
+        self._active = 0
+        self._condition = Condition()
+        self._limit = max_limit
+        self._max_limit = max_limit
+
+    @property
+    def limit(self) -> int:
+        """
+        Returns the current concurrency limit.
+
+        :return: (int) Concurrency limit
+        :since:  1.0.0
+        """
+
+        return self._limit
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """
+        Waits until the number of active operations is below the limit and
+        counts the block as one active operation.
+
+        :since: 1.0.0
+        """
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def decrease(self) -> int:
+        """
+        Halves the concurrency limit after a rate limit was hit.
+
+        :return: (int) New concurrency limit
+        :since:  1.0.0
+        """
+
+        with self._condition:
+            self._limit = max(1, self._limit // 2)
+            return self._limit
+
+    def increase(self) -> int:
+        """
+        Raises the concurrency limit by one after a successful operation.
+
+        :return: (int) New concurrency limit
+        :since:  1.0.0
+        """
+
+        with self._condition:
+            if self._limit < self._max_limit:
+                self._limit += 1
+                self._condition.notify_all()
+
+            return self._limit
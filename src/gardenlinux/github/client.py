@@ -5,12 +5,16 @@ GitHub client
 """
 
 from logging import Logger
-from os import environ
-from typing import Any, Optional
+from os import PathLike, environ
+from typing import Any, Dict, List, Optional
 
 from github import Auth, Github
+from github.GitRelease import GitRelease
+from github.GitReleaseAsset import GitReleaseAsset
+from github.Repository import Repository
 
 from ..logger import LoggerSetup
+from .response_cache import ResponseCache
 
 
 class Client(object):
@@ -26,16 +30,27 @@ class Client(object):
                  Apache License, Version 2.0
     """
 
-    def __init__(self, token: Optional[str] = None, logger: Optional[Logger] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        logger: Optional[Logger] = None,
+        cache_dir: Optional[PathLike[str] | str] = None,
+    ):
         """
         Constructor __init__(Client)
 
+        Repositories, releases and release asset listings are cached on disk and revalidated with
+        conditional requests if a cache directory is given or set as
+        `GITHUB_RESPONSE_CACHE_DIR` environment variable.
+
         :param token: GitHub access token
         :param logger: Logger instance
+        :param cache_dir: Directory to cache GitHub API responses in
 
         :since: 1.0.0
         """
 
+        self._cache: Optional[ResponseCache] = None
         self._client = None
         self._token = token
 
@@ -50,6 +65,36 @@ class Client(object):
 
         self._logger = logger
 
+        if cache_dir is None:
+            cache_dir = environ.get("GITHUB_RESPONSE_CACHE_DIR")
+
+        if cache_dir is not None and str(cache_dir).strip() != "":
+            self._cache = ResponseCache(cache_dir, self._logger)
+
+    @property
+    def cache_stats(self) -> Dict[str, Optional[int]]:
+        """
+        Returns the response cache hits and misses as well as the remaining
+        GitHub API rate limit last reported.
+
+        :return: (dict) Response cache statistics
+        :since:  1.0.0
+        """
+
+        rate_limit_remaining = None
+
+        if self._client is not None:
+            rate_limit_remaining = self._client.requester.rate_limiting[0]
+
+            if rate_limit_remaining < 0:
+                rate_limit_remaining = None
+
+        return {
+            "hits": 0 if self._cache is None else self._cache.hits,
+            "misses": 0 if self._cache is None else self._cache.misses,
+            "rate_limit_remaining": rate_limit_remaining,
+        }
+
     @property
     def instance(self) -> Github:
         if self._client is None:
@@ -57,6 +102,64 @@ class Client(object):
 
         return self._client
 
+    def get_release(self, github_repo: Repository, release_id: int) -> GitRelease:
+        """
+        Returns the GitHub release of the repository given.
+
+        :param github_repo: GitHub repository
+        :param release_id:  GitHub release ID
+
+        :return: (object) GitHub release
+        :since:  1.0.0
+        """
+
+        if self._cache is None:
+            return github_repo.get_release(release_id)
+
+        return self._cache.get_object(
+            self.instance,
+            GitRelease,
+            f"/repos/{github_repo.full_name}/releases/{release_id}",
+            lambda: github_repo.get_release(release_id),
+        )
+
+    def get_release_assets(self, github_release: GitRelease) -> List[GitReleaseAsset]:
+        """
+        Returns all assets of the GitHub release given.
+
+        :param github_release: GitHub release
+
+        :return: (list) GitHub release assets
+        :since:  1.0.0
+        """
+
+        if self._cache is None:
+            return list(github_release.get_assets())
+
+        return self._cache.get_list(
+            self.instance, GitReleaseAsset, f"{github_release.url}/assets"
+        )
+
+    def get_repo(self, full_name: str) -> Repository:
+        """
+        Returns the GitHub repository given.
+
+        :param full_name: GitHub repository name in the form "owner/repo"
+
+        :return: (object) GitHub repository
+        :since:  1.0.0
+        """
+
+        if self._cache is None:
+            return self.instance.get_repo(full_name)
+
+        return self._cache.get_object(
+            self.instance,
+            Repository,
+            f"/repos/{full_name}",
+            lambda: self.instance.get_repo(full_name),
+        )
+
     def __getattr__(self, name: str) -> Any:
         """
         python.org: Called when an attribute lookup has not found the attribute in
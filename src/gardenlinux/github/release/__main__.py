@@ -1,7 +1,10 @@
 import argparse
 import logging
 
-from gardenlinux.constants import GARDENLINUX_GITHUB_RELEASE_BUCKET_NAME
+from gardenlinux.constants import (
+    GARDENLINUX_GITHUB_RELEASE_BUCKET_NAME,
+    GITHUB_UPLOAD_MAX_WORKERS,
+)
 from gardenlinux.logger import LoggerSetup
 
 from .notes import MarkdownGenerator
@@ -134,8 +137,16 @@ def get_parser() -> argparse.ArgumentParser:
 
     upload_parser.add_argument(
         "--file_path",
+        nargs="+",
         required=True,
-        help="Path to the file to upload (required).",
+        help="Paths to the files to upload (required).",
+    )
+
+    upload_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=GITHUB_UPLOAD_MAX_WORKERS,
+        help=f"Maximum number of concurrent uploads (default: {GITHUB_UPLOAD_MAX_WORKERS}).",
     )
 
     upload_parser.add_argument(
@@ -190,13 +201,21 @@ def main() -> None:
         if args.dry_run:
             print("Dry Run ...")
 
-            print(
-                f"The file {args.file_path} would be uploaded for release: {release.name}"
-            )
+            for file_path in args.file_path:
+                print(
+                    f"The file {file_path} would be uploaded for release: {release.name}"
+                )
+        elif len(args.file_path) == 1:
+            release.upload_asset(args.file_path[0], args.overwrite_same_name)
         else:
-            release.upload_asset(args.file_path, args.overwrite_same_name)
+            release.upload_assets(
+                args.file_path, args.overwrite_same_name, args.max_workers
+            )
     else:
         parser.print_help()
+        return
+
+    LOGGER.info(f"GitHub API response cache: {release.cache_stats}")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ The following packages have been upgraded, to address the mentioned CVEs:
 
 GL_RELEASE_CHARACTERS_LIMIT = 125000
 
+GL_RELEASE_PREFETCH_TIMEOUT = 300
+
 GL_RELEASE_MAJOR_TEMPLATE = """# Software Component Versions
 
 ```
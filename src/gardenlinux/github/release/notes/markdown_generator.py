@@ -2,12 +2,14 @@
 
 import json
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 from logging import Logger
 from string import Template
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from ....apt import DebsrcFile, GardenLinuxRepo
-from ....apt.package_repo_info import compare_repo
+from ....apt.package_repo_info import compare_packages_versions
 from ....constants import GL_CONTAINER_REGISTRY_BASE_URL
 from ....distro_version import DistroVersion
 from ....logger import LoggerSetup
@@ -16,6 +18,7 @@ from ..constants import (
     GL_RELEASE_CVE_PLACEHOLDER,
     GL_RELEASE_MAJOR_TEMPLATE,
     GL_RELEASE_MINOR_TEMPLATE,
+    GL_RELEASE_PREFETCH_TIMEOUT,
     HIGHLIGHT_PACKAGES,
     IMAGE_VARIANTS,
 )
@@ -56,6 +59,7 @@ class MarkdownGenerator(object):
         assert release.commitish is not None
 
         self._commitish = release.commitish
+        self._prefetched: Dict[str, Any] = {}
         self._s3_bucket_name = releases_s3_bucket_name
         self._version = release.tag
 
@@ -77,7 +81,7 @@ class MarkdownGenerator(object):
         file issues in glvd for improvement suggestions https://github.com/gardenlinux/glvd/issues
         """
 
-        package_changes = self._release_images_metadata.changes_and_cves_list
+        package_changes = self._get_source_data("changes_and_cves_list")
 
         if len(package_changes) < 1:
             return GL_RELEASE_CVE_PLACEHOLDER
@@ -104,10 +108,12 @@ class MarkdownGenerator(object):
     def compared_package_versions_table(self) -> str:
         version = DistroVersion(self._version)
 
-        previous_repo = GardenLinuxRepo(version.previous_patch_release)
-        current_repo = GardenLinuxRepo(self._version)
         pkg_diffs = sorted(
-            compare_repo(previous_repo, current_repo), key=lambda t: t[0]
+            compare_packages_versions(
+                self._get_source_data("previous_packages_versions"),
+                self._get_source_data("current_packages_versions"),
+            ),
+            key=lambda t: t[0],
         )
 
         out_list = [f"| Package | {version.previous_patch_release} | {self._version} |"]
@@ -126,7 +132,7 @@ class MarkdownGenerator(object):
 
     @property
     def package_list(self) -> DebsrcFile:
-        return self._release_images_metadata.package_list
+        return self._get_source_data("package_list")  # type: ignore[no-any-return]
 
     @property
     def release_images_table(self) -> str:
@@ -134,7 +140,7 @@ class MarkdownGenerator(object):
         Generate the table format with collapsible region details
         """
 
-        grouped_data = self._release_images_metadata.grouped_flavors_metadata
+        grouped_data = self._get_source_data("grouped_flavors_metadata")
         out_list = []
 
         for variant in grouped_data.keys():
@@ -201,6 +207,12 @@ class MarkdownGenerator(object):
         """
 
         version = DistroVersion(self._version)
+        failed_sources = self.prefetch()
+
+        if len(failed_sources) > 0:
+            raise RuntimeError(
+                f"Failed to gather release notes data from: {', '.join(failed_sources)}"
+            )
 
         if version.is_patch_release:
             template = Template(GL_RELEASE_MINOR_TEMPLATE)
@@ -231,6 +243,114 @@ class MarkdownGenerator(object):
 
         return out
 
+    def prefetch(
+        self, timeout: float = GL_RELEASE_PREFETCH_TIMEOUT
+    ) -> Dict[str, BaseException]:
+        """
+        Gathers all data needed for the release notes concurrently. Sources
+        already gathered are skipped. All sources share one timeout budget.
+
+        Python threads can not be interrupted, so the timeout only limits how
+        long this method waits. Sources still running keep running in the
+        background until their own request timeouts expire and the process
+        waits for them before exiting.
+
+        :param timeout: Seconds to wait for all sources
+
+        :return: (dict) Exceptions of sources that failed or timed out
+        :since:  1.0.0
+        """
+
+        source_names = ["grouped_flavors_metadata", "package_list"]
+
+        if DistroVersion(self._version).is_patch_release:
+            source_names += [
+                "changes_and_cves_list",
+                "current_packages_versions",
+                "previous_packages_versions",
+            ]
+
+        sources = self._get_sources()
+
+        source_names = [
+            source_name
+            for source_name in source_names
+            if source_name not in self._prefetched
+        ]
+
+        if len(source_names) < 1:
+            return {}
+
+        executor = ThreadPoolExecutor(max_workers=len(source_names))
+
+        futures = {
+            source_name: executor.submit(sources[source_name])
+            for source_name in source_names
+        }
+
+        wait(futures.values(), timeout=timeout)
+
+        # Do not block on sources still running after the timeout
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        failed_sources: Dict[str, BaseException] = {}
+
+        for source_name, future in futures.items():
+            if not future.done():
+                failed_sources[source_name] = TimeoutError(
+                    f"Timed out after {timeout} seconds"
+                )
+            elif future.exception() is not None:
+                failed_sources[source_name] = future.exception()  # type: ignore[assignment]
+            else:
+                self._prefetched[source_name] = future.result()
+
+        for source_name, exc in failed_sources.items():
+            self._logger.error(
+                f"Failed to gather release notes data from {source_name}: {exc}"
+            )
+
+        return failed_sources
+
+    def _get_source_data(self, source_name: str) -> Any:
+        """
+        Returns the prefetched data of the source given or gathers it now.
+
+        :param source_name: Release notes data source name
+
+        :return: (mixed) Source data
+        :since:  1.0.0
+        """
+
+        if source_name not in self._prefetched:
+            self._prefetched[source_name] = self._get_sources()[source_name]()
+
+        return self._prefetched[source_name]
+
+    def _get_sources(self) -> Dict[str, Callable[[], Any]]:
+        """
+        Returns the callables gathering data for the release notes by name.
+
+        :return: (dict) Release notes data source callables
+        :since:  1.0.0
+        """
+
+        return {
+            "changes_and_cves_list": lambda: (
+                self._release_images_metadata.changes_and_cves_list
+            ),
+            "current_packages_versions": lambda: GardenLinuxRepo(
+                self._version
+            ).get_packages_versions(),
+            "grouped_flavors_metadata": lambda: (
+                self._release_images_metadata.grouped_flavors_metadata
+            ),
+            "package_list": lambda: self._release_images_metadata.package_list,
+            "previous_packages_versions": lambda: GardenLinuxRepo(
+                DistroVersion(self._version).previous_patch_release
+            ).get_packages_versions(),
+        }
+
     def _generate_release_images_region_details(
         self, deployment_platform: DeploymentPlatform
     ) -> str:
@@ -4,16 +4,26 @@
 GitHub release container
 """
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 from os import PathLike
 from pathlib import Path
-from typing import Optional, Self
+from time import sleep
+from typing import Any, Dict, Optional, Self
 
-from github import GithubException
+from github import GithubException, RateLimitExceededException
 from github.GitRelease import GitRelease
 from github.GitReleaseAsset import GitReleaseAsset
+from github.Repository import Repository
 
+from ...constants import (
+    GITHUB_RATE_LIMIT_WAIT_SECONDS,
+    GITHUB_UPLOAD_MAX_ATTEMPTS,
+    GITHUB_UPLOAD_MAX_WORKERS,
+)
 from ...logger import LoggerSetup
+from ..adaptive_limiter import AdaptiveLimiter
 from ..client import Client
 
 
@@ -48,6 +58,9 @@ class Release(object):
         :since: 0.10.19
         """
 
+        self._assets: Optional[Dict[str, GitReleaseAsset]] = None
+        self._github_release: Optional[GitRelease] = None
+        self._github_repo: Optional[Repository] = None
         self._owner = owner
         self._repo = repo
         self._release_id: Optional[int] = None
@@ -91,6 +104,17 @@ class Release(object):
 
         self._release_body = value
 
+    @property
+    def cache_stats(self) -> Dict[str, Optional[int]]:
+        """
+        Returns the GitHub API response cache statistics of this release.
+
+        :return: (dict) Response cache statistics
+        :since:  1.0.0
+        """
+
+        return self._client.cache_stats
+
     @property
     def commitish(self) -> Optional[str]:
         """
@@ -237,6 +261,8 @@ class Release(object):
         self._name = release_object.name
 
         if isinstance(release_object, GitRelease):
+            self._assets = {asset.name: asset for asset in release_object.assets}
+            self._github_release = release_object
             self._release_id = release_object.id
             self._tag = release_object.tag_name
             self._commitish = release_object.target_commitish
@@ -256,7 +282,7 @@ class Release(object):
         :since:  0.10.19
         """
 
-        kwargs = {
+        kwargs: Dict[str, Any] = {
             "name": self.name,
             "message": self.body,
             "draft": False,
@@ -267,10 +293,10 @@ class Release(object):
         if self.commitish is not None:
             kwargs["target_commitish"] = self._commitish
 
-        release = self._client.get_repo(
-            f"{self._owner}/{self._repo}"
-        ).create_git_release(self.tag, **kwargs)
+        release = self._get_github_repo().create_git_release(self.tag, **kwargs)
 
+        self._assets = {}
+        self._github_release = release
         self._release_id = release.id
 
         return self._release_id
@@ -285,15 +311,16 @@ class Release(object):
         :since:  0.10.19
         """
 
-        github_release = self._client.get_repo(
-            f"{self._owner}/{self._repo}"
-        ).get_release(self.id)
+        assets = self._get_assets()
+
+        # Refresh the asset index once in case the asset was added elsewhere
+        if asset_name not in assets:
+            assets = self._get_assets(refresh=True)
 
-        for asset in github_release.assets:
-            if asset_name == asset.name:
-                return asset
+        if asset_name not in assets:
+            raise RuntimeError(f"No asset found with name: {asset_name}")
 
-        raise RuntimeError(f"No asset found with name: {asset_name}")
+        return assets[asset_name]
 
     def upload_asset(
         self, asset_file_path_name: PathLike[str] | str, overwrite: bool = False
@@ -302,6 +329,7 @@ class Release(object):
         Uploads an GitHub release asset.
 
         :param asset_file_path_name: File path and name to be uploaded
+        :param overwrite:            True to replace an asset with the same name
 
         :since: 0.10.19
         """
@@ -313,30 +341,185 @@ class Release(object):
             self._logger.info(f"{asset_file_path_name} is empty and will be ignored")
             return
 
-        github_release = self._client.get_repo(
-            f"{self._owner}/{self._repo}"
-        ).get_release(self.id)
-
+        github_release = self._get_github_release()
         asset_file_name = asset_file_path_name.name  # type: ignore[attr-defined]
 
+        if overwrite and asset_file_name in self._get_assets():
+            self.delete_asset_by_name(asset_file_name)
+
         try:
-            github_release.upload_asset(str(asset_file_path_name), name=asset_file_name)
+            asset = github_release.upload_asset(
+                str(asset_file_path_name), name=asset_file_name
+            )
         except GithubException as exc:
             is_asset_upload_retried = False
 
             if overwrite and exc.status == 422:
-                asset = self.get_asset_by_name(asset_file_name)
-
-                asset.delete_asset()
+                self.delete_asset_by_name(asset_file_name)
                 self.upload_asset(asset_file_path_name)
 
                 is_asset_upload_retried = True
 
             if not is_asset_upload_retried:
                 raise
+        else:
+            if self._assets is not None:
+                self._assets[asset_file_name] = asset
 
         self._logger.info(f"Uploaded file '{asset_file_name}'")
 
+    def upload_assets(
+        self,
+        asset_file_path_names: Iterable[PathLike[str] | str],
+        overwrite: bool = False,
+        max_workers: int = GITHUB_UPLOAD_MAX_WORKERS,
+    ) -> None:
+        """
+        Uploads GitHub release assets concurrently. The number of concurrent
+        uploads is reduced while GitHub reports secondary rate limits. All
+        files are attempted before failures are reported.
+
+        :param asset_file_path_names: File paths and names to be uploaded
+        :param overwrite:             True to replace assets with the same name
+        :param max_workers:           Maximum number of concurrent uploads
+
+        :since: 1.0.0
+        """
+
+        asset_file_paths = [Path(path) for path in asset_file_path_names]
+
+        # Resolve the release and its assets before uploading concurrently
+        self._get_github_release()
+        self._get_assets()
+
+        limiter = AdaptiveLimiter(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                path: executor.submit(
+                    self._upload_asset_rate_limited, path, overwrite, limiter
+                )
+                for path in asset_file_paths
+            }
+
+        failures = {}
+
+        for path, future in futures.items():
+            exc = future.exception()
+
+            if exc is not None:
+                self._logger.error(f"Failed to upload file '{path.name}': {exc}")
+                failures[path.name] = exc
+
+        self._logger.info(
+            f"Uploaded {len(futures) - len(failures)} of {len(futures)} files"
+        )
+
+        if len(failures) > 0:
+            raise RuntimeError(
+                f"Failed to upload {len(failures)} files: {', '.join(failures)}"
+            )
+
+    def _upload_asset_rate_limited(
+        self, asset_file_path_name: Path, overwrite: bool, limiter: AdaptiveLimiter
+    ) -> None:
+        """
+        Uploads an GitHub release asset and retries it after rate limits.
+
+        :param asset_file_path_name: File path and name to be uploaded
+        :param overwrite:            True to replace an asset with the same name
+        :param limiter:              Limiter shared by concurrent uploads
+
+        :since: 1.0.0
+        """
+
+        for attempt in range(1, GITHUB_UPLOAD_MAX_ATTEMPTS + 1):
+            try:
+                with limiter.acquire():
+                    self.upload_asset(asset_file_path_name, overwrite)
+            except RateLimitExceededException as exc:
+                if attempt == GITHUB_UPLOAD_MAX_ATTEMPTS:
+                    raise
+
+                retry_after = int(
+                    (exc.headers or {}).get(
+                        "retry-after", GITHUB_RATE_LIMIT_WAIT_SECONDS
+                    )
+                )
+
+                self._logger.warning(
+                    f"GitHub rate limit hit uploading '{asset_file_path_name.name}',"
+                    f" retrying in {retry_after}s with at most"
+                    f" {limiter.decrease()} concurrent uploads"
+                )
+
+                sleep(retry_after)
+            else:
+                limiter.increase()
+                return
+
+    def delete_asset_by_name(self, asset_name: str) -> None:
+        """
+        Deletes an GitHub release asset by the given name.
+
+        :param asset_name: Asset name
+
+        :since: 1.0.0
+        """
+
+        self.get_asset_by_name(asset_name).delete_asset()
+
+        if self._assets is not None:
+            self._assets.pop(asset_name, None)
+
+    def _get_assets(self, refresh: bool = False) -> Dict[str, GitReleaseAsset]:
+        """
+        Returns the GitHub release assets indexed by name. The index is
+        requested lazily and kept up to date with uploads and deletions.
+
+        :param refresh: True to request the assets again
+
+        :return: (dict) GitHub release assets by name
+        :since:  1.0.0
+        """
+
+        if self._assets is None or refresh:
+            self._assets = {
+                asset.name: asset
+                for asset in self._client.get_release_assets(self._get_github_release())
+            }
+
+        return self._assets
+
+    def _get_github_release(self) -> GitRelease:
+        """
+        Returns the cached GitHub release object.
+
+        :return: (object) GitHub release
+        :since:  1.0.0
+        """
+
+        if self._github_release is None or self._github_release.id != self.id:
+            self._assets = None
+            self._github_release = self._client.get_release(
+                self._get_github_repo(), self.id
+            )
+
+        return self._github_release
+
+    def _get_github_repo(self) -> Repository:
+        """
+        Returns the cached GitHub repository object.
+
+        :return: (object) GitHub repository
+        :since:  1.0.0
+        """
+
+        if self._github_repo is None:
+            self._github_repo = self._client.get_repo(f"{self._owner}/{self._repo}")
+
+        return self._github_repo
+
     @staticmethod
     def get(
         release_id: int,
@@ -352,11 +535,11 @@ class Release(object):
         :since:  0.10.19
         """
 
-        github_release = (
-            Client(token, logger).get_repo(f"{owner}/{repo}").get_release(release_id)
-        )
-
         release = Release(repo, owner, token, logger)
-        release._copy_from_release_object(github_release)
+
+        github_repo = release._get_github_repo()
+        release._copy_from_release_object(
+            release._client.get_release(github_repo, release_id)
+        )
 
         return release
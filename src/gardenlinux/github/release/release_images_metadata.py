@@ -5,19 +5,33 @@ GitHub release notes generator
 """
 
 import gzip
+import os
+import shutil
 from collections import OrderedDict
-from collections.abc import Mapping, MutableSequence
-from io import BytesIO
+from collections.abc import Iterator, Mapping, MutableSequence
+from contextlib import contextmanager
+from hashlib import sha256
 from logging import Logger
+from os import PathLike, environ
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Any, Dict, Optional
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import IO, Any, Dict, Optional
 
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ...apt import DebsrcFile
-from ...constants import GL_DEB_REPO_BASE_URL, GLVD_BASE_URL, REQUESTS_TIMEOUTS
+from ...constants import (
+    GL_DEB_REPO_BASE_URL,
+    GLVD_BASE_URL,
+    REQUESTS_BACKOFF_FACTOR,
+    REQUESTS_MAX_RETRIES,
+    REQUESTS_POOL_MAXSIZE,
+    REQUESTS_RETRY_STATUS_CODES,
+    REQUESTS_TIMEOUTS,
+)
 from ...features import CName
 from ...flavors import Parser
 from ...git import Repository
@@ -38,25 +52,59 @@ class ReleaseImagesMetadata(object):
                  Apache License, Version 2.0
     """
 
+    _session: Optional[requests.Session] = None
+    _session_lock = Lock()
+
     def __init__(
         self,
         version: str,
         commitish: str,
         s3_bucket_name: str,
         logger: Optional[Logger] = None,
+        deb_repo_base_url: Optional[str] = None,
+        glvd_base_url: Optional[str] = None,
+        cache_dir: Optional[PathLike[str] | str] = None,
     ):
         """
         Constructor __init__(Generator)
 
+        Mirror URLs and the cache directory default to the
+        `GL_DEB_REPO_BASE_URL`, `GLVD_BASE_URL` and `GL_RELEASE_NOTES_CACHE_DIR`
+        environment variables if set. Large Debian repository indexes are only
+        downloaded again if their Last-Modified value changed while a cache
+        directory is used.
+
         :param repo: GitHub repository containing releases
         :param owner: GitHub owner for release data
         :param token: GitHub access token
         :param logger: Logger instance
+        :param deb_repo_base_url: Debian repository mirror URL
+        :param glvd_base_url: GLVD API URL
+        :param cache_dir: Directory to cache Debian repository indexes in
 
         :since: 1.0.0
         """
 
+        if deb_repo_base_url is None:
+            deb_repo_base_url = environ.get(
+                "GL_DEB_REPO_BASE_URL", GL_DEB_REPO_BASE_URL
+            )
+
+        if glvd_base_url is None:
+            glvd_base_url = environ.get("GLVD_BASE_URL", GLVD_BASE_URL)
+
+        if cache_dir is None:
+            cache_dir = environ.get("GL_RELEASE_NOTES_CACHE_DIR")
+
+        self._cache_dir: Optional[Path] = None
+
+        if cache_dir is not None and str(cache_dir).strip() != "":
+            self._cache_dir = Path(cache_dir)
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
         self._commitish = commitish
+        self._deb_repo_base_url = deb_repo_base_url.rstrip("/")
+        self._glvd_base_url = glvd_base_url.rstrip("/")
         self._flavors_parser: Optional[Parser] = None
         self._glvd_data: Optional[OrderedDict[str, Any]] = None
         self._s3_bucket_name = s3_bucket_name
@@ -74,15 +122,19 @@ class ReleaseImagesMetadata(object):
 
         Note: This result is not perfect, feel free to edit the generated release notes and
         file issues in glvd for improvement suggestions https://github.com/gardenlinux/glvd/issues
+
+        Failed GLVD API requests are raised while invalid output is treated as
+        an empty list.
         """
 
         if self._glvd_data is None:
+            response = self._raw_request(
+                "GET", f"{self._glvd_base_url}/releaseNotes/{self._version}"
+            )
+
             try:
-                response = self._raw_request(
-                    "GET", f"{GLVD_BASE_URL}/releaseNotes/{self._version}"
-                )
                 data = response.json()
-            except Exception as exn:
+            except ValueError as exn:
                 self._logger.error(f"Failed to process GLVD API output: {exn}")
                 data = {}
 
@@ -110,27 +162,17 @@ class ReleaseImagesMetadata(object):
     @property
     def flavors_parser(self) -> Parser:
         if self._flavors_parser is None:
-            flavors_parser = None
+            flavors_file_data = Repository.read_files_from_url(
+                ["flavors.yaml"], commit=self._commitish, logger=self._logger
+            )["flavors.yaml"]
 
-            with TemporaryDirectory() as tmpdir:
-                repo = Repository.checkout_repo_sparse(
-                    tmpdir, ["flavors.yaml"], commit=self._commitish
-                )
-                flavors_file = Path(repo.root, "flavors.yaml")
-
-                if not flavors_file.exists():
-                    raise RuntimeError(f"Error: {flavors_file} does not exist.")
-
-                # Load and validate the flavors.yaml
-                with flavors_file.open("r") as fp:
-                    flavors_parser = Parser(fp.read())
-
-            if flavors_parser is None:
+            if flavors_file_data is None:
                 raise RuntimeError(
-                    f"Failed to find flavors for commitish: {self._commitish}"
+                    f"Error: flavors.yaml does not exist for commitish: {self._commitish}"
                 )
 
-            self._flavors_parser = flavors_parser
+            # Load and validate the flavors.yaml
+            self._flavors_parser = Parser(flavors_file_data.decode("utf-8"))
 
         return self._flavors_parser
 
@@ -146,83 +188,127 @@ class ReleaseImagesMetadata(object):
         )
 
         s3_artifacts = S3Artifacts(self._s3_bucket_name)
+        cnames = []
 
-        with TemporaryDirectory() as tmpdir:
-            for flavor in flavors:
-                self._logger.debug(
-                    f"{flavor=} version={self._version} commitish={self._commitish}"
-                )
+        for flavor in flavors:
+            self._logger.debug(
+                f"{flavor=} version={self._version} commitish={self._commitish}"
+            )
 
-                cname = CName(
+            cnames.append(
+                CName(
                     flavor[1],
                     arch=flavor[0],
                     commit_hash=self._commitish,
                     version=self._version,
-                )
+                ).cname
+            )
 
-                try:
-                    release_object = list(
-                        s3_artifacts.bucket.objects.filter(
-                            Prefix=f"meta/singles/{cname.cname}"
-                        )
-                    )[0]
-
-                    s3_artifacts.bucket.download_file(
-                        release_object.key,
-                        str(Path(tmpdir, f"{cname.cname}.s3_metadata.yaml")),
-                    )
-                except IndexError:
-                    self._logger.warning(
-                        f"No artifacts found for flavor {cname.cname}, skipping..."
-                    )
-                    continue
-
-                with Path(tmpdir, f"{cname.cname}.s3_metadata.yaml").open("r") as file:
-                    s3_data = ReleaseImagesMetadata.parse_s3_metadata(
-                        yaml.load(file, Loader=yaml.SafeLoader)
-                    )
-
-                # Skip if no publishing metadata found
-                if len(s3_data.get("published_image_metadata", [])) < 1:
-                    continue
-
-                if s3_data["variant_type"] not in grouped_data:
-                    grouped_data[s3_data["variant_type"]] = {}
-                if s3_data["platform"] not in grouped_data[s3_data["variant_type"]]:
-                    grouped_data[s3_data["variant_type"]][s3_data["platform"]] = {}
-                if (
-                    s3_data["architecture"]
-                    not in grouped_data[s3_data["variant_type"]][s3_data["platform"]]
-                ):
-                    grouped_data[s3_data["variant_type"]][s3_data["platform"]][
-                        s3_data["architecture"]
-                    ] = []
+        metadata = s3_artifacts.get_metadata_documents(cnames, self._version)
+
+        for cname in cnames:
+            document = metadata[cname]
 
+            if document is None:
+                self._logger.warning(
+                    f"No artifacts found for flavor {cname}, skipping..."
+                )
+                continue
+
+            s3_data = ReleaseImagesMetadata.parse_s3_metadata(document)
+
+            # Skip if no publishing metadata found
+            if len(s3_data.get("published_image_metadata", [])) < 1:
+                continue
+
+            if s3_data["variant_type"] not in grouped_data:
+                grouped_data[s3_data["variant_type"]] = {}
+            if s3_data["platform"] not in grouped_data[s3_data["variant_type"]]:
+                grouped_data[s3_data["variant_type"]][s3_data["platform"]] = {}
+            if (
+                s3_data["architecture"]
+                not in grouped_data[s3_data["variant_type"]][s3_data["platform"]]
+            ):
                 grouped_data[s3_data["variant_type"]][s3_data["platform"]][
                     s3_data["architecture"]
-                ].append(s3_data)
+                ] = []
+
+            grouped_data[s3_data["variant_type"]][s3_data["platform"]][
+                s3_data["architecture"]
+            ].append(s3_data)
 
         return grouped_data
 
     @property
     def package_list(self) -> DebsrcFile:
-        try:
-            response = self._raw_request(
-                "GET",
-                f"{GL_DEB_REPO_BASE_URL}/dists/{self._version}/main/binary-amd64/Packages.gz",
-            )
-        except Exception as exn:
-            self._logger.error(f"Failed to process Debian repository request: {exn}")
-            return DebsrcFile()
+        """
+        Returns the packages of the Debian repository for this version.
+        Failed Debian repository requests are raised.
+
+        :return: (object) Debian repository packages
+        :since:  1.0.0
+        """
 
         debsrc = DebsrcFile()
 
-        with BytesIO(response.content) as buffer:
-            with gzip.open(buffer, "rt") as file:
-                debsrc.read(file)
+        with self._open_cached_request(
+            f"{self._deb_repo_base_url}/dists/{self._version}/main/binary-amd64/Packages.gz"
+        ) as fp:
+            with gzip.GzipFile(fileobj=fp) as file:
+                debsrc.read_binary(file)
 
         return debsrc
 
+    @contextmanager
+    def _open_cached_request(self, url: str) -> Iterator[IO[bytes]]:
+        """
+        Returns the body of a GET request for the URL given as a stream. If a
+        cache directory is used the cached body is returned as long as the
+        server reports it as not modified since the last download.
+
+        :param url: Python requests URL
+
+        :return: (object) Response body stream
+        :since:  1.0.0
+        """
+
+        if self._cache_dir is None:
+            with self._raw_request("GET", url, stream=True) as response:
+                body: IO[bytes] = response.raw  # type: ignore[assignment]
+                response.raw.decode_content = True
+
+                yield body
+
+            return
+
+        cache_key = sha256(url.encode("utf-8")).hexdigest()
+        cache_file = self._cache_dir / cache_key
+        last_modified_file = self._cache_dir / f"{cache_key}.last-modified"
+
+        headers = {}
+
+        if cache_file.exists() and last_modified_file.exists():
+            headers["If-Modified-Since"] = last_modified_file.read_text().strip()
+
+        with self._raw_request("GET", url, headers=headers, stream=True) as response:
+            if response.status_code == 304:
+                self._logger.debug(f"Using cached response for {url}")
+            else:
+                body = response.raw  # type: ignore[assignment]
+                response.raw.decode_content = True
+
+                self._write_cache_file(cache_file, body)
+
+                last_modified = response.headers.get("Last-Modified")
+
+                if last_modified is None:
+                    last_modified_file.unlink(missing_ok=True)
+                else:
+                    last_modified_file.write_text(last_modified)
+
+        with cache_file.open("rb") as fp:
+            yield fp
+
     def _raw_request(
         self,
         method: str,
@@ -239,12 +325,70 @@ class ReleaseImagesMetadata(object):
         :since:  1.0.0
         """
 
-        method_callable = getattr(requests, method.lower())
+        response = ReleaseImagesMetadata.get_session().request(
+            method, url, timeout=REQUESTS_TIMEOUTS, **kwargs
+        )
 
-        response = method_callable(url, timeout=REQUESTS_TIMEOUTS, **kwargs)
         response.raise_for_status()
 
-        return response  # type: ignore[no-any-return]
+        return response
+
+    def _write_cache_file(self, cache_file: Path, stream: IO[bytes]) -> None:
+        """
+        Writes the stream given atomically to the cache file given.
+
+        :param cache_file: Cache file
+        :param stream:     Response body stream
+
+        :since: 1.0.0
+        """
+
+        with NamedTemporaryFile(
+            "wb", dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as fp:
+            tmp_file = Path(fp.name)
+
+            try:
+                shutil.copyfileobj(stream, fp)
+            except BaseException:
+                fp.close()
+                tmp_file.unlink(missing_ok=True)
+                raise
+
+        os.replace(tmp_file, cache_file)
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        """
+        Returns the process-wide requests session. It keeps connections to
+        GLVD and the Debian repository alive and retries failed requests with
+        an exponential backoff.
+
+        :return: (object) requests session
+        :since:  1.0.0
+        """
+
+        with ReleaseImagesMetadata._session_lock:
+            if ReleaseImagesMetadata._session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=REQUESTS_POOL_MAXSIZE,
+                    pool_maxsize=REQUESTS_POOL_MAXSIZE,
+                    max_retries=Retry(
+                        total=REQUESTS_MAX_RETRIES,
+                        backoff_factor=REQUESTS_BACKOFF_FACTOR,
+                        status_forcelist=REQUESTS_RETRY_STATUS_CODES,
+                        raise_on_status=False,
+                    ),
+                )
+
+                session = requests.Session()
+                session.headers["Accept-Encoding"] = "gzip"
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+
+                ReleaseImagesMetadata._session = session
+
+            return ReleaseImagesMetadata._session
 
     @staticmethod
     def get_variant_from_metadata(metadata: Dict[str, Any]) -> str:
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+"""
+GitHub API response cache
+"""
+
+import json
+import os
+from collections.abc import Callable
+from hashlib import sha256
+from logging import Logger
+from os import PathLike
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any, Dict, List, Optional, TypeVar
+
+from github import Github
+from github.GithubObject import CompletableGithubObject
+from requests.utils import parse_header_links
+
+from ..constants import GITHUB_RESPONSE_CACHE_PER_PAGE
+from ..logger import LoggerSetup
+
+TGithubObject = TypeVar("TGithubObject", bound=CompletableGithubObject)
+
+
+class ResponseCache(object):
+    """
+    On-disk cache of GitHub API resources and listings requested with
+    PyGithub. Cached resources and listing pages are revalidated with conditional requests based on their ETag
+    and Last-Modified values. GitHub answers unchanged resources with
+    "304 Not Modified" which does not count against the rate limit. Only the
+    JSON data of API resources is cached, release asset downloads never are.
+
+    :author:     Garden Linux Maintainers
+    :copyright:  Copyright 2024 SAP SE
+    :package:    gardenlinux
+    :subpackage: github
+    :since:      1.0.0
+    :license:    https://www.apache.org/licenses/LICENSE-2.0
+                 Apache License, Version 2.0
+    """
+
+    def __init__(self, cache_dir: PathLike[str] | str, logger: Optional[Logger] = None):
+        """
+        Constructor __init__(ResponseCache)
+
+        :param cache_dir: Directory to store cached responses in
+        :param logger:    Logger instance
+
+        :since: 1.0.0
+        """
+
+        if logger is None or not logger.hasHandlers():
+            logger = LoggerSetup.get_logger("gardenlinux.github")
+
+        self._cache_dir = Path(cache_dir)
+        self._hits = 0
+        self._lock = Lock()
+        self._logger = logger
+        self._misses = 0
+
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of resources served from the cache.
+
+        :return: (int) Cache hits
+        :since:  1.0.0
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of resources requested in full.
+
+        :return: (int) Cache misses
+        :since:  1.0.0
+        """
+
+        return self._misses
+
+    def get_object(
+        self,
+        github: Github,
+        klass: type[TGithubObject],
+        path: str,
+        fetch: Callable[[], TGithubObject],
+    ) -> TGithubObject:
+        """
+        Returns the GitHub object of the API path given. A cached object is
+        revalidated with a conditional request, otherwise it is fetched with
+        the callable given.
+
+        :param github: PyGithub instance
+        :param klass:  PyGithub class of the object
+        :param path:   GitHub API path of the object
+        :param fetch:  Callable requesting the object in full
+
+        :return: (object) PyGithub object
+        :since:  1.0.0
+        """
+
+        cache_file = self._cache_dir / f"{self._get_cache_key(github, path)}.json"
+        cached = self._read_cache_file(cache_file)
+
+        if cached is None:
+            github_object = fetch()
+        else:
+            github_object = github.create_from_raw_data(
+                klass, cached["raw_data"], cached["headers"]
+            )
+
+            # update() returns false for "304 Not Modified"
+            if not github_object.update():
+                with self._lock:
+                    self._hits += 1
+
+                self._logger.debug(f"GitHub API response cache hit: {path}")
+
+                return github_object
+
+        with self._lock:
+            self._misses += 1
+
+        self._write_cache_file(
+            cache_file, github_object.raw_data, github_object.raw_headers
+        )
+
+        return github_object
+
+    def get_list(
+        self, github: Github, klass: type[TGithubObject], path: str
+    ) -> List[TGithubObject]:
+        """
+        Returns all GitHub objects listed by the API path given. Each page of
+        the listing is cached and revalidated with a conditional request.
+
+        :param github: PyGithub instance
+        :param klass:  PyGithub class of the objects listed
+        :param path:   GitHub API path of the listing
+
+        :return: (list) PyGithub objects
+        :since:  1.0.0
+        """
+
+        github_objects = []
+        url: Optional[str] = f"{path}?per_page={GITHUB_RESPONSE_CACHE_PER_PAGE}"
+
+        while url is not None:
+            cache_file = self._cache_dir / f"{self._get_cache_key(github, url)}.json"
+            cached = self._read_cache_file(cache_file)
+            request_headers = {}
+
+            if cached is not None:
+                if "etag" in cached["headers"]:
+                    request_headers["If-None-Match"] = cached["headers"]["etag"]
+
+                if "last-modified" in cached["headers"]:
+                    request_headers["If-Modified-Since"] = cached["headers"][
+                        "last-modified"
+                    ]
+
+            status, headers, output = github.requester.requestJson(
+                "GET", url, headers=request_headers
+            )
+
+            if status == 304 and cached is not None:
+                with self._lock:
+                    self._hits += 1
+
+                self._logger.debug(f"GitHub API response cache hit: {url}")
+
+                headers = cached["headers"]
+                raw_data = cached["raw_data"]
+            else:
+                raw_data = json.loads(output) if len(output) > 0 else None
+
+                if status >= 400:
+                    raise github.requester.createException(
+                        status, headers, raw_data or {}
+                    )
+
+                with self._lock:
+                    self._misses += 1
+
+                self._write_cache_file(cache_file, raw_data, headers)
+
+            github_objects += [
+                github.create_from_raw_data(klass, item, headers) for item in raw_data
+            ]
+
+            url = None
+
+            for link in parse_header_links(headers.get("link", "")):
+                if link.get("rel") == "next":
+                    url = link["url"]
+
+        return github_objects
+
+    def _read_cache_file(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached object data if the cache file given is valid.
+
+        :param cache_file: Cache file
+
+        :return: (dict) Cached object data
+        :since:  1.0.0
+        """
+
+        try:
+            with cache_file.open("r") as fp:
+                cached: Dict[str, Any] = json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached.get("raw_data"), (dict, list)) or not isinstance(
+            cached.get("headers"), dict
+        ):
+            return None
+
+        return cached
+
+    def _write_cache_file(
+        self, cache_file: Path, raw_data: Any, headers: Dict[str, Any]
+    ) -> None:
+        """
+        Writes the raw data and response headers given atomically to the
+        cache file given.
+
+        :param cache_file: Cache file
+        :param raw_data:   GitHub API JSON data
+        :param headers:    GitHub API response headers
+
+        :since: 1.0.0
+        """
+
+        # Objects without validators can not be revalidated
+        if "etag" not in headers and "last-modified" not in headers:
+            return
+
+        tmp_file = None
+
+        try:
+            with NamedTemporaryFile(
+                "w", dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as fp:
+                tmp_file = Path(fp.name)
+
+                json.dump({"raw_data": raw_data, "headers": headers}, fp)
+
+            os.replace(tmp_file, cache_file)
+        except OSError as exc:
+            self._logger.warning(f"Failed to cache GitHub API response: {exc}")
+
+            if tmp_file is not None:
+                tmp_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _get_cache_key(github: Github, path: str) -> str:
+        """
+        Returns the cache key of the API path given. Responses depend on the
+        API URL and the credentials used.
+
+        :param github: PyGithub instance
+        :param path:   GitHub API path
+
+        :return: (str) Cache key
+        :since:  1.0.0
+        """
+
+        key = "\n".join(
+            [
+                github.requester.base_url,
+                path,
+                str(getattr(github.requester.auth, "token", "")),
+            ]
+        )
+
+        return sha256(key.encode("utf-8")).hexdigest()
@@ -9,6 +9,7 @@ from typing import List
 
 import click
 
+from ..constants import PODMAN_MAX_PARALLEL_OPERATIONS
 from .container import Container
 from .image_manifest import ImageManifest
 from .podman import Podman
@@ -109,7 +110,8 @@ def add_container_to_index(
 @click.option(
     "--platform",
     required=False,
-    help="OCI platform as os/arch/variant",
+    multiple=True,
+    help="OCI platform as os/arch/variant. Platforms given multiple times are built in parallel",
 )
 @click.option(
     "--additional_tag",
@@ -133,7 +135,7 @@ def build_container(
     container: str,
     tag: str,
     directory: str,
-    platform: str,
+    platform: List[str],
     additional_tag: List[str],
     build_arg: List[str],
     oci_archive: str,
@@ -144,14 +146,27 @@ def build_container(
     :since: 1.0.0
     """
 
+    if len(platform) > 1:
+        if oci_archive is None:
+            raise click.UsageError(
+                "Building multiple platforms requires an OCI archive path and file name"
+            )
+
+        _build_containers_for_platforms(
+            container, tag, directory, platform, additional_tag, build_arg, oci_archive
+        )
+
+        return
+
     podman = Podman()
+    platform_value = platform[0] if len(platform) > 0 else None
 
     with PodmanContext() as podman_context:
         if oci_archive is None:
             image_id = podman.build(
                 directory,
                 podman=podman_context,
-                platform=platform,
+                platform=platform_value,
                 oci_tag=f"{container}:{tag}",
                 build_args=Podman.parse_build_args_list(build_arg),
             )
@@ -160,7 +175,7 @@ def build_container(
                 directory,
                 oci_archive,
                 podman=podman_context,
-                platform=platform,
+                platform=platform_value,
                 oci_tag=f"{container}:{tag}",
                 build_args=Podman.parse_build_args_list(build_arg),
             )
@@ -175,6 +190,54 @@ def build_container(
     print(image_id)
 
 
+def _build_containers_for_platforms(
+    container: str,
+    tag: str,
+    directory: str,
+    platforms: List[str],
+    additional_tag: List[str],
+    build_arg: List[str],
+    oci_archive: str,
+) -> None:
+    """
+    Build OCI containers for multiple platforms in parallel and save them as
+    OCI archives.
+
+    :since: 1.0.0
+    """
+
+    podman = Podman()
+
+    with PodmanContext() as podman_context:
+        result = podman.build_and_save_oci_archives_for_platforms(
+            directory,
+            oci_archive,
+            platforms,
+            podman=podman_context,
+            oci_tag=f"{container}:{tag}",
+            build_args=Podman.parse_build_args_list(build_arg),
+        )
+
+        if additional_tag is not None:
+            for platform, build_result_data in result.items():
+                platform_suffix = Podman.get_platform_suffix(platform)
+
+                for image_id in build_result_data.values():
+                    podman.tag_list(
+                        image_id,
+                        Podman.get_container_tag_list(
+                            container,
+                            [
+                                f"{platform_tag}-{platform_suffix}"
+                                for platform_tag in additional_tag
+                            ],
+                        ),
+                        podman=podman_context,
+                    )
+
+    print(json.dumps(result))
+
+
 @cli.command()
 @click.option(
     "--oci_archive",
@@ -213,14 +276,31 @@ def load_container(oci_archive: str, additional_tag: List[str]) -> None:
     type=click.Path(),
     help="path to the build artifacts",
 )
-def load_containers_from_directory(directory: str) -> None:
+@click.option(
+    "--max_workers",
+    required=False,
+    default=PODMAN_MAX_PARALLEL_OPERATIONS,
+    type=int,
+    help="Maximum number of OCI archives loaded in parallel",
+)
+@click.option(
+    "--ignore_errors",
+    type=bool,
+    default=False,
+    help="Output successfully loaded OCI archives even if others failed",
+)
+def load_containers_from_directory(
+    directory: str, max_workers: int, ignore_errors: bool
+) -> None:
     """
     Load multiple OCI archives.
 
     :since: 1.0.0
     """
 
-    result = Podman().load_oci_archives_from_directory(directory)
+    result = Podman().load_oci_archives_from_directory(
+        directory, max_workers=max_workers, ignore_errors=ignore_errors
+    )
     print(json.dumps(result))
 
 
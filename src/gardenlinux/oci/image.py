@@ -4,12 +4,15 @@
 OCI podman image
 """
 
+import json
 import logging
+from codecs import getincrementaldecoder
+from collections.abc import Iterable, Iterator
 from os import PathLike
 from pathlib import Path
 from shutil import copyfile
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 from podman.domain.images import Image as _Image
@@ -19,6 +22,7 @@ from ..constants import (
     PODMAN_FS_CHANGE_DELETED,
     PODMAN_FS_CHANGE_MODIFIED,
     PODMAN_FS_CHANGE_UNSUPPORTED,
+    PODMAN_STREAM_CHUNK_SIZE,
 )
 from .podman_context import PodmanContext
 from .podman_object_context import PodmanObjectContext
@@ -137,11 +141,12 @@ class Image(PodmanObjectContext):
         self, podman: PodmanContext, parent_layer_image_id: Optional[str] = None
     ) -> Dict[str, List[str]]:
         """
-        Returns the underlying podman image object.
+        Returns the filesystem changes grouped by kind of change.
 
         :param podman: Podman context
+        :param parent_layer_image_id: Podman image ID to compare with
 
-        :return: (_Image) Podman image object
+        :return: (dict) Filesystem paths grouped by kind of change
         :since:  1.0.0
         """
 
@@ -152,23 +157,49 @@ class Image(PodmanObjectContext):
             PODMAN_FS_CHANGE_UNSUPPORTED: [],
         }
 
-        query = ""
+        for kind, path in self.iter_filesystem_changes(
+            podman, parent_layer_image_id=parent_layer_image_id
+        ):
+            changes[kind].append(path)
 
-        if parent_layer_image_id is not None:
-            query = urlencode({"parent": parent_layer_image_id})
+        return changes
+
+    def iter_filesystem_changes(
+        self, podman: PodmanContext, parent_layer_image_id: Optional[str] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Yields the filesystem changes as they are streamed from the podman API.
+        The podman context given must stay open while iterating.
+
+        :param podman: Podman context
+        :param parent_layer_image_id: Podman image ID to compare with
 
-        resp = self._raw_request(
-            "get", f"/images/{self._image_id}/changes?{query}", podman=podman
-        )
+        :return: (Iterator) Tuples of kind of change and filesystem path
+        :since:  1.0.0
+        """
 
-        resp.raise_for_status()
+        query = ""
 
-        for entry in resp.json():
-            changes[
-                PODMAN_CHANGES_KINDS.get(entry["Kind"], PODMAN_FS_CHANGE_UNSUPPORTED)
-            ].append(entry["Path"])
+        if parent_layer_image_id is not None:
+            query = urlencode({"parent": parent_layer_image_id})
 
-        return changes
+        with self._raw_request(
+            "get",
+            f"/images/{self._image_id}/changes?{query}",
+            podman=podman,
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+
+            for entry in Image._iter_json_array(
+                resp.iter_content(chunk_size=PODMAN_STREAM_CHUNK_SIZE)
+            ):
+                yield (
+                    PODMAN_CHANGES_KINDS.get(
+                        entry["Kind"], PODMAN_FS_CHANGE_UNSUPPORTED
+                    ),
+                    entry["Path"],
+                )
 
     @staticmethod
     @PodmanContext.wrap
@@ -199,3 +230,63 @@ class Image(PodmanObjectContext):
             image_id = image.id
 
         return image_id  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+        """
+        Incrementally decodes a JSON array of objects given as UTF-8 encoded
+        chunks and yields each item as soon as it is complete. A JSON `null`
+        is handled as an empty array.
+
+        :param chunks: UTF-8 encoded JSON data chunks
+
+        :return: (Iterator) Decoded JSON array items
+        :since:  1.0.0
+        """
+
+        decoder = json.JSONDecoder()
+        text_decoder = getincrementaldecoder("utf-8")()
+
+        buffer = ""
+        position = 0
+        is_array_started = False
+
+        for chunk in chunks:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+            position = 0
+
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+
+                if position >= len(buffer):
+                    break
+
+                if not is_array_started:
+                    if buffer[position] == "[":
+                        is_array_started = True
+                        position += 1
+                        continue
+
+                    if buffer.startswith("null", position):
+                        return
+
+                    if len(buffer) - position < 4 and "null".startswith(
+                        buffer[position:]
+                    ):
+                        break
+
+                    raise ValueError("Podman API response is not a JSON array")
+
+                if buffer[position] == "]":
+                    return
+
+                try:
+                    item, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # Incomplete item, wait for the next chunk
+                    break
+
+                yield item
+
+        raise ValueError("Podman API response ended unexpectedly")
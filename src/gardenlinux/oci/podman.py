@@ -6,11 +6,15 @@ OCI podman
 
 import json
 import logging
+import zlib
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
 from os import PathLike
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
+from ..constants import PODMAN_MAX_PARALLEL_OPERATIONS
 from ..logger import LoggerSetup
 from .image import Image
 from .podman_context import PodmanContext
@@ -116,6 +120,84 @@ class Podman(object):
 
         return {oci_archive_file_name.name: image_id}
 
+    @PodmanContext.wrap
+    def build_and_save_oci_archives_for_platforms(
+        self,
+        build_path: str,
+        oci_archive_file_name: str | PathLike[str],
+        platforms: List[str],
+        podman: PodmanContext,
+        build_args: Optional[Dict[str, str]] = None,
+        oci_tag: Optional[str] = None,
+        log_build_output: bool = False,
+        max_workers: int = PODMAN_MAX_PARALLEL_OPERATIONS,
+        ignore_errors: bool = False,
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Build a container for each platform given concurrently and save the
+        results as OCI archives. The platform is appended to the OCI archive
+        file name and OCI tag given. All platforms are attempted before
+        failures are reported.
+
+        :param build_path: Path containing the Containerfile
+        :param oci_archive_file_name: OCI archive path and file name template
+        :param platforms: OCI platforms as os/arch/variant
+        :param podman: Podman context
+        :param build_args: Additional build arguments
+        :param oci_tag: OCI tag template
+        :param log_build_output: True to log the build output
+        :param max_workers: Maximum number of builds running in parallel
+        :param ignore_errors: True to return successfully built platforms only
+
+        :return: (dict) Platforms mapped to OCI archive file names and podman image IDs
+        :since: 1.0.0
+        """
+
+        oci_archive_file_name = Path(oci_archive_file_name)
+        oci_archives = {}
+        failed_platforms = []
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {}
+
+            for platform in platforms:
+                platform_suffix = Podman.get_platform_suffix(platform)
+
+                platform_oci_tag = oci_tag
+
+                if oci_tag is not None:
+                    platform_oci_tag = f"{oci_tag}-{platform_suffix}"
+
+                futures[platform] = executor.submit(
+                    self.build_and_save_oci_archive,
+                    build_path,
+                    oci_archive_file_name.with_stem(
+                        f"{oci_archive_file_name.stem}-{platform_suffix}"
+                    ),
+                    podman=podman,
+                    platform=platform,
+                    build_args=build_args,
+                    oci_tag=platform_oci_tag,
+                    log_build_output=log_build_output,
+                )
+
+            for platform, future in futures.items():
+                try:
+                    oci_archives[platform] = future.result()
+                except Exception as exc:
+                    self._logger.error(
+                        f"Failed to build OCI archive for platform {platform}: {exc}"
+                    )
+
+                    failed_platforms.append(platform)
+
+        if len(failed_platforms) > 0 and not ignore_errors:
+            raise RuntimeError(
+                f"Failed to build OCI archives for platforms: {', '.join(failed_platforms)}"
+            )
+
+        return oci_archives
+
     @PodmanContext.wrap
     def get_image(
         self,
@@ -172,23 +254,59 @@ class Podman(object):
 
     @PodmanContext.wrap
     def load_oci_archives_from_directory(
-        self, oci_dir: str | PathLike[str], /, podman: PodmanContext
+        self,
+        oci_dir: str | PathLike[str],
+        /,
+        podman: PodmanContext,
+        max_workers: int = PODMAN_MAX_PARALLEL_OPERATIONS,
+        ignore_errors: bool = False,
     ) -> Dict[str, str]:
         """
-        Load OCI archives from the given directory.
+        Load OCI archives from the given directory concurrently.
+
+        :param oci_dir: Directory containing OCI archives
+        :param podman: Podman context
+        :param max_workers: Maximum number of archives loaded in parallel
+        :param ignore_errors: True to return successfully loaded archives only
 
+        :return: (dict) OCI archive file names mapped to podman image IDs
         :since: 1.0.0
         """
 
-        oci_archives = {}
         oci_dir = Path(oci_dir)
 
-        for oci_archive in oci_dir.iterdir():
-            if not oci_archive.match("*.oci"):
-                continue
+        oci_archive_files = sorted(
+            oci_archive
+            for oci_archive in oci_dir.iterdir()
+            if oci_archive.match("*.oci")
+        )
 
-            image = next(podman.images.load(file_path=oci_archive))
-            oci_archives[oci_archive.name] = image.id
+        oci_archives = {}
+        failed_oci_archives = []
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                (
+                    oci_archive,
+                    executor.submit(self.load_oci_archive, oci_archive, podman=podman),
+                )
+                for oci_archive in oci_archive_files
+            ]
+
+            for oci_archive, future in futures:
+                try:
+                    oci_archives[oci_archive.name] = future.result()
+                except Exception as exc:
+                    self._logger.error(
+                        f"Failed to load OCI archive {oci_archive.name}: {exc}"
+                    )
+
+                    failed_oci_archives.append(oci_archive.name)
+
+        if len(failed_oci_archives) > 0 and not ignore_errors:
+            raise RuntimeError(
+                f"Failed to load OCI archives: {', '.join(failed_oci_archives)}"
+            )
 
         return oci_archives
 
@@ -254,11 +372,19 @@ class Podman(object):
         oci_archive_file_name: str | PathLike[str],
         podman: PodmanContext,
         oci_tag: Optional[str] = None,
-    ) -> None:
+        compression: Optional[str] = None,
+    ) -> Tuple[str, int]:
         """
         Save the given Podman image ID as an OCI archive with the given path and
         file name.
 
+        :param image_id: Podman image ID
+        :param oci_archive_file_name: OCI archive path and file name
+        :param podman: Podman context
+        :param oci_tag: OCI tag to save the image with
+        :param compression: Compression used while streaming (e.g. "gzip")
+
+        :return: (tuple) OCI archive digest and size in bytes
         :since: 1.0.0
         """
 
@@ -267,19 +393,83 @@ class Podman(object):
         if oci_archive_file_name.exists():
             raise RuntimeError("OCI archive file does already exist")
 
+        # Fail early for unknown images before creating the OCI archive file
+        image = podman.images.get(image_id)
+
+        fp = oci_archive_file_name.open("xb")
+
+        try:
+            with fp:
+                return self.save_oci_archive_to_fileobj(  # type: ignore[no-any-return]
+                    image.id,
+                    fp,
+                    podman=podman,
+                    oci_tag=oci_tag,
+                    compression=compression,
+                )
+        except BaseException:
+            # Remove the partially written OCI archive
+            oci_archive_file_name.unlink(missing_ok=True)
+            raise
+
+    @PodmanContext.wrap
+    def save_oci_archive_to_fileobj(
+        self,
+        image_id: str,
+        fp: BinaryIO,
+        podman: PodmanContext,
+        oci_tag: Optional[str] = None,
+        compression: Optional[str] = None,
+    ) -> Tuple[str, int]:
+        """
+        Stream the given Podman image ID as an OCI archive into the given binary
+        file-like object. The archive digest and size are calculated on the fly.
+
+        :param image_id: Podman image ID
+        :param fp: Binary file-like object to write to
+        :param podman: Podman context
+        :param oci_tag: OCI tag to save the image with
+        :param compression: Compression used while streaming (e.g. "gzip")
+
+        :return: (tuple) OCI archive digest and size in bytes
+        :since: 1.0.0
+        """
+
+        if compression is None:
+            compressor = None
+        elif compression == "gzip":
+            compressor = zlib.compressobj(wbits=31)
+        else:
+            raise RuntimeError(f"Unsupported OCI archive compression: {compression}")
+
         image = podman.images.get(image_id)
+        named: bool | str = True
 
-        with oci_archive_file_name.open("wb") as fp:
-            named: bool | str = True
+        if oci_tag is not None:
+            if oci_tag not in image.tags:
+                self.tag(image.id, oci_tag, podman=podman)
+
+            named = oci_tag
+
+        digest = sha256()
+        size = 0
+
+        for chunk in image.save(named=named):
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
 
-            if oci_tag is not None:
-                if oci_tag not in image.tags:
-                    self.tag(image.id, oci_tag, podman=podman)
+            digest.update(chunk)
+            fp.write(chunk)
+            size += len(chunk)
 
-                named = oci_tag
+        if compressor is not None:
+            chunk = compressor.flush()
 
-            for chunk in image.save(named=named):
-                fp.write(chunk)
+            digest.update(chunk)
+            fp.write(chunk)
+            size += len(chunk)
+
+        return f"sha256:{digest.hexdigest()}", size
 
     @PodmanContext.wrap
     def tag(
@@ -340,6 +530,22 @@ class Podman(object):
 
         return container_tag_list
 
+    @staticmethod
+    def get_platform_suffix(platform: str) -> str:
+        """
+        Returns a name suffix for the given OCI platform (e.g. "arm64-v8" for
+        "linux/arm64/v8").
+
+        :since: 1.0.0
+        """
+
+        platform_data = platform.split("/", 1)
+
+        if len(platform_data) < 2 or platform_data[1] == "":
+            raise RuntimeError(f"Failed to parse OCI platform: {platform}")
+
+        return platform_data[1].replace("/", "-")
+
     @staticmethod
     def parse_build_args_list(args_list: List[str]) -> Dict[str, str]:
         """
@@ -5,6 +5,8 @@ S3 module
 """
 
 from .bucket import Bucket
+from .listing_index import ListingIndex
 from .s3_artifacts import S3Artifacts
+from .session_cache import SessionCache
 
-__all__ = ["Bucket", "S3Artifacts"]
+__all__ = ["Bucket", "ListingIndex", "S3Artifacts", "SessionCache"]
@@ -7,6 +7,7 @@ gl-s3 main entrypoint
 
 import argparse
 
+from ..constants import S3_MAX_CONCURRENCY, S3_MULTIPART_CHUNKSIZE
 from .s3_artifacts import S3Artifacts
 
 
@@ -49,12 +50,58 @@ def get_parser() -> argparse.ArgumentParser:
         help="Canonical name (cname) used as the S3 key prefix for artifacts.",
     )
 
+    download_parser.add_argument(
+        "--suffix",
+        action="append",
+        dest="suffixes",
+        help="Artifact file name suffix to download only. Can be given multiple times.",
+    )
+
     upload_parser = subparsers.add_parser("upload-artifacts-to-bucket")
 
     upload_parser.add_argument(
         "--artifact-name", dest="artifact_name", help="S3 artifact base name."
     )
 
+    upload_parser.add_argument(
+        "--multipart-chunksize",
+        type=int,
+        default=S3_MULTIPART_CHUNKSIZE,
+        dest="multipart_chunksize",
+        help="Part size in bytes used for multipart uploads.",
+    )
+
+    upload_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=S3_MAX_CONCURRENCY,
+        dest="max_concurrency",
+        help="Maximum number of concurrent S3 requests for all uploads.",
+    )
+
+    upload_parser.add_argument(
+        "--max-bandwidth",
+        type=int,
+        required=False,
+        dest="max_bandwidth",
+        help="Maximum bandwidth in bytes per second for all uploads.",
+    )
+
+    upload_parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Upload only artifacts and metadata missing or changed in the bucket.",
+    )
+
+    index_parser = subparsers.add_parser("upload-metadata-index")
+
+    index_parser.add_argument(
+        "--version",
+        required=True,
+        dest="version",
+        help="GardenLinux version to aggregate all metadata in the bucket for.",
+    )
+
     return parser
 
 
@@ -69,8 +116,22 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.action == "download-artifacts-from-bucket":
-        S3Artifacts(args.bucket).download_to_directory(args.cname, args.path)
+        S3Artifacts(args.bucket).download_to_directory(
+            args.cname, args.path, suffixes=args.suffixes
+        )
     elif args.action == "upload-artifacts-to-bucket":
+        transfer_config = S3Artifacts.get_transfer_config(
+            args.multipart_chunksize, args.max_concurrency, args.max_bandwidth
+        )
+
         S3Artifacts(args.bucket).upload_from_directory(
-            args.artifact_name, args.path, dry_run=args.dry_run
+            args.artifact_name,
+            args.path,
+            dry_run=args.dry_run,
+            transfer_config=transfer_config,
+            sync=args.sync,
+        )
+    elif args.action == "upload-metadata-index":
+        S3Artifacts(args.bucket).upload_metadata_index(
+            args.version, dry_run=args.dry_run
         )
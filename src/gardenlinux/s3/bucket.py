@@ -6,18 +6,22 @@ S3 bucket
 
 import json
 import logging
+from collections.abc import Iterable
 from os import PathLike
-from pathlib import Path
 from time import time
-from typing import TYPE_CHECKING, Any, BinaryIO, List, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple
 
-import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 
 if TYPE_CHECKING:
     # Only import when type checking is enabled i.e. in a dev environment or CI.
     from mypy_boto3_s3.service_resource import BucketObjectsCollection
 
+from ..constants import S3_DELETE_OBJECTS_MAX_KEYS, S3_MAX_POOL_CONNECTIONS
 from ..logger import LoggerSetup
+from .listing_index import ListingIndex
+from .session_cache import SessionCache
+from .transfer_subscriber import TransferSubscriber
 
 
 class Bucket(object):
@@ -39,6 +43,7 @@ class Bucket(object):
         endpoint_url: Optional[str] = None,
         s3_resource_config: Optional[dict[str, Any]] = None,
         logger: Optional[logging.Logger] = None,
+        max_pool_connections: int = S3_MAX_POOL_CONNECTIONS,
     ):
         """
         Constructor __init__(Bucket)
@@ -47,6 +52,7 @@ class Bucket(object):
         :param endpoint_url: S3 endpoint URL
         :param s3_resource_config: Additional boto3 S3 config values
         :param logger: Logger instance
+        :param max_pool_connections: Maximum number of pooled S3 connections
 
         :since: 0.8.0
         """
@@ -58,9 +64,11 @@ class Bucket(object):
             s3_resource_config = {}
 
         if endpoint_url is not None:
-            s3_resource_config["endpoint_url"] = endpoint_url
+            s3_resource_config = {**s3_resource_config, "endpoint_url": endpoint_url}
 
-        self._s3_resource: Any = boto3.resource("s3", **s3_resource_config)
+        self._s3_resource: Any = SessionCache.get_resource(
+            s3_resource_config, max_pool_connections
+        )
 
         self._bucket = self._s3_resource.Bucket(bucket_name)
         self._logger = logger
@@ -92,6 +100,37 @@ class Bucket(object):
 
         return getattr(self._bucket, name)
 
+    def delete_keys(self, keys: Iterable[str]) -> None:
+        """
+        Delete S3 objects in batches of up to 1000 keys per request.
+
+        :param keys: S3 object keys to delete
+
+        :since: 1.0.0
+        """
+
+        keys = list(keys)
+        failed_keys = []
+
+        for offset in range(0, len(keys), S3_DELETE_OBJECTS_MAX_KEYS):
+            batch = keys[offset : offset + S3_DELETE_OBJECTS_MAX_KEYS]
+
+            response = self._bucket.delete_objects(
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+
+            for error in response.get("Errors", []):
+                self._logger.error(
+                    f"Failed to delete {error['Key']} from S3: {error.get('Message')}"
+                )
+
+                failed_keys.append(error["Key"])
+
+            self._logger.info(f"Deleted {len(batch)} objects from S3")
+
+        if len(failed_keys) > 0:
+            raise RuntimeError(f"Failed to delete from S3: {', '.join(failed_keys)}")
+
     def download_file(
         self, key: str, file_name: str, *args: Any, **kwargs: Any
     ) -> None:
@@ -108,6 +147,64 @@ class Bucket(object):
 
         self._logger.info(f"Downloaded {key} from S3 to {file_name}")
 
+    def download_files(
+        self,
+        downloads: Iterable[Tuple[str, Any]],
+        transfer_config: Optional[TransferConfig] = None,
+    ) -> Dict[str, float]:
+        """
+        Download multiple objects concurrently sharing one transfer manager.
+        Objects larger than the multipart threshold are downloaded with
+        concurrent ranged requests.
+
+        :param downloads:       Tuples of key and file name or writable file-like object
+        :param transfer_config: boto3 transfer configuration
+
+        :return: (dict) Download throughput in bytes per second for each key
+        :since: 1.0.0
+        """
+
+        if transfer_config is None:
+            transfer_config = TransferConfig()
+
+        transfers = []
+        failed_keys = []
+        throughput = {}
+
+        with create_transfer_manager(
+            self._bucket.meta.client, transfer_config
+        ) as transfer_manager:
+            for key, file_name in downloads:
+                subscriber = TransferSubscriber()
+
+                future = transfer_manager.download(
+                    self._bucket.name, key, file_name, subscribers=[subscriber]
+                )
+
+                transfers.append((key, file_name, future, subscriber))
+
+            for key, file_name, future, subscriber in transfers:
+                try:
+                    future.result()
+                except Exception as exc:
+                    self._logger.error(f"Failed to download {key} from S3: {exc}")
+                    failed_keys.append(key)
+
+                    continue
+
+                throughput[key] = subscriber.throughput
+
+                self._logger.info(
+                    f"Downloaded {key} from S3 to {getattr(file_name, 'name', file_name)} "
+                    f"({subscriber.bytes_transferred} bytes in {subscriber.duration:.2f}s, "
+                    f"{subscriber.throughput / 1048576:.2f} MiB/s)"
+                )
+
+        if len(failed_keys) > 0:
+            raise RuntimeError(f"Failed to download from S3: {', '.join(failed_keys)}")
+
+        return throughput
+
     def download_fileobj(
         self, key: str, fp: BinaryIO, *args: Any, **kwargs: Any
     ) -> None:
@@ -128,40 +225,137 @@ class Bucket(object):
         self,
         cache_file: Optional[PathLike[str] | str],
         cache_ttl: int = 3600,
+        full_refresh_ttl: int = 86400,
         **kwargs: Any,
     ) -> List[Any]:
         """
-        Read S3 object keys from cache if valid or filter for S3 object keys.
-
-        :param cache_file: Path to cache file
-        :param cache_ttl:  Cache time-to-live in seconds
+        Read S3 object keys from the listing index if valid or filter for S3
+        object keys. Expired listings are refreshed incrementally starting
+        after the last key seen. Incremental listings only find keys sorting
+        after the last key seen. Keys sorting before it as well as deleted
+        objects are detected by a full listing done after the full refresh
+        time-to-live expired. Listings filtered by more than a prefix are
+        cached per filter and listed in full after the cache time-to-live
+        expired.
+
+        :param cache_file:       Path to the listing index file
+        :param cache_ttl:        Cache time-to-live in seconds
+        :param full_refresh_ttl: Time-to-live of a full listing in seconds
 
         :returns: S3 object keys read or filtered
 
         :since: 0.9.0
         """
 
-        if cache_file is not None:
-            cache_path = Path(cache_file)
+        if cache_file is None:
+            return [
+                s3_object.key
+                for s3_object in self._bucket.objects.filter(**kwargs).all()
+            ]
+
+        listing_index = ListingIndex(cache_file)
+        refreshed = time()
+
+        # Only prefix filters can be answered from the indexed objects
+        if len(set(kwargs.keys()) - {"Prefix"}) > 0:
+            return self._read_filtered_listing(
+                listing_index, cache_ttl, refreshed, **kwargs
+            )
+
+        prefix = kwargs.get("Prefix", "")
+        listing = listing_index.get_listing(prefix)
+
+        if (
+            listing is None
+            or (refreshed - listing["full_refreshed"]) >= full_refresh_ttl
+        ):
+            self._refresh_listing_index(listing_index, prefix, refreshed)
+        elif (refreshed - listing["refreshed"]) >= cache_ttl:
+            self._refresh_listing_index(
+                listing_index, prefix, refreshed, listing["last_key"]
+            )
+
+        return listing_index.get_keys(prefix)
+
+    def _read_filtered_listing(
+        self,
+        listing_index: ListingIndex,
+        cache_ttl: int,
+        refreshed: float,
+        **kwargs: Any,
+    ) -> List[str]:
+        """
+        Read S3 object keys of the filter given from the listing index if
+        valid or list them in full.
+
+        :param listing_index: Listing index to use
+        :param cache_ttl:     Cache time-to-live in seconds
+        :param refreshed:     Timestamp of the listing
+
+        :returns: S3 object keys read or filtered
+
+        :since: 1.0.0
+        """
+
+        filter_key = json.dumps(kwargs, default=str, sort_keys=True)
+        listing = listing_index.get_filtered_listing(filter_key)
+
+        if listing is not None and (refreshed - listing["refreshed"]) < cache_ttl:
+            return listing["keys"]  # type: ignore[no-any-return]
 
-            if (
-                cache_path.exists()
-                and (time() - cache_path.stat().st_mtime) < cache_ttl
-            ):
-                with cache_path.open("r") as fp:
-                    return json.loads(fp.read())  # type: ignore[no-any-return]
-        else:
-            cache_path = None
+        self._logger.debug(
+            f"Listing S3 objects in full for filter {filter_key} as it can not"
+            " be refreshed incrementally"
+        )
 
-        artifacts = [
+        keys = [
             s3_object.key for s3_object in self._bucket.objects.filter(**kwargs).all()
         ]
 
-        if cache_path is not None:
-            with cache_path.open("w") as fp:
-                fp.write(json.dumps(artifacts))
+        listing_index.update_filtered_listing(filter_key, keys, refreshed)
+
+        return keys
+
+    def _refresh_listing_index(
+        self,
+        listing_index: ListingIndex,
+        prefix: str,
+        refreshed: float,
+        start_after: Optional[str] = None,
+    ) -> None:
+        """
+        Lists S3 objects with the prefix given and adds them to the index.
+
+        :param listing_index: Listing index to update
+        :param prefix:        S3 key prefix
+        :param refreshed:     Timestamp of the listing
+        :param start_after:   Key to start listing after for incremental updates
+
+        :since: 1.0.0
+        """
+
+        filter_kwargs: Dict[str, Any] = {"Prefix": prefix}
+
+        # Bucket.objects uses ListObjects where "Marker" equals "StartAfter"
+        if start_after is not None:
+            filter_kwargs["Marker"] = start_after
+
+        s3_objects = [
+            {
+                "key": s3_object.key,
+                "etag": s3_object.e_tag.strip('"'),
+                "size": s3_object.size,
+                "last_modified": s3_object.last_modified.isoformat(),
+            }
+            for s3_object in self._bucket.objects.filter(**filter_kwargs)
+        ]
+
+        listing_index.update(prefix, s3_objects, refreshed, full=(start_after is None))
 
-        return artifacts
+        self._logger.debug(
+            f"Indexed {len(s3_objects)} S3 objects for prefix '{prefix}'"
+            + ("" if start_after is None else f" after {start_after}")
+        )
 
     def upload_file(self, file_name: str, key: str, *args: Any, **kwargs: Any) -> None:
         """
@@ -177,6 +371,68 @@ class Bucket(object):
 
         self._logger.info(f"Uploaded {key} to S3 for {file_name}")
 
+    def upload_files(
+        self,
+        uploads: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]],
+        transfer_config: Optional[TransferConfig] = None,
+    ) -> Dict[str, float]:
+        """
+        Upload multiple files concurrently sharing one transfer manager. The
+        connection and bandwidth limits of the transfer configuration given
+        apply to all uploads together.
+
+        :param uploads:         Tuples of file name, key and extra arguments
+        :param transfer_config: boto3 transfer configuration
+
+        :return: (dict) Upload throughput in bytes per second for each key
+        :since: 1.0.0
+        """
+
+        if transfer_config is None:
+            transfer_config = TransferConfig()
+
+        transfers = []
+        failed_keys = []
+        throughput = {}
+
+        with create_transfer_manager(
+            self._bucket.meta.client, transfer_config
+        ) as transfer_manager:
+            for file_name, key, extra_args in uploads:
+                subscriber = TransferSubscriber()
+
+                future = transfer_manager.upload(
+                    file_name,
+                    self._bucket.name,
+                    key,
+                    extra_args=extra_args,
+                    subscribers=[subscriber],
+                )
+
+                transfers.append((file_name, key, future, subscriber))
+
+            for file_name, key, future, subscriber in transfers:
+                try:
+                    future.result()
+                except Exception as exc:
+                    self._logger.error(f"Failed to upload {key} to S3: {exc}")
+                    failed_keys.append(key)
+
+                    continue
+
+                throughput[key] = subscriber.throughput
+
+                self._logger.info(
+                    f"Uploaded {key} to S3 for {file_name} "
+                    f"({subscriber.bytes_transferred} bytes in {subscriber.duration:.2f}s, "
+                    f"{subscriber.throughput / 1048576:.2f} MiB/s)"
+                )
+
+        if len(failed_keys) > 0:
+            raise RuntimeError(f"Failed to upload to S3: {', '.join(failed_keys)}")
+
+        return throughput
+
     def upload_fileobj(self, fp: BinaryIO, key: str, *args: Any, **kwargs: Any) -> None:
         """
         boto3: Upload a file-like object to this bucket.
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+S3 download digest writer
+"""
+
+import hashlib
+from typing import BinaryIO
+
+
+class DigestWriter(object):
+    """
+    Non-seekable file-like object calculating the digest of all data written
+    to the underlying file. s3transfer writes concurrent ranged downloads to
+    non-seekable targets strictly in order, so the digest is calculated while
+    the download is streamed.
+
+    :author:     Garden Linux Maintainers
+    :copyright:  Copyright 2024 SAP SE
+    :package:    gardenlinux
+    :subpackage: s3
+    :since:      1.0.0
+    :license:    https://www.apache.org/licenses/LICENSE-2.0
+                 Apache License, Version 2.0
+    """
+
+    def __init__(self, fp: BinaryIO, algorithm: str):
+        """
+        Constructor __init__(DigestWriter)
+
+        :param fp:        Binary file to write to
+        :param algorithm: hashlib algorithm name
+
+        :since: 1.0.0
+        """
+
+        self._digest = hashlib.new(algorithm, usedforsecurity=False)
+        self._fp = fp
+
+    @property
+    def hexdigest(self) -> str:
+        """
+        Returns the hex digest of all data written.
+
+        :return: (str) Hex digest
+        :since:  1.0.0
+        """
+
+        return self._digest.hexdigest()
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the underlying file.
+
+        :return: (str) File name
+        :since:  1.0.0
+        """
+
+        return str(self._fp.name)
+
+    def seekable(self) -> bool:
+        """
+        python.org: Return True if the stream supports random access.
+
+        :return: (bool) Always false to enforce sequential writes
+        :since:  1.0.0
+        """
+
+        return False
+
+    def write(self, data: bytes) -> int:
+        """
+        python.org: Write the given bytes to the underlying raw stream.
+
+        :param data: Data to write
+
+        :return: (int) Number of bytes written
+        :since:  1.0.0
+        """
+
+        self._digest.update(data)
+
+        return self._fp.write(data)
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+"""
+S3 listing index
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ListingIndex(object):
+    """
+    Local SQLite index of S3 object keys with their ETag, size and last
+    modification time. Listings are tracked per prefix so they can be
+    refreshed incrementally. Listings using other filters are stored as
+    plain key lists per filter. All writes are transactions, so concurrent
+    processes can share one index file.
+
+    :author:     Garden Linux Maintainers
+    :copyright:  Copyright 2024 SAP SE
+    :package:    gardenlinux
+    :subpackage: s3
+    :since:      1.0.0
+    :license:    https://www.apache.org/licenses/LICENSE-2.0
+                 Apache License, Version 2.0
+    """
+
+    def __init__(self, index_file: PathLike[str] | str, timeout: float = 30.0):
+        """
+        Constructor __init__(ListingIndex)
+
+        :param index_file: Path to the SQLite index file
+        :param timeout:    Seconds to wait for locks held by other processes
+
+        :since: 1.0.0
+        """
+
+        self._index_file = Path(index_file)
+        self._timeout = timeout
+
+    def get_keys(self, prefix: str = "") -> List[str]:
+        """
+        Returns all indexed keys starting with the prefix given.
+
+        :param prefix: S3 key prefix
+
+        :return: (list) Sorted S3 object keys
+        :since: 1.0.0
+        """
+
+        return [s3_object["key"] for s3_object in self.get_objects(prefix)]
+
+    def get_listing(self, prefix: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Returns the state of the last listing for the prefix given.
+
+        :param prefix: S3 key prefix
+
+        :return: (dict) Last key seen, last refresh and last full refresh time
+        :since: 1.0.0
+        """
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT last_key, refreshed, full_refreshed FROM listings"
+                " WHERE prefix = ?",
+                (prefix,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {"last_key": row[0], "refreshed": row[1], "full_refreshed": row[2]}
+
+    def get_filtered_listing(self, filter_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the keys and refresh time of the last listing for the filter
+        given.
+
+        :param filter_key: Serialized filter arguments of the listing
+
+        :return: (dict) Keys listed and last refresh time
+        :since: 1.0.0
+        """
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT keys, refreshed FROM filtered_listings WHERE filter = ?",
+                (filter_key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {"keys": json.loads(row[0]), "refreshed": row[1]}
+
+    def get_objects(self, prefix: str = "") -> List[Dict[str, Any]]:
+        """
+        Returns all indexed objects starting with the prefix given.
+
+        :param prefix: S3 key prefix
+
+        :return: (list) Sorted S3 objects with key, etag, size and last_modified
+        :since: 1.0.0
+        """
+
+        where, parameters = ListingIndex._get_prefix_condition(prefix)
+
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT key, etag, size, last_modified FROM objects {where}"
+                " ORDER BY key",
+                parameters,
+            ).fetchall()
+
+        return [
+            {"key": row[0], "etag": row[1], "size": row[2], "last_modified": row[3]}
+            for row in rows
+        ]
+
+    def update(
+        self,
+        prefix: str,
+        s3_objects: Iterable[Dict[str, Any]],
+        refreshed: float,
+        full: bool = False,
+    ) -> None:
+        """
+        Adds listed objects to the index in one transaction. A full update
+        replaces all objects indexed for the prefix given.
+
+        :param prefix:     S3 key prefix listed
+        :param s3_objects: S3 objects with key, etag, size and last_modified
+        :param refreshed:  Timestamp of the listing
+        :param full:       True if the listing contains all objects of the prefix
+
+        :since: 1.0.0
+        """
+
+        rows = [
+            (
+                s3_object["key"],
+                s3_object["etag"],
+                s3_object["size"],
+                s3_object["last_modified"],
+            )
+            for s3_object in s3_objects
+        ]
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                listing = connection.execute(
+                    "SELECT last_key, full_refreshed FROM listings WHERE prefix = ?",
+                    (prefix,),
+                ).fetchone()
+
+                last_key = None
+                full_refreshed = refreshed
+
+                if full:
+                    where, parameters = ListingIndex._get_prefix_condition(prefix)
+                    connection.execute(f"DELETE FROM objects {where}", parameters)
+                elif listing is not None:
+                    last_key, full_refreshed = listing
+
+                connection.executemany(
+                    "INSERT OR REPLACE INTO objects (key, etag, size, last_modified)"
+                    " VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+                keys = [row[0] for row in rows]
+
+                if last_key is not None:
+                    keys.append(last_key)
+
+                connection.execute(
+                    "INSERT OR REPLACE INTO listings"
+                    " (prefix, last_key, refreshed, full_refreshed)"
+                    " VALUES (?, ?, ?, ?)",
+                    (prefix, max(keys, default=None), refreshed, full_refreshed),
+                )
+
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def update_filtered_listing(
+        self, filter_key: str, keys: List[str], refreshed: float
+    ) -> None:
+        """
+        Replaces the keys listed for the filter given.
+
+        :param filter_key: Serialized filter arguments of the listing
+        :param keys:       S3 object keys listed
+        :param refreshed:  Timestamp of the listing
+
+        :since: 1.0.0
+        """
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO filtered_listings (filter, keys, refreshed)"
+                " VALUES (?, ?, ?)",
+                (filter_key, json.dumps(keys), refreshed),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Opens the index and creates its tables if needed. Files not being a
+        SQLite database, e.g. legacy JSON caches, or being corrupt are
+        replaced. Other errors like a database locked by a concurrent process
+        are raised.
+
+        :return: (object) SQLite connection
+        :since: 1.0.0
+        """
+
+        try:
+            connection = self._open()
+        except sqlite3.DatabaseError as exc:
+            if exc.sqlite_errorcode not in (
+                sqlite3.SQLITE_CORRUPT,
+                sqlite3.SQLITE_NOTADB,
+            ):
+                raise
+
+            self._index_file.unlink(missing_ok=True)
+            connection = self._open()
+
+        with closing(connection):
+            yield connection
+
+    def _open(self) -> sqlite3.Connection:
+        """
+        Opens the index SQLite database in autocommit mode.
+
+        :return: (object) SQLite connection
+        :since: 1.0.0
+        """
+
+        connection = sqlite3.connect(
+            self._index_file, timeout=self._timeout, isolation_level=None
+        )
+
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS objects"
+                " (key TEXT PRIMARY KEY, etag TEXT, size INTEGER, last_modified TEXT)"
+            )
+
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS listings"
+                " (prefix TEXT PRIMARY KEY, last_key TEXT, refreshed REAL,"
+                " full_refreshed REAL)"
+            )
+
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS filtered_listings"
+                " (filter TEXT PRIMARY KEY, keys TEXT, refreshed REAL)"
+            )
+        except BaseException:
+            connection.close()
+            raise
+
+        return connection
+
+    @staticmethod
+    def _get_prefix_condition(prefix: str) -> Tuple[str, Tuple[Any, ...]]:
+        """
+        Returns a SQL condition matching keys starting with the prefix given
+        as a key range to make use of the primary key index.
+
+        :param prefix: S3 key prefix
+
+        :return: (tuple) SQL WHERE clause and its parameters
+        :since: 1.0.0
+        """
+
+        if prefix == "":
+            return "", ()
+
+        # Incrementing the last character must not yield a surrogate
+        if ord(prefix[-1]) >= 0xD7FF:
+            return "WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+        return "WHERE key >= ? AND key < ?", (prefix, upper_bound)
@@ -4,22 +4,40 @@
 S3 GardenLinux artifacts
 """
 
+import gzip
+import hashlib
+import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from configparser import UNNAMED_SECTION, ConfigParser
+from contextlib import ExitStack
 from datetime import datetime
-from hashlib import file_digest
-from os import PathLike, stat
+from functools import partial
+from hashlib import file_digest, md5, sha256
+from io import BytesIO
+from os import PathLike, cpu_count, stat
 from os.path import basename
 from pathlib import Path
 from tempfile import TemporaryFile
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import yaml
-
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from ..constants import (
+    S3_LEGACY_SHA256SUM,
+    S3_MAX_CONCURRENCY,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_MULTIPART_CHUNKSIZE,
+    S3_MULTIPART_THRESHOLD,
+)
 from ..features import CName
+from ..logger import LoggerSetup
 from .bucket import Bucket
+from .digest_writer import DigestWriter
 
 
 class S3Artifacts(object):
@@ -41,6 +59,7 @@ class S3Artifacts(object):
         endpoint_url: Optional[str] = None,
         s3_resource_config: Optional[dict[str, Any]] = None,
         logger: Optional[logging.Logger] = None,
+        max_pool_connections: int = S3_MAX_POOL_CONNECTIONS,
     ):
         """
         Constructor __init__(S3Artifacts)
@@ -49,11 +68,22 @@ class S3Artifacts(object):
         :param endpoint_url: S3 endpoint URL
         :param s3_resource_config: Additional boto3 S3 config values
         :param logger: Logger instance
+        :param max_pool_connections: Maximum number of pooled S3 connections
 
         :since: 0.8.0
         """
 
-        self._bucket = Bucket(bucket_name, endpoint_url, s3_resource_config, logger)
+        if logger is None or not logger.hasHandlers():
+            logger = LoggerSetup.get_logger("gardenlinux.s3")
+
+        self._bucket = Bucket(
+            bucket_name,
+            endpoint_url,
+            s3_resource_config,
+            logger,
+            max_pool_connections,
+        )
+        self._logger = logger
 
     @property
     def bucket(self) -> Bucket:
@@ -67,17 +97,30 @@ class S3Artifacts(object):
         return self._bucket
 
     def download_to_directory(
-        self, cname: str, artifacts_dir: PathLike[str] | str
-    ) -> None:
+        self,
+        cname: str,
+        artifacts_dir: PathLike[str] | str,
+        suffixes: Optional[Iterable[str]] = None,
+        transfer_config: Optional[TransferConfig] = None,
+    ) -> Dict[str, float]:
         """
-        Download S3 artifacts to a given directory.
+        Download S3 artifacts to a given directory. Artifacts are downloaded
+        concurrently and verified against the SHA256 digest of the metadata
+        calculated while downloading. The MD5 digest is used for legacy
+        metadata. Local artifacts already matching the digest are skipped.
 
-        :param cname:         Canonical name of the GardenLinux S3 artifacts
-        :param artifacts_dir: Path for the image artifacts
+        :param cname:           Canonical name of the GardenLinux S3 artifacts
+        :param artifacts_dir:   Path for the image artifacts
+        :param suffixes:        Artifact file name suffixes to download only
+        :param transfer_config: boto3 transfer configuration shared by all downloads
 
+        :return: (dict) Download throughput in bytes per second for each S3 key
         :since: 0.8.0
         """
 
+        if transfer_config is None:
+            transfer_config = S3Artifacts.get_transfer_config()
+
         artifacts_dir = Path(artifacts_dir)
 
         if not artifacts_dir.is_dir():
@@ -87,32 +130,267 @@ class S3Artifacts(object):
             self._bucket.objects.filter(Prefix=f"meta/singles/{cname}")
         )[0]
 
-        self._bucket.download_file(
-            release_object.key, str(artifacts_dir.joinpath(f"{cname}.s3_metadata.yaml"))
-        )
+        metadata_file = artifacts_dir.joinpath(f"{cname}.s3_metadata.yaml")
+        self._bucket.download_file(release_object.key, str(metadata_file))
+
+        with metadata_file.open("r") as fp:
+            metadata = yaml.safe_load(fp)
+
+        digests: Dict[str, Tuple[str, str]] = {}
+
+        if isinstance(metadata, dict):
+            for path in metadata.get("paths", []):
+                digest = self._get_metadata_digest(path)
+
+                if digest is not None:
+                    digests[path["name"]] = digest
+
+        artifacts = []
+
+        for s3_object in self._bucket.objects.filter(Prefix=f"objects/{cname}/"):
+            artifact_name = basename(s3_object.key)
 
-        for s3_object in self._bucket.objects.filter(Prefix=f"objects/{cname}").all():
-            self._bucket.download_file(
-                s3_object.key, str(artifacts_dir.joinpath(basename(s3_object.key)))
+            if suffixes is not None and not artifact_name.endswith(tuple(suffixes)):
+                continue
+
+            artifacts.append((s3_object.key, artifacts_dir.joinpath(artifact_name)))
+
+        # Hash existing artifacts in parallel as hashlib releases the GIL
+        with ThreadPoolExecutor(max_workers=cpu_count()) as executor:
+            local_digests = list(
+                executor.map(
+                    lambda artifact: (
+                        S3Artifacts.get_file_digest(artifact, digests[artifact.name][0])
+                        if artifact.name in digests and artifact.exists()
+                        else None
+                    ),
+                    [artifact for _, artifact in artifacts],
+                )
             )
 
+        downloads = []
+
+        for (s3_key, artifact), local_digest in zip(artifacts, local_digests):
+            if local_digest is not None and local_digest == digests[artifact.name][1]:
+                self._logger.info(f"Skipped {s3_key} matching {artifact}")
+                continue
+
+            if artifact.name not in digests:
+                self._logger.warning(
+                    f"No digest available for {s3_key}, skipping verification"
+                )
+
+            downloads.append(
+                (s3_key, artifact, artifact.with_name(f"{artifact.name}.part"))
+            )
+
+        failed_artifacts = []
+
+        with ExitStack() as stack:
+            targets: List[Tuple[str, Any]] = []
+
+            for s3_key, artifact, part_file in downloads:
+                part_fp = stack.enter_context(part_file.open("wb"))
+
+                if artifact.name in digests:
+                    # Calculate the digest while the download is streamed
+                    targets.append(
+                        (s3_key, DigestWriter(part_fp, digests[artifact.name][0]))
+                    )
+                else:
+                    targets.append((s3_key, part_fp))
+
+            try:
+                throughput = self._bucket.download_files(targets, transfer_config)
+            except BaseException:
+                stack.close()
+
+                for _, _, part_file in downloads:
+                    part_file.unlink(missing_ok=True)
+
+                raise
+
+        for (s3_key, artifact, part_file), (_, target) in zip(downloads, targets):
+            if (
+                isinstance(target, DigestWriter)
+                and target.hexdigest != digests[artifact.name][1]
+            ):
+                self._logger.error(
+                    f"{digests[artifact.name][0].upper()} digest mismatch for {s3_key}"
+                )
+
+                part_file.unlink()
+                failed_artifacts.append(artifact.name)
+
+                continue
+
+            part_file.replace(artifact)
+
+        if len(failed_artifacts) > 0:
+            raise RuntimeError(
+                f"S3 artifacts failed verification: {', '.join(failed_artifacts)}"
+            )
+
+        return throughput
+
+    def get_metadata_documents(
+        self, cnames: Iterable[str], version: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Returns the parsed S3 metadata for the canonical names given. The
+        aggregated metadata index of the version given is preferred and
+        metadata missing there is read from the per-flavor objects.
+
+        :param cnames:  Canonical names of the GardenLinux S3 artifacts
+        :param version: GardenLinux version of the metadata index to use
+
+        :return: (dict) Parsed metadata or None if not found for each cname
+        :since: 1.0.0
+        """
+
+        index_documents: Dict[str, str] = {}
+
+        if version is not None:
+            index_data = self._get_object_data(
+                S3Artifacts.get_metadata_index_key(version)
+            )
+
+            if index_data is None:
+                self._logger.info(f"No S3 metadata index found for version {version}")
+            else:
+                index_documents = json.loads(gzip.decompress(index_data))["documents"]
+
+        cnames = list(cnames)
+        missing_cnames = [cname for cname in cnames if cname not in index_documents]
+
+        # Fetch metadata documents concurrently into memory
+        with ThreadPoolExecutor(max_workers=S3_MAX_CONCURRENCY) as executor:
+            documents: Dict[str, Optional[str | bytes]] = dict(
+                zip(
+                    missing_cnames,
+                    executor.map(self._get_single_metadata_document, missing_cnames),
+                )
+            )
+
+        documents.update(index_documents)
+
+        # Prefer the libyaml based loader if available
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        metadata = {}
+
+        for cname in cnames:
+            document = documents.get(cname)
+            metadata[cname] = (
+                None
+                if document is None
+                # Loader is always one of the safe loaders selected above
+                else yaml.load(document, Loader=loader)  # nosec B506
+            )
+
+        return metadata
+
+    def build_metadata_index(self, version: str) -> Dict[str, str]:
+        """
+        Returns all S3 metadata documents of the version given.
+
+        :param version: GardenLinux version
+
+        :return: (dict) S3 metadata YAML documents for each cname
+        :since: 1.0.0
+        """
+
+        keys = [
+            s3_object.key
+            for s3_object in self._bucket.objects.filter(Prefix="meta/singles/")
+            if f"-{version}-" in basename(s3_object.key)
+        ]
+
+        with ThreadPoolExecutor(max_workers=S3_MAX_CONCURRENCY) as executor:
+            documents = list(executor.map(self._get_object_data, keys))
+
+        return {
+            basename(key): document.decode("utf-8")
+            for key, document in zip(keys, documents)
+            if document is not None
+        }
+
+    def upload_metadata_index(self, version: str, dry_run: bool = False) -> str:
+        """
+        Uploads the aggregated metadata index of the version given as
+        gzip-compressed JSON. Pushing metadata of the version afterwards
+        removes the index until it is uploaded again.
+
+        :param version: GardenLinux version
+        :param dry_run: True to print the cnames indexed only
+
+        :return: (str) S3 key of the metadata index
+        :since: 1.0.0
+        """
+
+        documents = self.build_metadata_index(version)
+
+        if len(documents) < 1:
+            raise RuntimeError(f"No S3 metadata found for version {version}")
+
+        index_key = S3Artifacts.get_metadata_index_key(version)
+
+        if dry_run:
+            print(yaml.dump({index_key: sorted(documents.keys())}, sort_keys=False))
+            return index_key
+
+        index_data = gzip.compress(
+            json.dumps(
+                {"version": version, "documents": documents}, sort_keys=True
+            ).encode("utf-8")
+        )
+
+        self._bucket.upload_fileobj(
+            BytesIO(index_data),
+            index_key,
+            ExtraArgs={"ContentType": "application/gzip"},
+        )
+
+        return index_key
+
     def upload_from_directory(
         self,
         base_name: str,
         artifacts_dir: PathLike[str] | str,
         delete_before_push: bool = False,
         dry_run: bool = False,
-    ) -> None:
+        transfer_config: Optional[TransferConfig] = None,
+        sync: bool = False,
+    ) -> Dict[str, float]:
         """
-        Pushes S3 artifacts to the underlying bucket.
+        Pushes S3 artifacts to the underlying bucket. Artifacts are uploaded
+        concurrently and the metadata is uploaded after all of them succeeded.
+
+        In sync mode only artifacts missing or differing in the bucket are
+        uploaded and the metadata is only rewritten if it changed. Tags of
+        unchanged artifacts, e.g. "committish", are updated in place if they
+        differ.
+
+        The aggregated metadata index of the version is removed whenever the
+        metadata is rewritten, so readers fall back to the per-flavor objects
+        until the index is uploaded again.
 
         :param base_name:          Base name of the GardenLinux S3 artifacts
         :param artifacts_dir:      Path of the image artifacts
-        :param delete_before_push: True to delete objects before upload
+        :param delete_before_push: True to delete all existing objects before upload
+        :param dry_run:            True to print the metadata only
+        :param transfer_config:    boto3 transfer configuration shared by all uploads
+        :param sync:               True to skip artifacts and metadata unchanged in S3
 
+        :return: (dict) Upload throughput in bytes per second for each S3 key
         :since: 0.8.0
         """
 
+        if sync and delete_before_push:
+            raise RuntimeError("Sync mode can not be combined with delete before push")
+
+        if transfer_config is None:
+            transfer_config = S3Artifacts.get_transfer_config()
+
         artifacts_dir = Path(artifacts_dir)
 
         if not artifacts_dir.is_dir():
@@ -222,15 +500,42 @@ class S3Artifacts(object):
 
         base_name_length = len(base_name)
 
-        for artifact in artifacts_dir.iterdir():
-            if not artifact.match(f"{base_name}*"):
-                continue
+        artifacts = sorted(
+            artifact
+            for artifact in artifacts_dir.iterdir()
+            if artifact.match(f"{base_name}*")
+        )
 
+        # Hash artifacts in parallel as hashlib releases the GIL for large data
+        with ThreadPoolExecutor(max_workers=cpu_count()) as executor:
+            artifacts_digests = list(
+                executor.map(
+                    partial(
+                        S3Artifacts.get_file_digests,
+                        multipart_threshold=transfer_config.multipart_threshold,
+                        multipart_chunksize=transfer_config.multipart_chunksize,
+                    ),
+                    artifacts,
+                )
+            )
+
+        existing_etags: Dict[str, str] = {}
+
+        if sync and not dry_run:
+            existing_etags = {
+                s3_object.key: s3_object.e_tag.strip('"')
+                for s3_object in self._bucket.objects.filter(
+                    Prefix=f"objects/{base_name}/"
+                )
+            }
+
+        uploads = []
+
+        for artifact, artifact_digests in zip(artifacts, artifacts_digests):
             s3_key = f"objects/{base_name}/{artifact.name}"
 
-            with artifact.open("rb") as fp:
-                md5sum = file_digest(fp, "md5").hexdigest()
-                sha256sum = file_digest(fp, "sha256").hexdigest()
+            md5sum = artifact_digests["md5sum"]
+            sha256sum = artifact_digests["sha256sum"]
 
             artifact_metadata = {
                 "name": artifact.name,
@@ -245,37 +550,319 @@ class S3Artifacts(object):
                 "architecture": arch,
                 "platform": re_object.sub("+", cname_object.platform),
                 "version": re_object.sub("+", cname_object.version),  # type: ignore[arg-type]
-                "committish": commit_id_or_hash,
+                "committish": str(commit_id_or_hash),
                 "md5sum": md5sum,
                 "sha256sum": sha256sum,
             }
 
-            if not dry_run:
-                if delete_before_push:
-                    self._bucket.delete_objects(Delete={"Objects": [{"Key": s3_key}]})
+            metadata["paths"].append(artifact_metadata)
 
-                self._bucket.upload_file(
-                    str(artifact),
-                    s3_key,
-                    ExtraArgs={"Tagging": urlencode(s3_tags)},
-                )
+            if s3_key in existing_etags:
+                existing_tags = self._get_object_tags(s3_key)
 
-            metadata["paths"].append(artifact_metadata)
+                if self._is_object_unchanged(
+                    existing_etags[s3_key], existing_tags, artifact_digests
+                ):
+                    if existing_tags == s3_tags:
+                        self._logger.info(f"Skipped unchanged {s3_key} in S3")
+                    else:
+                        self._put_object_tags(s3_key, s3_tags)
+                        self._logger.info(f"Updated tags of unchanged {s3_key} in S3")
+
+                    continue
+
+            uploads.append((str(artifact), s3_key, {"Tagging": urlencode(s3_tags)}))
+
+        throughput: Dict[str, float] = {}
 
         if dry_run:
             print(yaml.dump(metadata, sort_keys=False))
+            return throughput
+
+        metadata_key = f"meta/singles/{base_name}"
+
+        if delete_before_push:
+            # Stale objects no longer existing locally are removed as well
+            self._bucket.delete_keys(
+                [
+                    s3_object.key
+                    for s3_object in self._bucket.objects.filter(
+                        Prefix=f"objects/{base_name}/"
+                    )
+                ]
+                + [metadata_key]
+            )
+
+        if len(uploads) > 0:
+            throughput = self._bucket.upload_files(uploads, transfer_config)
+
+        metadata_data = yaml.dump(metadata).encode("utf-8")
+
+        if sync and self._get_object_data(metadata_key) == metadata_data:
+            self._logger.info(f"Skipped unchanged {metadata_key} in S3")
+            return throughput
+
+        # Remove the metadata index of the version as it becomes stale
+        self._bucket.delete_keys(
+            [S3Artifacts.get_metadata_index_key(str(cname_object.version))]
+        )
+
+        with TemporaryFile(mode="wb+") as fp:
+            fp.write(metadata_data)
+            fp.seek(0)
+
+            self._bucket.upload_fileobj(
+                fp,
+                metadata_key,
+                ExtraArgs={"ContentType": "text/yaml"},
+            )
+
+        return throughput
+
+    def _get_metadata_digest(self, path: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Returns the hashlib algorithm name and expected hex digest of the
+        artifact metadata given. Releases published before digests were fixed
+        carry the SHA256 digest of empty input, so MD5 is used for them.
+
+        :param path: Artifact metadata of the S3 metadata "paths" list
+
+        :return: (tuple) Algorithm name and hex digest; None if unknown
+        :since: 1.0.0
+        """
+
+        sha256sum = path.get("sha256sum")
+
+        if sha256sum is not None and sha256sum != S3_LEGACY_SHA256SUM:
+            return "sha256", str(sha256sum)
+
+        md5sum = path.get("md5sum")
+
+        if md5sum is not None:
+            return "md5", str(md5sum)
+
+        return None
+
+    def _get_object_data(self, key: str) -> Optional[bytes]:
+        """
+        Returns the data of the S3 object given or None if it does not exist.
+
+        :param key: S3 object key
+
+        :return: (bytes) S3 object data
+        :since: 1.0.0
+        """
+
+        try:
+            # boto3 clients are thread-safe in contrast to resources
+            response = self._bucket.meta.client.get_object(
+                Bucket=self._bucket.name, Key=key
+            )
+
+            return response["Body"].read()  # type: ignore[no-any-return]
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+
+            raise
+
+    def _get_single_metadata_document(self, cname: str) -> Optional[bytes]:
+        """
+        Returns the S3 metadata document of the cname given. The first key
+        starting with the cname is used if no exact match exists.
+
+        :param cname: Canonical name of the GardenLinux S3 artifacts
+
+        :return: (bytes) S3 metadata YAML document or None if not found
+        :since: 1.0.0
+        """
+
+        document = self._get_object_data(f"meta/singles/{cname}")
+
+        if document is None:
+            release_objects = list(
+                self._bucket.meta.client.list_objects_v2(
+                    Bucket=self._bucket.name,
+                    Prefix=f"meta/singles/{cname}",
+                    MaxKeys=1,
+                ).get("Contents", [])
+            )
+
+            if len(release_objects) > 0:
+                document = self._get_object_data(release_objects[0]["Key"])
+
+        return document
+
+    def _get_object_tags(self, key: str) -> Dict[str, str]:
+        """
+        Returns the tags of the S3 object given.
+
+        :param key: S3 object key
+
+        :return: (dict) S3 object tags
+        :since: 1.0.0
+        """
+
+        tagging = self._bucket.meta.client.get_object_tagging(
+            Bucket=self._bucket.name, Key=key
+        )
+
+        return {tag["Key"]: tag["Value"] for tag in tagging["TagSet"]}
+
+    def _put_object_tags(self, key: str, tags: Dict[str, str]) -> None:
+        """
+        Replaces the tags of the S3 object given.
+
+        :param key:  S3 object key
+        :param tags: S3 object tags
+
+        :since: 1.0.0
+        """
+
+        self._bucket.meta.client.put_object_tagging(
+            Bucket=self._bucket.name,
+            Key=key,
+            Tagging={
+                "TagSet": [
+                    {"Key": name, "Value": value} for name, value in tags.items()
+                ]
+            },
+        )
+
+    @staticmethod
+    def _is_object_unchanged(
+        etag: str, tags: Dict[str, str], digests: Dict[str, str]
+    ) -> bool:
+        """
+        Returns true if the S3 object given matches the local digests. The
+        ETag depends on the multipart chunk size used for upload. The
+        "sha256sum" tag is compared if the ETag differs.
+
+        :param etag:    S3 object ETag
+        :param tags:    S3 object tags
+        :param digests: Local file digests
+
+        :return: (bool) True if unchanged
+        :since: 1.0.0
+        """
+
+        if etag == digests["etag"]:
+            return True
+
+        return tags.get("sha256sum") == digests["sha256sum"]
+
+    @staticmethod
+    def get_file_digests(
+        file_name: PathLike[str] | str,
+        multipart_threshold: int = S3_MULTIPART_THRESHOLD,
+        multipart_chunksize: int = S3_MULTIPART_CHUNKSIZE,
+    ) -> Dict[str, str]:
+        """
+        Calculates the MD5 and SHA256 digests as well as the expected S3 ETag
+        of the given file reading it only once.
+
+        :param file_name:           File to calculate digests for
+        :param multipart_threshold: Size threshold for multipart uploads
+        :param multipart_chunksize: Part size of multipart uploads
+
+        :return: (dict) Digests with keys "md5sum", "sha256sum" and "etag"
+        :since: 1.0.0
+        """
+
+        md5sum = md5(usedforsecurity=False)
+        sha256sum = sha256()
+        parts_md5sum = []
+        size = 0
+
+        buffer = bytearray(multipart_chunksize)
+        buffer_view = memoryview(buffer)
+
+        with open(file_name, "rb", buffering=0) as fp:
+            while True:
+                length = 0
+
+                # Fill the buffer with exactly one multipart upload part
+                while length < multipart_chunksize:
+                    read_length = fp.readinto(buffer_view[length:])
+
+                    if not read_length:
+                        break
+
+                    length += read_length
+
+                if length < 1:
+                    break
+
+                part = buffer_view[:length]
+
+                md5sum.update(part)
+                sha256sum.update(part)
+                parts_md5sum.append(md5(part, usedforsecurity=False).digest())
+
+                size += length
+
+        if size < multipart_threshold:
+            etag = md5sum.hexdigest()
         else:
-            if delete_before_push:
-                self._bucket.delete_objects(
-                    Delete={"Objects": [{"Key": f"meta/singles/{base_name}"}]}
-                )
+            etag = md5(b"".join(parts_md5sum), usedforsecurity=False).hexdigest()
+            etag += f"-{len(parts_md5sum)}"
 
-            with TemporaryFile(mode="wb+") as fp:
-                fp.write(yaml.dump(metadata).encode("utf-8"))
-                fp.seek(0)
+        return {
+            "md5sum": md5sum.hexdigest(),
+            "sha256sum": sha256sum.hexdigest(),
+            "etag": etag,
+        }
 
-                self._bucket.upload_fileobj(
-                    fp,
-                    f"meta/singles/{base_name}",
-                    ExtraArgs={"ContentType": "text/yaml"},
-                )
+    @staticmethod
+    def get_file_digest(file_name: PathLike[str] | str, algorithm: str) -> str:
+        """
+        Returns the hex digest of the file given.
+
+        :param file_name: File to hash
+        :param algorithm: hashlib algorithm name
+
+        :return: (str) Hex digest
+        :since: 1.0.0
+        """
+
+        with open(file_name, "rb") as fp:
+            return file_digest(
+                fp, lambda: hashlib.new(algorithm, usedforsecurity=False)
+            ).hexdigest()
+
+    @staticmethod
+    def get_metadata_index_key(version: str) -> str:
+        """
+        Returns the S3 key of the aggregated metadata index of a version.
+
+        :param version: GardenLinux version
+
+        :return: (str) S3 key
+        :since: 1.0.0
+        """
+
+        return f"meta/index/{version}.json.gz"
+
+    @staticmethod
+    def get_transfer_config(
+        multipart_chunksize: int = S3_MULTIPART_CHUNKSIZE,
+        max_concurrency: int = S3_MAX_CONCURRENCY,
+        max_bandwidth: Optional[int] = None,
+    ) -> TransferConfig:
+        """
+        Returns a boto3 transfer configuration for the values given.
+
+        :param multipart_chunksize: Part size and threshold of multipart uploads
+        :param max_concurrency:     Maximum number of concurrent S3 requests
+        :param max_bandwidth:       Maximum bandwidth in bytes per second
+
+        :return: (TransferConfig) boto3 transfer configuration
+        :since: 1.0.0
+        """
+
+        return TransferConfig(
+            multipart_threshold=multipart_chunksize,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            max_bandwidth=max_bandwidth,
+        )
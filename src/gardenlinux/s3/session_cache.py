@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+"""
+S3 session cache
+"""
+
+from collections.abc import Hashable, Mapping
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+if TYPE_CHECKING:
+    # Only import when type checking is enabled i.e. in a dev environment or CI.
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.service_resource import S3ServiceResource
+
+from ..constants import S3_MAX_POOL_CONNECTIONS
+
+
+class SessionCache(object):
+    """
+    Process-wide cache of the boto3 session and of S3 clients keyed by
+    endpoint and configuration values. Sharing them avoids repeated
+    credential resolution and endpoint discovery and lets all callers reuse
+    the connection pool of a client. boto3 resources are not thread-safe, so
+    a new S3 resource wrapping the shared client is created for each caller.
+
+    :author:     Garden Linux Maintainers
+    :copyright:  Copyright 2024 SAP SE
+    :package:    gardenlinux
+    :subpackage: s3
+    :since:      1.0.0
+    :license:    https://www.apache.org/licenses/LICENSE-2.0
+                 Apache License, Version 2.0
+    """
+
+    _lock = Lock()
+    _resources: Dict[Tuple[Any, ...], "S3ServiceResource"] = {}
+    _session: Optional[boto3.session.Session] = None
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Clears the cached session and S3 clients.
+
+        :since: 1.0.0
+        """
+
+        with SessionCache._lock:
+            SessionCache._resources.clear()
+            SessionCache._session = None
+
+    @staticmethod
+    def get_client(
+        s3_resource_config: Optional[Dict[str, Any]] = None,
+        max_pool_connections: int = S3_MAX_POOL_CONNECTIONS,
+    ) -> "S3Client":
+        """
+        Returns the shared S3 client for the config values given. boto3
+        clients are thread-safe.
+
+        :param s3_resource_config:   boto3 S3 config values
+        :param max_pool_connections: Maximum number of pooled connections
+
+        :return: (object) boto3 S3 client
+        :since: 1.0.0
+        """
+
+        return SessionCache._get_shared_resource(
+            s3_resource_config, max_pool_connections
+        ).meta.client
+
+    @staticmethod
+    def get_resource(
+        s3_resource_config: Optional[Dict[str, Any]] = None,
+        max_pool_connections: int = S3_MAX_POOL_CONNECTIONS,
+    ) -> "S3ServiceResource":
+        """
+        Returns a new S3 resource for the config values given wrapping the
+        shared S3 client.
+
+        :param s3_resource_config:   boto3 S3 config values
+        :param max_pool_connections: Maximum number of pooled connections
+
+        :return: (object) boto3 S3 resource
+        :since: 1.0.0
+        """
+
+        shared_resource = SessionCache._get_shared_resource(
+            s3_resource_config, max_pool_connections
+        )
+
+        return type(shared_resource)(client=shared_resource.meta.client)
+
+    @staticmethod
+    def _get_cache_key(s3_resource_config: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Returns a hashable cache key built from the config values given.
+
+        :param s3_resource_config: boto3 S3 config values
+
+        :return: (tuple) Cache key
+        :since: 1.0.0
+        """
+
+        return (SessionCache._get_hashable_value(s3_resource_config),)
+
+    @staticmethod
+    def _get_config(
+        s3_resource_config: Optional[Dict[str, Any]], max_pool_connections: int
+    ) -> Dict[str, Any]:
+        """
+        Returns a copy of the config values given with the maximum number of
+        pooled connections merged into the botocore config.
+
+        :param s3_resource_config:   boto3 S3 config values
+        :param max_pool_connections: Maximum number of pooled connections
+
+        :return: (dict) boto3 S3 config values
+        :since: 1.0.0
+        """
+
+        if s3_resource_config is None:
+            s3_resource_config = {}
+
+        s3_resource_config = s3_resource_config.copy()
+        config = Config(max_pool_connections=max_pool_connections)
+
+        if s3_resource_config.get("config") is not None:
+            config = config.merge(s3_resource_config["config"])
+
+        s3_resource_config["config"] = config
+
+        return s3_resource_config
+
+    @staticmethod
+    def _get_hashable_value(value: Any) -> Any:
+        """
+        Returns a hashable representation of the value given. botocore
+        configs are compared by their option values.
+
+        :param value: Value to convert
+
+        :return: (mixed) Hashable value
+        :since: 1.0.0
+        """
+
+        if isinstance(value, Config):
+            value = vars(value)
+
+        if isinstance(value, Mapping):
+            return tuple(
+                sorted(
+                    (str(key), SessionCache._get_hashable_value(item))
+                    for key, item in value.items()
+                )
+            )
+
+        if isinstance(value, (list, tuple)):
+            return tuple(SessionCache._get_hashable_value(item) for item in value)
+
+        if isinstance(value, Hashable):
+            return value
+
+        return repr(value)
+
+    @staticmethod
+    def _get_shared_resource(
+        s3_resource_config: Optional[Dict[str, Any]], max_pool_connections: int
+    ) -> "S3ServiceResource":
+        """
+        Returns the shared S3 resource for the config values given. It is only
+        used to provide the S3 client and resource class to callers.
+
+        :param s3_resource_config:   boto3 S3 config values
+        :param max_pool_connections: Maximum number of pooled connections
+
+        :return: (object) boto3 S3 resource
+        :since: 1.0.0
+        """
+
+        s3_resource_config = SessionCache._get_config(
+            s3_resource_config, max_pool_connections
+        )
+
+        cache_key = SessionCache._get_cache_key(s3_resource_config)
+
+        # boto3 sessions are not thread-safe, so create resources locked
+        with SessionCache._lock:
+            if cache_key not in SessionCache._resources:
+                SessionCache._resources[cache_key] = (
+                    SessionCache._get_session().resource("s3", **s3_resource_config)
+                )
+
+            return SessionCache._resources[cache_key]
+
+    @staticmethod
+    def _get_session() -> boto3.session.Session:
+        """
+        Returns the shared boto3 session. The caller must hold the lock.
+
+        :return: (object) boto3 session
+        :since: 1.0.0
+        """
+
+        if SessionCache._session is None:
+            SessionCache._session = boto3.session.Session()
+
+        return SessionCache._session
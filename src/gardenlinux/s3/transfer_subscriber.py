@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+S3 transfer subscriber
+"""
+
+from threading import Lock
+from time import perf_counter
+from typing import Any, Optional
+
+from s3transfer.subscribers import BaseSubscriber
+
+
+class TransferSubscriber(BaseSubscriber):
+    """
+    S3 transfer subscriber recording the number of bytes transferred and the
+    throughput of a single transfer. Progress of concurrent ranged parts is
+    reported from multiple threads.
+
+    :author:     Garden Linux Maintainers
+    :copyright:  Copyright 2024 SAP SE
+    :package:    gardenlinux
+    :subpackage: s3
+    :since:      1.0.0
+    :license:    https://www.apache.org/licenses/LICENSE-2.0
+                 Apache License, Version 2.0
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor __init__(TransferSubscriber)
+
+        :since: 1.0.0
+        """
+
+        self._bytes_transferred = 0
+        self._done_time: Optional[float] = None
+        self._lock = Lock()
+        self._start_time: Optional[float] = None
+
+    @property
+    def bytes_transferred(self) -> int:
+        """
+        Returns the number of bytes transferred.
+
+        :return: (int) Bytes transferred
+        :since:  1.0.0
+        """
+
+        return self._bytes_transferred
+
+    @property
+    def duration(self) -> float:
+        """
+        Returns the duration of the transfer in seconds.
+
+        :return: (float) Transfer duration
+        :since:  1.0.0
+        """
+
+        if self._start_time is None or self._done_time is None:
+            return 0.0
+
+        return self._done_time - self._start_time
+
+    @property
+    def throughput(self) -> float:
+        """
+        Returns the transfer throughput in bytes per second.
+
+        :return: (float) Transfer throughput
+        :since:  1.0.0
+        """
+
+        duration = self.duration
+
+        if duration <= 0:
+            return 0.0
+
+        return self._bytes_transferred / duration
+
+    def on_progress(self, future: Any, bytes_transferred: int, **kwargs: Any) -> None:
+        """
+        s3transfer: Callback to be invoked when progress is made on transfer.
+
+        :param future: Transfer future
+        :param bytes_transferred: Number of bytes transferred
+
+        :since: 1.0.0
+        """
+
+        with self._lock:
+            if self._start_time is None:
+                self._start_time = perf_counter()
+
+            self._bytes_transferred += bytes_transferred
+
+    def on_done(self, future: Any, **kwargs: Any) -> None:
+        """
+        s3transfer: Callback to be invoked once a transfer is done.
+
+        :param future: Transfer future
+
+        :since: 1.0.0
+        """
+
+        self._done_time = perf_counter()
@@ -1,3 +1,4 @@
+import gzip
 import io
 
 from gardenlinux.apt import DebsrcFile
@@ -102,3 +103,24 @@ def test_parse_debsource_file() -> None:
     # Explicitly sort list for comparison because the order is not deterministic
     actual = sorted([f"{f'{package!r}'}" for package in unit_under_test.values()])
     assert expected == actual
+
+
+def test_parse_debsource_file_binary_chunks() -> None:
+    data = (
+        test_data
+        + "\nPackage: vim-source\nVersion: 2:9.1.0496-1\nExtra-Source-Only: yes\n"
+    )
+
+    unit_under_test = DebsrcFile()
+
+    # Chunks split stanzas and lines at arbitrary positions
+    with gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(data.encode()))) as fp:
+        unit_under_test.read_binary(fp, chunk_size=7)
+
+    expected = DebsrcFile()
+    expected.read(io.StringIO(test_data))
+
+    assert {source: f"{package!r}" for source, package in unit_under_test.items()} == {
+        source: f"{package!r}" for source, package in expected.items()
+    }
+    assert "vim-source" not in unit_under_test
@@ -1,10 +1,16 @@
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
+from pygit2 import Commit
 
+import gardenlinux.features.parser as parser_module
 from gardenlinux.features import Parser
+from gardenlinux.git import Repository
 
 from ..constants import GL_ROOT_DIR
+from ..helper import create_git_repo
 
 
 @pytest.mark.parametrize(
@@ -169,3 +175,71 @@ def test_parser_subset_with_empty_order_list() -> None:
     result = Parser.subset(input_set, order_list)
 
     assert result == []
+
+
+def test_parser_graph_from_git(tmp_path: Path) -> None:
+    # Arrange
+    commit = create_git_repo(
+        tmp_path,
+        {
+            "features/base/info.yaml": b"type: element\n",
+            "features/aws/info.yaml": b"type: platform\nfeatures:\n  include:\n    - base\n",
+            "features/README.md": b"features",
+        },
+    )
+
+    create_git_repo(tmp_path, {"README.md": b"readme"})
+    create_git_repo(tmp_path, {"features/_prod/info.yaml": b"type: flag\n"})
+
+    repo = Repository(tmp_path)
+
+    # Act
+    parser = Parser(repository=repo, commit=commit)
+    other_parser = Parser(repository=repo, commit="HEAD~1")
+    latest_parser = Parser(repository=repo)
+
+    # Assert
+    assert parser.filter_as_list("aws") == ["base", "aws"]
+    assert set(latest_parser.graph.nodes) == {"aws", "base", "_prod"}
+    assert other_parser.graph is not parser.graph
+    assert (
+        other_parser.graph.nodes["aws"]["content"]
+        is parser.graph.nodes["aws"]["content"]
+    )
+
+
+def test_parser_graph_from_git_missing_feature_dir(tmp_path: Path) -> None:
+    # Arrange
+    create_git_repo(tmp_path, {"README.md": b"readme"})
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        Parser(repository=Repository(tmp_path))
+
+
+def test_parser_graph_from_git_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    # Arrange
+    monkeypatch.setattr(Parser, "_GRAPHS", OrderedDict())
+    monkeypatch.setattr(parser_module, "GL_FEATURES_GRAPHS_CACHE_SIZE", 2)
+
+    commits = [
+        create_git_repo(tmp_path, {"features/base/info.yaml": b"type: element\n"}),
+        create_git_repo(tmp_path, {"features/aws/info.yaml": b"type: platform\n"}),
+        create_git_repo(tmp_path, {"features/gcp/info.yaml": b"type: platform\n"}),
+    ]
+
+    repo = Repository(tmp_path)
+    tree_ids = [
+        str(repo.get(commit).peel(Commit).tree["features"].id) for commit in commits
+    ]
+
+    # Act
+    Parser(repository=repo, commit=commits[0]).graph
+    Parser(repository=repo, commit=commits[1]).graph
+    Parser(repository=repo, commit=commits[0]).graph
+    Parser(repository=repo, commit=commits[2]).graph
+
+    # Assert
+    assert list(Parser._GRAPHS) == [tree_ids[0], tree_ids[2]]
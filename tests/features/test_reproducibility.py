@@ -1,6 +1,7 @@
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -196,3 +197,44 @@ def test_comparator_main(
     assert received == "/a\n/a/b\n/a/b/c.txt\n"
     assert pytest_exit.type is SystemExit
     assert pytest_exit.value.code == 64
+
+
+@pytest.mark.parametrize("type", [".tar", ".oci"])
+def test_comparator_cache(
+    type: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    comparator = Comparator(cache_dir=tmp_path)
+
+    files, whitelist = comparator.generate(
+        compare_files.joinpath(f"a{type}"), compare_files.joinpath(f"b{type}")
+    )
+
+    assert files == ["/a", "/a/b", "/a/b/c.txt"]
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def podman_unavailable(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Cached comparison should not access podman")
+
+    monkeypatch.setattr(
+        "gardenlinux.features.reproducibility.comparator.PodmanContext.__enter__",
+        podman_unavailable,
+    )
+
+    cached_files, cached_whitelist = Comparator(cache_dir=tmp_path).generate(
+        compare_files.joinpath(f"a{type}"), compare_files.joinpath(f"b{type}")
+    )
+
+    assert cached_files == files
+    assert cached_whitelist == whitelist
+
+
+def test_comparator_cache_identical_files(tmp_path: Path) -> None:
+    comparator = Comparator(cache_dir=tmp_path)
+
+    files, whitelist = comparator.generate(
+        compare_files.joinpath("a.tar"), compare_files.joinpath("a.tar")
+    )
+
+    assert files == []
+    assert not whitelist
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import gardenlinux.git.repository
+from gardenlinux.git import Repository
+
+from ..helper import create_git_repo
+
+
+@pytest.fixture
+def mirror_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    mirror_cache_dir = tmp_path / "mirrors"
+
+    monkeypatch.setattr(
+        gardenlinux.git.repository, "GL_GIT_MIRROR_CACHE_DIR", mirror_cache_dir
+    )
+
+    return mirror_cache_dir
+
+
+def test_checkout_repo_from_mirror(
+    monkeypatch: pytest.MonkeyPatch, mirror_cache_dir: Path, tmp_path: Path
+) -> None:
+    # Arrange
+    source_dir = tmp_path / "source"
+    commit = create_git_repo(
+        source_dir, {"flavors.yaml": b"flavors", "README.md": b"readme"}
+    )
+
+    checkout_dir = tmp_path / "checkout"
+    checkout_dir.mkdir()
+
+    # Act
+    repo = Repository.checkout_repo_sparse(
+        checkout_dir, ["flavors.yaml"], repo_url=str(source_dir)
+    )
+
+    # Assert
+    assert (checkout_dir / "flavors.yaml").read_bytes() == b"flavors"
+    assert not (checkout_dir / "README.md").exists()
+    assert str(repo.references["refs/remotes/origin/main"].target) == commit
+    assert len(list(mirror_cache_dir.glob("*.git"))) == 1
+
+    # Arrange
+    def fetch_mirror(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Git mirror should not be fetched")
+
+    monkeypatch.setattr(Repository, "fetch_mirror", fetch_mirror)
+
+    other_checkout_dir = tmp_path / "other_checkout"
+    other_checkout_dir.mkdir()
+
+    # Act
+    Repository.checkout_repo(
+        other_checkout_dir, repo_url=str(source_dir), commit=commit
+    )
+
+    # Assert
+    assert (other_checkout_dir / "README.md").read_bytes() == b"readme"
+
+
+def test_checkout_repo_mirror_update(mirror_cache_dir: Path, tmp_path: Path) -> None:
+    # Arrange
+    source_dir = tmp_path / "source"
+    create_git_repo(source_dir, {"flavors.yaml": b"flavors"})
+
+    checkout_dir = tmp_path / "checkout"
+    checkout_dir.mkdir()
+
+    Repository.checkout_repo(checkout_dir, repo_url=str(source_dir))
+
+    commit = create_git_repo(source_dir, {"flavors.yaml": b"updated"})
+
+    other_checkout_dir = tmp_path / "other_checkout"
+    other_checkout_dir.mkdir()
+
+    # Act
+    Repository.checkout_repo(
+        other_checkout_dir, repo_url=str(source_dir), commit=commit
+    )
+
+    # Assert
+    assert (checkout_dir / "flavors.yaml").read_bytes() == b"flavors"
+    assert (other_checkout_dir / "flavors.yaml").read_bytes() == b"updated"
+
+
+def test_checkout_repo_without_mirror(mirror_cache_dir: Path, tmp_path: Path) -> None:
+    # Arrange
+    source_dir = tmp_path / "source"
+    create_git_repo(source_dir, {"flavors.yaml": b"flavors"})
+
+    checkout_dir = tmp_path / "checkout"
+    checkout_dir.mkdir()
+
+    # Act
+    Repository.checkout_repo(checkout_dir, repo_url=str(source_dir), use_mirror=False)
+
+    # Assert
+    assert (checkout_dir / "flavors.yaml").read_bytes() == b"flavors"
+    assert not mirror_cache_dir.exists()
+
+
+def test_read_files(tmp_path: Path) -> None:
+    # Arrange
+    source_dir = tmp_path / "source"
+    commit = create_git_repo(
+        source_dir, {"flavors.yaml": b"flavors", "features/base/info.yaml": b"base"}
+    )
+
+    create_git_repo(source_dir, {"flavors.yaml": b"updated"})
+    repo = Repository(source_dir)
+
+    # Act
+    files = repo.read_files(
+        ["flavors.yaml", "features/base/info.yaml", "features", "missing"], commit
+    )
+
+    # Assert
+    assert files == {
+        "flavors.yaml": b"flavors",
+        "features/base/info.yaml": b"base",
+        "features": None,
+        "missing": None,
+    }
+
+    assert repo.read_files(["flavors.yaml"]) == {"flavors.yaml": b"updated"}
+
+
+def test_read_files_from_url(
+    monkeypatch: pytest.MonkeyPatch, mirror_cache_dir: Path, tmp_path: Path
+) -> None:
+    # Arrange
+    source_dir = tmp_path / "source"
+    commit = create_git_repo(source_dir, {"flavors.yaml": b"flavors"})
+    create_git_repo(source_dir, {"flavors.yaml": b"updated"})
+
+    # Act
+    files = Repository.read_files_from_url(["flavors.yaml"], repo_url=str(source_dir))
+
+    # Assert
+    assert files == {"flavors.yaml": b"updated"}
+
+    # Arrange
+    def fetch_mirror(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Git mirror should not be fetched")
+
+    monkeypatch.setattr(Repository, "fetch_mirror", fetch_mirror)
+
+    # Act
+    files = Repository.read_files_from_url(
+        ["flavors.yaml"], repo_url=str(source_dir), commit=commit
+    )
+
+    # Assert
+    assert files == {"flavors.yaml": b"flavors"}
+
+
+def test_checkout_repo_shallow_fallback(
+    caplog: pytest.LogCaptureFixture, mirror_cache_dir: Path, tmp_path: Path
+) -> None:
+    # Arrange
+    source_dir = tmp_path / "source"
+    commit = create_git_repo(source_dir, {"flavors.yaml": b"flavors"})
+
+    checkout_dir = tmp_path / "checkout"
+    checkout_dir.mkdir()
+
+    # Act
+    # libgit2 does not support shallow fetches of local repositories
+    Repository.checkout_repo(
+        checkout_dir,
+        repo_url=str(source_dir),
+        commit=commit,
+        use_mirror=False,
+        shallow=True,
+    )
+
+    # Assert
+    assert (checkout_dir / "flavors.yaml").read_bytes() == b"flavors"
+    assert "falling back to full history" in caplog.text
+    assert not mirror_cache_dir.exists()
@@ -331,3 +331,59 @@ def test_script_upload(
         assert any("Uploaded file" in record.message for record in caplog.records), (
             "Expected a upload file log entry"
         )
+
+
+def test_script_upload_multiple_files(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    github_token: str,
+    artifact_for_upload: Path,
+) -> None:
+    other_artifact = artifact_for_upload.with_name("other_artifact.log")
+    other_artifact.write_text("Everything is still fine")
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            "//api.github.com:443/repos/gardenlinux/gardenlinux",
+            json=REPO_JSON,
+            status_code=200,
+        )
+
+        m.get(
+            f"//api.github.com:443/repos/gardenlinux/gardenlinux/releases/tags/{TEST_GARDENLINUX_RELEASE_MINOR}",
+            json=RELEASE_JSON,
+            status_code=200,
+        )
+
+        for name in ("artifact.log", "other_artifact.log"):
+            m.post(
+                f"//uploads.github.com:443/repos/gardenlinux/gardenlinux/releases/1/assets?label=&name={name}",
+                json={"name": name},
+                status_code=201,
+            )
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "gh",
+                "upload",
+                "--owner",
+                "gardenlinux",
+                "--repo",
+                "gardenlinux",
+                "--release_id",
+                TEST_GARDENLINUX_RELEASE_MINOR,
+                "--file_path",
+                str(artifact_for_upload),
+                str(other_artifact),
+                "--max-workers",
+                "2",
+            ],
+        )
+
+        gh.main()
+
+        assert "Uploaded 2 of 2 files" in caplog.text, (
+            "Expected an upload summary log entry"
+        )
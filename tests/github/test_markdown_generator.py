@@ -1,9 +1,16 @@
+import gzip
+from pathlib import Path
+from threading import Barrier
+from typing import Any
+
 import pytest
 import requests_mock
 from moto import mock_aws
+from requests import HTTPError
 
+from gardenlinux.apt import DebsrcFile, GardenLinuxRepo
 from gardenlinux.constants import GLVD_BASE_URL
-from gardenlinux.github.release import Release
+from gardenlinux.github.release import Release, ReleaseImagesMetadata
 from gardenlinux.github.release.notes import MarkdownGenerator
 from gardenlinux.s3.bucket import Bucket
 
@@ -217,3 +224,135 @@ def test_github_minor_release_page(
         )
 
         assert str(generator) == release_fixture_path.read_text()
+
+
+def test_release_notes_prefetch(
+    monkeypatch: pytest.MonkeyPatch, github_token: str
+) -> None:
+    # Arrange
+    # Every source waits for all others, so the sources must run concurrently
+    barrier = Barrier(5, timeout=5)
+
+    def get_source(value: Any) -> Any:
+        barrier.wait()
+        return value
+
+    def get_grouped_flavors_metadata(self: ReleaseImagesMetadata) -> Any:
+        barrier.wait()
+        raise RuntimeError("S3 is unavailable")
+
+    monkeypatch.setattr(
+        ReleaseImagesMetadata,
+        "changes_and_cves_list",
+        property(lambda self: get_source({})),
+    )
+
+    monkeypatch.setattr(
+        ReleaseImagesMetadata,
+        "grouped_flavors_metadata",
+        property(get_grouped_flavors_metadata),
+    )
+
+    monkeypatch.setattr(
+        ReleaseImagesMetadata,
+        "package_list",
+        property(lambda self: get_source(DebsrcFile())),
+    )
+
+    monkeypatch.setattr(
+        GardenLinuxRepo,
+        "get_packages_versions",
+        lambda self: get_source([("example", self.dist)]),
+    )
+
+    release = Release(REPO_NAME)
+    release.tag = TEST_GARDENLINUX_RELEASE_MINOR
+    release.commitish = TEST_GARDENLINUX_COMMIT
+
+    generator = MarkdownGenerator(release, TEST_GARDENLINUX_RELEASE_BUCKET_NAME)
+
+    # Act
+    failed_sources = generator.prefetch()
+
+    # Assert
+    assert list(failed_sources) == ["grouped_flavors_metadata"]
+    assert "`1877.2` | `1877.3`" in generator.compared_package_versions_table
+
+    with pytest.raises(RuntimeError, match="grouped_flavors_metadata"):
+        str(generator)
+
+
+def test_release_images_metadata_failed_requests_raise(tmp_path: Path) -> None:
+    # Arrange
+    metadata = ReleaseImagesMetadata(
+        TEST_GARDENLINUX_RELEASE_MINOR,
+        TEST_GARDENLINUX_COMMIT,
+        TEST_GARDENLINUX_RELEASE_BUCKET_NAME,
+        deb_repo_base_url="https://mirror.example.org/gardenlinux/",
+        glvd_base_url="https://glvd.example.org/v1",
+        cache_dir=tmp_path,
+    )
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://mirror.example.org/gardenlinux/dists/1877.3/main/binary-amd64/Packages.gz",
+            status_code=404,
+        )
+
+        m.get(
+            f"https://glvd.example.org/v1/releaseNotes/{TEST_GARDENLINUX_RELEASE_MINOR}",
+            status_code=503,
+        )
+
+        # Act / Assert
+        with pytest.raises(HTTPError):
+            metadata.package_list
+
+        with pytest.raises(HTTPError):
+            metadata.changes_and_cves_list
+
+
+def test_release_images_metadata_package_list_cache(tmp_path: Path) -> None:
+    # Arrange
+    packages_url = "https://mirror.example.org/gardenlinux/dists/1877.3/main/binary-amd64/Packages.gz"
+    last_modified = "Mon, 06 Oct 2025 08:00:00 GMT"
+
+    packages_data = gzip.compress(
+        b"Package: curl\nVersion: 8.14.1-2gl0\n\nPackage: runc\nVersion: 1.3.0-1gl0\n"
+    )
+
+    metadata = ReleaseImagesMetadata(
+        TEST_GARDENLINUX_RELEASE_MINOR,
+        TEST_GARDENLINUX_COMMIT,
+        TEST_GARDENLINUX_RELEASE_BUCKET_NAME,
+        deb_repo_base_url="https://mirror.example.org/gardenlinux/",
+        cache_dir=tmp_path,
+    )
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            packages_url,
+            [
+                {"content": packages_data, "headers": {"Last-Modified": last_modified}},
+                {"status_code": 304},
+            ],
+        )
+
+        # Act
+        package_list = metadata.package_list
+        cached_package_list = metadata.package_list
+
+        # Assert
+        assert m.call_count == 2
+        assert "If-Modified-Since" not in m.request_history[0].headers
+        assert m.request_history[1].headers["If-Modified-Since"] == last_modified
+
+    assert [package.deb_source for package in package_list.values()] == [
+        "curl",
+        "runc",
+    ]
+
+    assert [package.deb_version for package in cached_package_list.values()] == [
+        "8.14.1-2gl0",
+        "1.3.0-1gl0",
+    ]
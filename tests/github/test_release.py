@@ -1,14 +1,24 @@
+from pathlib import Path
+from typing import List
+
 import pytest
 import requests_mock
 from github import GithubException
 
+import gardenlinux.github.release.release
 from gardenlinux.github.release import Release
 
 from ..constants import (
     TEST_GARDENLINUX_COMMIT,
     TEST_GARDENLINUX_RELEASE_MINOR,
 )
-from .constants import REPO_JSON
+from .constants import RELEASE_JSON, REPO_JSON
+
+ASSET_JSON = {
+    "url": "https://api.github.com/repos/gardenlinux/gardenlinux/releases/assets/2",
+    "id": 2,
+    "name": "artifact.log",
+}
 
 
 def test_release(caplog: pytest.LogCaptureFixture, github_token: str) -> None:
@@ -98,3 +108,117 @@ def test_release_set_pre_release(github_token: str) -> None:
 
     release.is_pre_release = True
     assert release.is_pre_release, "Set is_pre_release to True"
+
+
+def test_release_upload_asset_reuses_github_objects(
+    github_token: str, artifact_for_upload: Path
+) -> None:
+    with requests_mock.Mocker() as m:
+        m.get(
+            "//api.github.com:443/repos/gardenlinux/gardenlinux",
+            json=REPO_JSON,
+            status_code=200,
+        )
+
+        m.get(
+            "//api.github.com:443/repos/gardenlinux/gardenlinux/releases/1",
+            json=RELEASE_JSON,
+            status_code=200,
+        )
+
+        m.post(
+            "//uploads.github.com:443/repos/gardenlinux/gardenlinux/releases/1/assets?label=&name=artifact.log",
+            [
+                {"json": ASSET_JSON, "status_code": 201},
+                {"json": ASSET_JSON, "status_code": 201},
+            ],
+        )
+
+        m.delete(
+            "//api.github.com:443/repos/gardenlinux/gardenlinux/releases/assets/2",
+            status_code=204,
+        )
+
+        release = Release.get(1, "gardenlinux", "gardenlinux", token="test")
+
+        # Act
+        release.upload_asset(artifact_for_upload)
+        release.upload_asset(artifact_for_upload, overwrite=True)
+
+        # Assert
+        requests = [(r.method, r.path) for r in m.request_history]
+
+        assert requests == [
+            ("GET", "/repos/gardenlinux/gardenlinux"),
+            ("GET", "/repos/gardenlinux/gardenlinux/releases/1"),
+            ("POST", "/repos/gardenlinux/gardenlinux/releases/1/assets"),
+            ("DELETE", "/repos/gardenlinux/gardenlinux/releases/assets/2"),
+            ("POST", "/repos/gardenlinux/gardenlinux/releases/1/assets"),
+        ]
+
+        assert release.get_asset_by_name("artifact.log").id == 2
+
+
+def test_release_upload_assets(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    github_token: str,
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    waits: List[float] = []
+    monkeypatch.setattr(gardenlinux.github.release.release, "sleep", waits.append)
+
+    for name in ("a.log", "b.log", "c.log"):
+        (tmp_path / name).write_text(name)
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            "//api.github.com:443/repos/gardenlinux/gardenlinux",
+            json=REPO_JSON,
+            status_code=200,
+        )
+
+        m.get(
+            "//api.github.com:443/repos/gardenlinux/gardenlinux/releases/1",
+            json=RELEASE_JSON,
+            status_code=200,
+        )
+
+        m.post(
+            "//uploads.github.com:443/repos/gardenlinux/gardenlinux/releases/1/assets?label=&name=a.log",
+            [
+                {
+                    "json": {"message": "You have exceeded a secondary rate limit"},
+                    "headers": {"retry-after": "7"},
+                    "status_code": 403,
+                },
+                {"json": {**ASSET_JSON, "name": "a.log"}, "status_code": 201},
+            ],
+        )
+
+        m.post(
+            "//uploads.github.com:443/repos/gardenlinux/gardenlinux/releases/1/assets?label=&name=b.log",
+            json={**ASSET_JSON, "id": 3, "name": "b.log"},
+            status_code=201,
+        )
+
+        m.post(
+            "//uploads.github.com:443/repos/gardenlinux/gardenlinux/releases/1/assets?label=&name=c.log",
+            json={"message": "Validation Failed"},
+            status_code=422,
+        )
+
+        release = Release.get(1, "gardenlinux", "gardenlinux", token="test")
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="Failed to upload 1 files: c.log"):
+            release.upload_assets(
+                [tmp_path / "a.log", tmp_path / "b.log", tmp_path / "c.log"],
+                max_workers=2,
+            )
+
+        assert waits == [7]
+        assert "Uploaded 2 of 3 files" in caplog.text
+        assert release.get_asset_by_name("a.log").id == 2
+        assert release.get_asset_by_name("b.log").id == 3
@@ -0,0 +1,151 @@
+import json
+from io import BytesIO
+from pathlib import Path
+from typing import Any, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from gardenlinux.github import Client
+
+from .constants import RELEASE_JSON, REPO_JSON
+
+
+class FakeGitHubServer(object):
+    def __init__(self) -> None:
+        self.requests: List[PreparedRequest] = []
+
+    def send(
+        self, adapter: HTTPAdapter, request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        self.requests.append(request)
+
+        response = Response()
+        response.raw = BytesIO()
+        response.request = request
+        response.url = str(request.url)
+        response.headers["X-RateLimit-Limit"] = "5000"
+        response.headers["X-RateLimit-Remaining"] = str(5000 - len(self.requests))
+
+        url = str(request.url)
+        data: Any
+
+        if "/releases/1/assets" in url:
+            page = int(parse_qs(urlparse(url).query).get("page", ["1"])[0])
+            etag = f'"assets-{page}"'
+            data = [{"id": page, "name": f"asset{page}.tar.gz"}]
+
+            if page == 1:
+                response.headers["Link"] = f'<{url}&page=2>; rel="next"'
+        elif url.endswith("/releases/1"):
+            etag = '"release"'
+            data = RELEASE_JSON
+        else:
+            etag = '"repo"'
+            data = REPO_JSON
+
+        if request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response.headers["Content-Type"] = "application/json; charset=utf-8"
+            response.headers["ETag"] = etag
+            response._content = json.dumps(data).encode("utf-8")
+
+        return response
+
+
+@pytest.fixture
+def github_server(monkeypatch: pytest.MonkeyPatch) -> FakeGitHubServer:
+    server = FakeGitHubServer()
+
+    def send(adapter: HTTPAdapter, request: PreparedRequest, **kwargs: Any) -> Response:
+        return server.send(adapter, request, **kwargs)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+
+    return server
+
+
+def test_client_response_cache(
+    github_server: FakeGitHubServer, github_token: str, tmp_path: Path
+) -> None:
+    # Arrange
+    client = Client(cache_dir=tmp_path)
+
+    # Act
+    client.get_repo("gardenlinux/gardenlinux")
+    repo = Client(cache_dir=tmp_path).get_repo("gardenlinux/gardenlinux")
+    client.get_repo("gardenlinux/gardenlinux")
+
+    # Assert
+    assert repo.full_name == "gardenlinux/gardenlinux"
+    assert "If-None-Match" not in github_server.requests[0].headers
+    assert github_server.requests[2].headers["If-None-Match"] == '"repo"'
+
+    assert client.cache_stats == {
+        "hits": 1,
+        "misses": 1,
+        "rate_limit_remaining": 4997,
+    }
+
+
+def test_client_response_cache_release(
+    github_server: FakeGitHubServer, github_token: str, tmp_path: Path
+) -> None:
+    # Arrange
+    client = Client(cache_dir=tmp_path)
+    repo = client.get_repo("gardenlinux/gardenlinux")
+
+    # Act
+    client.get_release(repo, 1)
+    release = client.get_release(repo, 1)
+
+    # Assert
+    assert release.id == 1
+    assert release.tag_name == RELEASE_JSON["tag_name"]
+    assert github_server.requests[2].headers["If-None-Match"] == '"release"'
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert client.cache_stats["hits"] == 1
+    assert client.cache_stats["misses"] == 2
+
+
+def test_client_response_cache_release_assets(
+    github_server: FakeGitHubServer, github_token: str, tmp_path: Path
+) -> None:
+    # Arrange
+    client = Client(cache_dir=tmp_path)
+    release = client.get_release(client.get_repo("gardenlinux/gardenlinux"), 1)
+
+    # Act
+    client.get_release_assets(release)
+    assets = client.get_release_assets(release)
+
+    # Assert
+    assert [asset.name for asset in assets] == ["asset1.tar.gz", "asset2.tar.gz"]
+    assert github_server.requests[4].headers["If-None-Match"] == '"assets-1"'
+    assert github_server.requests[5].headers["If-None-Match"] == '"assets-2"'
+    assert client.cache_stats["hits"] == 2
+    assert client.cache_stats["misses"] == 4
+
+
+def test_client_without_response_cache(
+    github_server: FakeGitHubServer, github_token: str
+) -> None:
+    # Arrange
+    client = Client()
+
+    # Act
+    client.get_repo("gardenlinux/gardenlinux")
+    client.get_repo("gardenlinux/gardenlinux")
+
+    # Assert
+    assert "If-None-Match" not in github_server.requests[1].headers
+    assert client.cache_stats == {
+        "hits": 0,
+        "misses": 0,
+        "rate_limit_remaining": 4998,
+    }
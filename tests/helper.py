@@ -1,7 +1,10 @@
 import shlex
 import subprocess
+from pathlib import Path
 from typing import Any, Optional
 
+import pygit2
+
 
 def spawn_background_process(
     cmd: str, stdout: Optional[Any] = None, stderr: Optional[Any] = None
@@ -23,3 +26,33 @@ def call_command(cmd: str) -> str:
     except subprocess.CalledProcessError as e:
         error_message = e.stderr.decode("utf-8")
         return f"An error occurred: {error_message}"
+
+
+def create_git_repo(path: Path, files: dict[str, bytes]) -> str:
+    """
+    Commits the files given on "main" of the Git repository, which is created
+    if needed, and returns the commit ID.
+    """
+
+    repo = pygit2.init_repository(path, initial_head="main")
+    signature = pygit2.Signature("Garden Linux", "gardenlinux@example.com")
+
+    for name, data in files.items():
+        file_path = path / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+        repo.index.add(name)
+
+    repo.index.write()
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+
+    return str(
+        repo.create_commit(
+            "HEAD",
+            signature,
+            signature,
+            "test",
+            repo.index.write_tree(),
+            parents,
+        )
+    )
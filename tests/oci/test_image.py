@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+from gardenlinux.oci import Image
+
+CHANGES = [
+    {"Path": "/a", "Kind": 1},
+    {"Path": "/a/b", "Kind": 1},
+    {"Path": "/a/b/c.txt", "Kind": 0},
+    {"Path": "/ümlaut", "Kind": 2},
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+def test_image_iter_json_array(chunk_size: int) -> None:
+    data = json.dumps(CHANGES, ensure_ascii=False).encode("utf-8")
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    assert list(Image._iter_json_array(chunks)) == CHANGES
+
+
+@pytest.mark.parametrize("data", [b"null", b"[]", b" [ ] "])
+def test_image_iter_json_array_empty(data: bytes) -> None:
+    assert list(Image._iter_json_array([data[:1], data[1:]])) == []
+
+
+@pytest.mark.parametrize("data", [b"{}", b'[{"Path": "/a"', b""])
+def test_image_iter_json_array_invalid(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        list(Image._iter_json_array([data]))
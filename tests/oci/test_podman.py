@@ -1,8 +1,13 @@
+import gzip
 from contextlib import contextmanager
+from hashlib import sha256
+from io import BytesIO
+from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any
 
 import pytest
+from podman.errors import ImageNotFound
 
 from gardenlinux.oci import Podman
 from gardenlinux.oci.podman_context import PodmanContext
@@ -53,3 +58,200 @@ def test_podmancontext_podman_argument() -> None:
             ValueError, match="Podman context wrapped functions can not be called with"
         ):
             Podman().get_image_id("container-test", podman=object())
+
+
+def test_podman_load_oci_archives_from_directory() -> None:
+    with PodmanContext() as podman_context, TemporaryDirectory() as tmpdir:
+        podman = Podman()
+
+        image_id = podman.build(f"{TEST_DATA_DIR}/oci/build", podman=podman_context)
+
+        try:
+            for name in ("c", "a", "b"):
+                podman.save_oci_archive(
+                    image_id, f"{tmpdir}/{name}.oci", podman=podman_context
+                )
+
+            with open(f"{tmpdir}/broken.oci", "wb") as fp:
+                fp.write(b"broken")
+
+            with pytest.raises(RuntimeError, match="broken.oci"):
+                podman.load_oci_archives_from_directory(
+                    tmpdir, podman=podman_context, max_workers=2
+                )
+
+            result = podman.load_oci_archives_from_directory(
+                tmpdir, podman=podman_context, max_workers=2, ignore_errors=True
+            )
+
+            assert list(result.keys()) == ["a.oci", "b.oci", "c.oci"]
+            assert set(result.values()) == {image_id}
+        finally:
+            image = podman_context.images.get(image_id)
+            podman_context.images.remove(image, force=True)
+
+
+def test_podman_save_oci_archive_digest_and_compression() -> None:
+    with PodmanContext() as podman_context, TemporaryDirectory() as tmpdir:
+        podman = Podman()
+
+        image_id = podman.build(f"{TEST_DATA_DIR}/oci/build", podman=podman_context)
+
+        try:
+            digest, size = podman.save_oci_archive(
+                image_id, f"{tmpdir}/archive.oci", podman=podman_context
+            )
+
+            archive_data = Path(tmpdir, "archive.oci").read_bytes()
+
+            assert size == len(archive_data)
+            assert digest == f"sha256:{sha256(archive_data).hexdigest()}"
+
+            with BytesIO() as fp:
+                digest, size = podman.save_oci_archive_to_fileobj(
+                    image_id, fp, podman=podman_context, compression="gzip"
+                )
+
+                compressed_archive_data = fp.getvalue()
+
+            assert size == len(compressed_archive_data)
+            assert digest == f"sha256:{sha256(compressed_archive_data).hexdigest()}"
+            assert len(gzip.decompress(compressed_archive_data)) > 0
+
+            with pytest.raises(RuntimeError, match="Unsupported"):
+                podman.save_oci_archive_to_fileobj(
+                    image_id, BytesIO(), podman=podman_context, compression="lzma"
+                )
+        finally:
+            image = podman_context.images.get(image_id)
+            podman_context.images.remove(image, force=True)
+
+
+def test_podman_save_oci_archive_removes_file_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with PodmanContext() as podman_context, TemporaryDirectory() as tmpdir:
+        podman = Podman()
+        oci_archive_file_name = Path(tmpdir, "archive.oci")
+
+        with pytest.raises(ImageNotFound):
+            podman.save_oci_archive(
+                "gardenlinux-missing-image",
+                oci_archive_file_name,
+                podman=podman_context,
+            )
+
+        assert not oci_archive_file_name.exists()
+
+        image_id = podman.build(f"{TEST_DATA_DIR}/oci/build", podman=podman_context)
+
+        def save_oci_archive_to_fileobj(
+            self: Podman, image_id: str, fp: Any, **kwargs: Any
+        ) -> Any:
+            fp.write(b"partial")
+            raise RuntimeError("Interrupted")
+
+        monkeypatch.setattr(
+            Podman, "save_oci_archive_to_fileobj", save_oci_archive_to_fileobj
+        )
+
+        try:
+            with pytest.raises(RuntimeError, match="Interrupted"):
+                podman.save_oci_archive(
+                    image_id, oci_archive_file_name, podman=podman_context
+                )
+
+            assert not oci_archive_file_name.exists()
+        finally:
+            image = podman_context.images.get(image_id)
+            podman_context.images.remove(image, force=True)
+
+
+@pytest.mark.parametrize(
+    "platform, suffix",
+    [
+        ("linux/amd64", "amd64"),
+        ("linux/arm64", "arm64"),
+        ("linux/arm64/v8", "arm64-v8"),
+    ],
+)
+def test_podman_get_platform_suffix(platform: str, suffix: str) -> None:
+    assert Podman.get_platform_suffix(platform) == suffix
+
+
+def test_podman_build_and_save_oci_archives_for_platforms_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def build_and_save_oci_archive(
+        self: Podman,
+        build_path: str,
+        oci_archive_file_name: Path,
+        podman: PodmanContext,
+        platform: str,
+        **kwargs: Any,
+    ) -> dict[str, str]:
+        if platform == "linux/arm64":
+            raise RuntimeError("Build failed")
+
+        return {oci_archive_file_name.name: platform}
+
+    monkeypatch.setattr(
+        Podman, "build_and_save_oci_archive", build_and_save_oci_archive
+    )
+
+    platforms = ["linux/amd64", "linux/arm64"]
+
+    with pytest.raises(RuntimeError, match="platforms: linux/arm64$"):
+        Podman().build_and_save_oci_archives_for_platforms(
+            f"{TEST_DATA_DIR}/oci/build",
+            "/tmp/archive.oci",
+            platforms,
+            podman=PodmanContext(),
+        )
+
+    result = Podman().build_and_save_oci_archives_for_platforms(
+        f"{TEST_DATA_DIR}/oci/build",
+        "/tmp/archive.oci",
+        platforms,
+        podman=PodmanContext(),
+        ignore_errors=True,
+    )
+
+    assert result == {"linux/amd64": {"archive-amd64.oci": "linux/amd64"}}
+
+
+def test_podman_get_platform_suffix_invalid() -> None:
+    with pytest.raises(RuntimeError, match="Failed to parse OCI platform"):
+        Podman.get_platform_suffix("amd64")
+
+
+def test_podman_build_and_save_oci_archives_for_platforms(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def build_and_save_oci_archive(
+        self: Podman,
+        build_path: str,
+        oci_archive_file_name: Path,
+        podman: PodmanContext,
+        platform: str,
+        oci_tag: str,
+        **kwargs: Any,
+    ) -> dict[str, str]:
+        return {oci_archive_file_name.name: f"{platform}:{oci_tag}"}
+
+    monkeypatch.setattr(
+        Podman, "build_and_save_oci_archive", build_and_save_oci_archive
+    )
+
+    result = Podman().build_and_save_oci_archives_for_platforms(
+        f"{TEST_DATA_DIR}/oci/build",
+        "/tmp/archive.oci",
+        ["linux/amd64", "linux/arm64"],
+        podman=PodmanContext(),
+        oci_tag="container-test:latest",
+    )
+
+    assert result == {
+        "linux/amd64": {"archive-amd64.oci": "linux/amd64:container-test:latest-amd64"},
+        "linux/arm64": {"archive-arm64.oci": "linux/arm64:container-test:latest-arm64"},
+    }
@@ -1,10 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass
-from hashlib import md5, sha256
-from io import BytesIO
 from pathlib import Path
-from typing import Any, Generator
+from typing import Generator
 
 import boto3
 import pytest
@@ -35,26 +33,8 @@ def make_cname(
     return f"{flavor}-{arch}-{version}-{commit[:8]}"
 
 
-# Helpers to compute digests for fake files
-def dummy_digest(data: BytesIO, algo: str) -> Any:
-    """
-    Dummy for file_digest() to compute hashes for in-memory byte streams
-    """
-    content = data.read()
-    data.seek(0)  # Reset byte cursor to start for multiple uses
-
-    if algo == "md5":
-        return md5(content)
-    elif algo == "sha256":
-        return sha256(content)
-    else:
-        raise ValueError(f"Unsupported algo: {algo}")
-
-
 @pytest.fixture(autouse=True)
-def s3_setup(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> Generator[S3Env, None, None]:
+def s3_setup(tmp_path: Path) -> Generator[S3Env, None, None]:
     """
     Provides a clean S3 setup for each test.
     """
@@ -62,7 +42,5 @@ def s3_setup(
         s3 = boto3.resource("s3", region_name=REGION)
         s3.create_bucket(Bucket=BUCKET_NAME)
 
-        monkeypatch.setattr("gardenlinux.s3.s3_artifacts.file_digest", dummy_digest)
-
         cname = make_cname()
         yield S3Env(s3, BUCKET_NAME, tmp_path, cname)
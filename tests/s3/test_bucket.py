@@ -8,7 +8,13 @@ A mock AWS environment is provided by the `s3_setup` fixture found in `conftest.
 """
 
 import io
+from typing import Any
 
+import pytest
+from botocore.config import Config
+
+import gardenlinux.s3.bucket
+from gardenlinux.s3 import SessionCache
 from gardenlinux.s3.bucket import Bucket
 
 from .conftest import S3Env
@@ -100,6 +106,94 @@ def test_read_cache_file_or_filter(s3_setup: S3Env) -> None:
     assert result == ["file.txt", "file2.txt"]
 
 
+def test_read_cache_file_or_filter_full_refresh(s3_setup: S3Env) -> None:
+    """
+    Detect deleted objects with a full refresh only
+    """
+
+    env = s3_setup
+    env.s3.Object(env.bucket_name, "file.txt").put(Body=b"some data")
+    env.s3.Object(env.bucket_name, "file2.txt").put(Body=b"some data")
+
+    bucket = Bucket(env.bucket_name, s3_resource_config={"region_name": REGION})
+    cache_file = env.tmp_path / "s3.cache.json"
+
+    result = bucket.read_cache_file_or_filter(cache_file, 0, Prefix="file")
+    assert result == ["file.txt", "file2.txt"]
+
+    env.s3.Object(env.bucket_name, "file.txt").delete()
+
+    result = bucket.read_cache_file_or_filter(cache_file, 0, Prefix="file")
+    assert result == ["file.txt", "file2.txt"]
+
+    result = bucket.read_cache_file_or_filter(
+        cache_file, 0, full_refresh_ttl=0, Prefix="file"
+    )
+    assert result == ["file2.txt"]
+
+
+def test_read_cache_file_or_filter_key_before_last_key(
+    monkeypatch: pytest.MonkeyPatch, s3_setup: S3Env
+) -> None:
+    """
+    Refresh incrementally by default and find keys sorting before the last
+    key seen with the next full refresh
+    """
+
+    env = s3_setup
+    env.s3.Object(env.bucket_name, "file.txt").put(Body=b"some data")
+    env.s3.Object(env.bucket_name, "file2.txt").put(Body=b"some data")
+
+    bucket = Bucket(env.bucket_name, s3_resource_config={"region_name": REGION})
+    cache_file = env.tmp_path / "s3.cache.json"
+    now = gardenlinux.s3.bucket.time()
+
+    monkeypatch.setattr(gardenlinux.s3.bucket, "time", lambda: now)
+
+    result = bucket.read_cache_file_or_filter(cache_file, 0, Prefix="file")
+    assert result == ["file.txt", "file2.txt"]
+
+    env.s3.Object(env.bucket_name, "file1.txt").put(Body=b"some data")
+    env.s3.Object(env.bucket_name, "file3.txt").put(Body=b"some data")
+
+    monkeypatch.setattr(gardenlinux.s3.bucket, "time", lambda: now + 3600)
+
+    result = bucket.read_cache_file_or_filter(cache_file, Prefix="file")
+    assert result == ["file.txt", "file2.txt", "file3.txt"]
+
+    monkeypatch.setattr(gardenlinux.s3.bucket, "time", lambda: now + 86400)
+
+    result = bucket.read_cache_file_or_filter(cache_file, Prefix="file")
+    assert result == ["file.txt", "file1.txt", "file2.txt", "file3.txt"]
+
+
+def test_read_cache_file_or_filter_other_filters(s3_setup: S3Env) -> None:
+    """
+    Cache listings filtered by more than a prefix per filter
+    """
+
+    env = s3_setup
+    env.s3.Object(env.bucket_name, "file.txt").put(Body=b"some data")
+    env.s3.Object(env.bucket_name, "dir/file.txt").put(Body=b"some data")
+
+    bucket = Bucket(env.bucket_name, s3_resource_config={"region_name": REGION})
+    cache_file = env.tmp_path / "s3.cache.json"
+
+    result = bucket.read_cache_file_or_filter(cache_file, Delimiter="/")
+    assert result == ["file.txt"]
+
+    env.s3.Object(env.bucket_name, "file2.txt").put(Body=b"some data")
+
+    result = bucket.read_cache_file_or_filter(cache_file, Delimiter="/")
+    assert result == ["file.txt"]
+
+    result = bucket.read_cache_file_or_filter(cache_file, Prefix="dir/")
+    assert result == ["dir/file.txt"]
+
+    result = bucket.read_cache_file_or_filter(cache_file, 0, Delimiter="/")
+    assert result == ["file.txt", "file2.txt"]
+
+
 def test_upload_fileobj(s3_setup: S3Env) -> None:
     """
     Upload a file-like in-memory object to the bucket
@@ -156,3 +250,133 @@ def test_getattr_delegates(s3_setup: S3Env) -> None:
     # Assert
     # __getattr__ should delegate this to the underlying boto3 Bucket object
     assert bucket.name == env.bucket_name
+
+
+def test_upload_files(s3_setup: S3Env) -> None:
+    """
+    Upload multiple files concurrently and report their throughput
+    """
+    # Arrange
+    env = s3_setup
+
+    uploads = []
+
+    for index in range(3):
+        test_file = env.tmp_path / f"example{index}.txt"
+        test_file.write_bytes(b"hello moto" * 1024)
+
+        uploads.append((str(test_file), f"example{index}.txt", None))
+
+    # Act
+    bucket = Bucket(env.bucket_name, s3_resource_config={"region_name": REGION})
+    throughput = bucket.upload_files(uploads)
+
+    # Assert
+    assert sorted(throughput.keys()) == [
+        "example0.txt",
+        "example1.txt",
+        "example2.txt",
+    ]
+
+    assert sorted(obj.key for obj in bucket.objects) == sorted(throughput.keys())
+
+
+def test_upload_files_failure(s3_setup: S3Env) -> None:
+    """
+    Upload all files possible and raise an error for the failed ones afterwards
+    """
+    # Arrange
+    env = s3_setup
+
+    test_file = env.tmp_path / "example.txt"
+    test_file.write_text("hello moto")
+
+    uploads = [
+        (str(env.tmp_path / "missing.txt"), "missing.txt", None),
+        (str(test_file), "example.txt", None),
+    ]
+
+    # Act
+    bucket = Bucket(env.bucket_name, s3_resource_config={"region_name": REGION})
+
+    with pytest.raises(RuntimeError, match="missing.txt"):
+        bucket.upload_files(uploads)
+
+    # Assert
+    assert [obj.key for obj in bucket.objects] == ["example.txt"]
+
+
+def test_delete_keys(monkeypatch: pytest.MonkeyPatch, s3_setup: S3Env) -> None:
+    """
+    Delete keys in batches of the maximum number of keys allowed
+    """
+    # Arrange
+    env = s3_setup
+    monkeypatch.setattr(gardenlinux.s3.bucket, "S3_DELETE_OBJECTS_MAX_KEYS", 2)
+
+    bucket = Bucket(env.bucket_name, s3_resource_config={"region_name": REGION})
+
+    for index in range(5):
+        bucket.put_object(Key=f"example{index}.txt", Body=b"hello moto")
+
+    delete_objects_calls = []
+    delete_objects = bucket._bucket.delete_objects
+
+    def delete_objects_spy(**kwargs: Any) -> Any:
+        delete_objects_calls.append(kwargs)
+        return delete_objects(**kwargs)
+
+    monkeypatch.setattr(bucket._bucket, "delete_objects", delete_objects_spy)
+
+    # Act
+    bucket.delete_keys(f"example{index}.txt" for index in range(4))
+
+    # Assert
+    assert len(delete_objects_calls) == 2
+    assert [obj.key for obj in bucket.objects] == ["example4.txt"]
+
+
+def test_bucket_own_resource(s3_setup: S3Env) -> None:
+    """
+    Buckets get their own S3 resource wrapping the shared S3 client
+    """
+    # Arrange
+    env = s3_setup
+    config = {"region_name": REGION}
+
+    # Act
+    bucket = Bucket(env.bucket_name, s3_resource_config=config)
+    other_bucket = Bucket(env.bucket_name, s3_resource_config=config)
+    limited_bucket = Bucket(
+        env.bucket_name, s3_resource_config=config, max_pool_connections=1
+    )
+
+    # Assert
+    assert bucket._s3_resource is not other_bucket._s3_resource
+    assert bucket.meta.client is other_bucket.meta.client
+    assert bucket.meta.client is SessionCache.get_client(config)
+    assert limited_bucket.meta.client is not bucket.meta.client
+    assert limited_bucket.meta.client.meta.config.max_pool_connections == 1
+    assert "endpoint_url" not in config
+
+
+def test_session_cache_client_config_values(s3_setup: S3Env) -> None:
+    """
+    S3 clients are cached by config values instead of config object identity
+    """
+    # Act
+    client = SessionCache.get_client(
+        {"region_name": REGION, "config": Config(retries={"max_attempts": 2})}
+    )
+
+    same_client = SessionCache.get_client(
+        {"region_name": REGION, "config": Config(retries={"max_attempts": 2})}
+    )
+
+    other_client = SessionCache.get_client(
+        {"region_name": REGION, "config": Config(retries={"max_attempts": 3})}
+    )
+
+    # Assert
+    assert client is same_client
+    assert client is not other_client
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test the `ListingIndex` class in `src/gardenlinux/s3/listing_index.py`.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from gardenlinux.s3.listing_index import ListingIndex
+
+
+def _get_s3_object(key: str) -> dict[str, object]:
+    return {
+        "key": key,
+        "etag": "etag",
+        "size": 1,
+        "last_modified": "2024-01-01T00:00:00+00:00",
+    }
+
+
+def test_listing_index_prefix_query(tmp_path: Path) -> None:
+    """
+    Answer prefix queries from the index
+    """
+    # Arrange
+    listing_index = ListingIndex(tmp_path / "index.db")
+
+    # Act
+    listing_index.update(
+        "",
+        [_get_s3_object(key) for key in ["a/1", "a/2", "ab/1", "b/1"]],
+        1.0,
+        full=True,
+    )
+
+    # Assert
+    assert listing_index.get_keys("a/") == ["a/1", "a/2"]
+    assert listing_index.get_keys("a") == ["a/1", "a/2", "ab/1"]
+    assert listing_index.get_keys() == ["a/1", "a/2", "ab/1", "b/1"]
+    assert listing_index.get_objects("b")[0] == _get_s3_object("b/1")
+
+
+def test_listing_index_incremental_update(tmp_path: Path) -> None:
+    """
+    Keep indexed objects and the last key seen for incremental updates
+    """
+    # Arrange
+    listing_index = ListingIndex(tmp_path / "index.db")
+    listing_index.update("a", [_get_s3_object("a/2")], 1.0, full=True)
+
+    # Act
+    listing_index.update("a", [], 2.0)
+    listing_index.update("a", [_get_s3_object("a/3")], 3.0)
+
+    # Assert
+    assert listing_index.get_keys("a") == ["a/2", "a/3"]
+    assert listing_index.get_listing("a") == {
+        "last_key": "a/3",
+        "refreshed": 3.0,
+        "full_refreshed": 1.0,
+    }
+
+    # Act
+    listing_index.update("a", [_get_s3_object("a/1")], 4.0, full=True)
+
+    # Assert
+    assert listing_index.get_keys("a") == ["a/1"]
+
+
+def test_listing_index_filtered_listing(tmp_path: Path) -> None:
+    """
+    Store listings of other filters separately from the indexed objects
+    """
+    # Arrange
+    listing_index = ListingIndex(tmp_path / "index.db")
+
+    # Act
+    listing_index.update_filtered_listing('{"Delimiter": "/"}', ["a", "b"], 1.0)
+
+    # Assert
+    assert listing_index.get_filtered_listing('{"Delimiter": "/"}') == {
+        "keys": ["a", "b"],
+        "refreshed": 1.0,
+    }
+    assert listing_index.get_filtered_listing("{}") is None
+    assert listing_index.get_keys() == []
+
+
+def test_listing_index_replaces_legacy_cache(tmp_path: Path) -> None:
+    """
+    Replace cache files not being a SQLite database
+    """
+    # Arrange
+    index_file = tmp_path / "s3.cache.json"
+    index_file.write_text('["a/1"]')
+
+    # Act
+    listing_index = ListingIndex(index_file)
+
+    # Assert
+    assert listing_index.get_listing("a") is None
+    assert listing_index.get_keys("a") == []
+
+
+def test_listing_index_locked_raises(tmp_path: Path) -> None:
+    """
+    Keep an index locked by a concurrent process instead of replacing it
+    """
+    # Arrange
+    index_file = tmp_path / "index.db"
+
+    connection = sqlite3.connect(index_file, isolation_level=None)
+    connection.execute("CREATE TABLE other (value TEXT)")
+    connection.execute("BEGIN EXCLUSIVE")
+
+    listing_index = ListingIndex(index_file, timeout=0)
+
+    # Act / Assert
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            listing_index.get_keys()
+    finally:
+        connection.execute("ROLLBACK")
+
+    assert connection.execute("SELECT COUNT(*) FROM other").fetchone() == (0,)
+    connection.close()
@@ -1,7 +1,7 @@
 import re
 import sys
 from typing import Any, Dict, List
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -27,7 +27,7 @@ from .constants import RELEASE_DATA, S3_METADATA
             ],
             "download_to_directory",
             ["test-cname", "some/path"],
-            {},
+            {"suffixes": None},
         ),
         (
             [
@@ -42,6 +42,19 @@ from .constants import RELEASE_DATA, S3_METADATA
             ],
             "upload_from_directory",
             ["test-cname", "some/path"],
+            {"dry_run": False, "transfer_config": ANY, "sync": False},
+        ),
+        (
+            [
+                "__main__.py",
+                "--bucket",
+                "test-bucket",
+                "upload-metadata-index",
+                "--version",
+                "1234.1",
+            ],
+            "upload_metadata_index",
+            ["1234.1"],
             {"dry_run": False},
         ),
     ],
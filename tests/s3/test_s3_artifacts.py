@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 
+from hashlib import md5, sha256
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any, List
 
 import pytest
 import yaml
+from boto3.s3.transfer import TransferConfig
 
 from gardenlinux.s3.s3_artifacts import S3Artifacts
 
@@ -156,6 +159,34 @@ def test_upload_from_directory_with_delete(s3_setup: S3Env) -> None:
     assert f"meta/singles/{env.cname}" in keys
 
 
+def test_upload_from_directory_with_delete_removes_stale(s3_setup: S3Env) -> None:
+    """
+    Test that delete_before_push=True removes objects no longer existing
+    locally.
+    """
+    # Arrange
+    env = s3_setup
+    bucket = env.s3.Bucket(env.bucket_name)
+
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.kernel").write_bytes(b"fake")
+
+    bucket.put_object(Key=f"objects/{env.cname}/{env.cname}.stale", Body=b"stale")
+    bucket.put_object(Key=f"objects/{env.cname}-other/file", Body=b"other")
+
+    artifacts = S3Artifacts(env.bucket_name)
+
+    # Act
+    artifacts.upload_from_directory(env.cname, env.tmp_path, delete_before_push=True)
+
+    # Assert
+    keys = [obj.key for obj in bucket.objects.all()]
+
+    assert f"objects/{env.cname}/{env.cname}.stale" not in keys
+    assert f"objects/{env.cname}/{env.cname}.kernel" in keys
+    assert f"objects/{env.cname}-other/file" in keys
+
+
 def test_upload_from_directory_invalid_dir_raises(s3_setup: S3Env) -> None:
     """Raise RuntimeError if artifacts_dir is invalid"""
     env = s3_setup
@@ -302,3 +333,504 @@ def test_upload_directory_with_requirements_override(s3_setup: S3Env) -> None:
     metadata = yaml.safe_load(meta_obj.get()["Body"].read())
     assert metadata["require_uefi"] is False
     assert metadata["secureboot"] is True
+
+
+def test_upload_from_directory_digests(s3_setup: S3Env) -> None:
+    """
+    Ensure MD5 and SHA256 digests are calculated from the whole artifact.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    artifact_data = b"artifact content" * 1024
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(artifact_data)
+
+    # Act
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    # Assert
+    bucket = env.s3.Bucket(env.bucket_name)
+    meta_obj = bucket.Object(f"meta/singles/{env.cname}").get()
+    metadata = yaml.safe_load(meta_obj["Body"].read())
+
+    paths = {path["name"]: path for path in metadata["paths"]}
+    raw_path = paths[f"{env.cname}.raw"]
+
+    assert raw_path["md5sum"] == md5(artifact_data).hexdigest()
+    assert raw_path["sha256sum"] == sha256(artifact_data).hexdigest()
+
+
+def test_get_file_digests_multipart_etag(s3_setup: S3Env) -> None:
+    """
+    Ensure the calculated ETag matches the one of the uploaded S3 object.
+    """
+    # Arrange
+    env = s3_setup
+    chunksize = 5 * 1024 * 1024
+    artifact = env.tmp_path / "artifact"
+    artifact.write_bytes(b"0123456789abcdef" * (chunksize // 8))
+
+    bucket = env.s3.Bucket(env.bucket_name)
+    bucket.upload_file(
+        str(artifact),
+        "artifact",
+        Config=TransferConfig(
+            multipart_threshold=chunksize, multipart_chunksize=chunksize
+        ),
+    )
+
+    # Act
+    digests = S3Artifacts.get_file_digests(artifact, chunksize, chunksize)
+    single_part_digests = S3Artifacts.get_file_digests(
+        artifact, multipart_threshold=3 * chunksize
+    )
+
+    # Assert
+    assert digests["etag"] == bucket.Object("artifact").e_tag.strip('"')
+    assert digests["etag"].endswith("-2")
+    assert digests["md5sum"] == single_part_digests["etag"]
+    assert digests["sha256sum"] == sha256(artifact.read_bytes()).hexdigest()
+
+
+def test_upload_from_directory_metadata_after_artifacts(
+    monkeypatch: pytest.MonkeyPatch, s3_setup: S3Env
+) -> None:
+    """
+    Ensure metadata is only uploaded if all artifacts have been uploaded.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw")
+
+    def upload_files(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError("Failed to upload to S3")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    monkeypatch.setattr(artifacts.bucket, "upload_files", upload_files)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    # Assert
+    bucket = env.s3.Bucket(env.bucket_name)
+    assert list(bucket.objects.all()) == []
+
+
+def test_upload_from_directory_transfer_config(s3_setup: S3Env) -> None:
+    """
+    Ensure artifacts are uploaded with the transfer configuration given.
+    """
+    # Arrange
+    env = s3_setup
+    chunksize = 5 * 1024 * 1024
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"0" * (chunksize + 1))
+
+    # Act
+    artifacts = S3Artifacts(env.bucket_name)
+    throughput = artifacts.upload_from_directory(
+        env.cname,
+        env.tmp_path,
+        transfer_config=S3Artifacts.get_transfer_config(chunksize, 2),
+    )
+
+    # Assert
+    raw_key = f"objects/{env.cname}/{env.cname}.raw"
+
+    assert raw_key in throughput
+    assert env.s3.Bucket(env.bucket_name).Object(raw_key).e_tag.endswith('-2"')
+
+
+def test_upload_from_directory_sync(
+    monkeypatch: pytest.MonkeyPatch, s3_setup: S3Env
+) -> None:
+    """
+    Ensure sync mode only uploads artifacts and metadata changed in S3.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw")
+    (env.tmp_path / f"{env.cname}.qcow2").write_bytes(b"qcow2")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    uploaded_keys: List[str] = []
+    upload_files = artifacts.bucket.upload_files
+    upload_fileobj = artifacts.bucket.upload_fileobj
+
+    def upload_files_spy(uploads: Any, *args: Any, **kwargs: Any) -> Any:
+        uploads = list(uploads)
+        uploaded_keys.extend(key for _, key, _ in uploads)
+        return upload_files(uploads, *args, **kwargs)
+
+    def upload_fileobj_spy(fp: Any, key: str, *args: Any, **kwargs: Any) -> None:
+        uploaded_keys.append(key)
+        upload_fileobj(fp, key, *args, **kwargs)
+
+    monkeypatch.setattr(artifacts.bucket, "upload_files", upload_files_spy)
+    monkeypatch.setattr(artifacts.bucket, "upload_fileobj", upload_fileobj_spy)
+
+    # Act
+    artifacts.upload_from_directory(env.cname, env.tmp_path, sync=True)
+    unchanged_keys = list(uploaded_keys)
+
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw changed")
+    artifacts.upload_from_directory(env.cname, env.tmp_path, sync=True)
+
+    # Assert
+    raw_key = f"objects/{env.cname}/{env.cname}.raw"
+    bucket = env.s3.Bucket(env.bucket_name)
+    metadata = yaml.safe_load(
+        bucket.Object(f"meta/singles/{env.cname}").get()["Body"].read()
+    )
+
+    assert unchanged_keys == []
+    assert uploaded_keys == [raw_key, f"meta/singles/{env.cname}"]
+    assert bucket.Object(raw_key).get()["Body"].read() == b"raw changed"
+    assert sha256(b"raw changed").hexdigest() in [
+        path["sha256sum"] for path in metadata["paths"]
+    ]
+
+
+def test_upload_from_directory_sync_sha256sum_tag(s3_setup: S3Env) -> None:
+    """
+    Ensure sync mode compares the "sha256sum" tag if the ETag differs
+    because of a different multipart chunk size.
+    """
+    # Arrange
+    env = s3_setup
+    chunksize = 5 * 1024 * 1024
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"0" * (chunksize + 1))
+
+    artifacts = S3Artifacts(env.bucket_name)
+
+    artifacts.upload_from_directory(
+        env.cname,
+        env.tmp_path,
+        transfer_config=S3Artifacts.get_transfer_config(chunksize),
+    )
+
+    # Act
+    throughput = artifacts.upload_from_directory(env.cname, env.tmp_path, sync=True)
+
+    # Assert
+    assert throughput == {}
+
+
+def test_upload_from_directory_sync_updates_tags(s3_setup: S3Env) -> None:
+    """
+    Ensure sync mode updates stale tags of unchanged artifacts in place.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    raw_key = f"objects/{env.cname}/{env.cname}.raw"
+    client = env.s3.meta.client
+
+    tags = client.get_object_tagging(Bucket=env.bucket_name, Key=raw_key)["TagSet"]
+
+    client.put_object_tagging(
+        Bucket=env.bucket_name,
+        Key=raw_key,
+        Tagging={
+            "TagSet": [
+                {"Key": "committish", "Value": "stale"}
+                if tag["Key"] == "committish"
+                else tag
+                for tag in tags
+            ]
+        },
+    )
+
+    # Act
+    throughput = artifacts.upload_from_directory(env.cname, env.tmp_path, sync=True)
+
+    # Assert
+    assert throughput == {}
+    assert (
+        client.get_object_tagging(Bucket=env.bucket_name, Key=raw_key)["TagSet"] == tags
+    )
+
+
+def test_upload_from_directory_sync_with_delete_raises(s3_setup: S3Env) -> None:
+    """
+    Ensure sync mode can not be combined with delete before push.
+    """
+    env = s3_setup
+    artifacts = S3Artifacts(env.bucket_name)
+
+    with pytest.raises(RuntimeError, match="Sync mode"):
+        artifacts.upload_from_directory(
+            env.cname, env.tmp_path, delete_before_push=True, sync=True
+        )
+
+
+def test_download_to_directory_verified(s3_setup: S3Env) -> None:
+    """
+    Ensure downloads are verified, skipped if matching locally and filtered
+    by suffix.
+    """
+    # Arrange
+    env = s3_setup
+    chunksize = 5 * 1024 * 1024
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"0" * (2 * chunksize + 1))
+    (env.tmp_path / f"{env.cname}.qcow2").write_bytes(b"qcow2")
+    (env.tmp_path / f"{env.cname}.vmdk").write_bytes(b"vmdk")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    with TemporaryDirectory() as tmpdir:
+        outdir = Path(tmpdir)
+        (outdir / f"{env.cname}.qcow2").write_bytes(b"qcow2")
+
+        # Act
+        throughput = artifacts.download_to_directory(
+            env.cname,
+            outdir,
+            suffixes=[".raw", ".qcow2"],
+            transfer_config=S3Artifacts.get_transfer_config(chunksize),
+        )
+
+        # Assert
+        assert list(throughput.keys()) == [f"objects/{env.cname}/{env.cname}.raw"]
+        assert (outdir / f"{env.cname}.raw").read_bytes() == b"0" * (2 * chunksize + 1)
+        assert not (outdir / f"{env.cname}.vmdk").exists()
+        assert sorted(path.name for path in outdir.iterdir()) == [
+            f"{env.cname}.qcow2",
+            f"{env.cname}.raw",
+            f"{env.cname}.s3_metadata.yaml",
+        ]
+
+
+def test_download_to_directory_digest_mismatch_raises(s3_setup: S3Env) -> None:
+    """
+    Ensure artifacts not matching the metadata digest are rejected.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    env.s3.Bucket(env.bucket_name).put_object(
+        Key=f"objects/{env.cname}/{env.cname}.raw", Body=b"tampered"
+    )
+
+    with TemporaryDirectory() as tmpdir:
+        outdir = Path(tmpdir)
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="failed verification"):
+            artifacts.download_to_directory(env.cname, outdir)
+
+        assert not (outdir / f"{env.cname}.raw").exists()
+        assert not (outdir / f"{env.cname}.raw.part").exists()
+
+
+def test_upload_metadata_index(s3_setup: S3Env) -> None:
+    """
+    Ensure the metadata index aggregates all metadata of a version and is
+    preferred by the metadata reader.
+    """
+    # Arrange
+    env = s3_setup
+    bucket = env.s3.Bucket(env.bucket_name)
+    other_cname = env.cname.replace("container", "kvm")
+    old_cname = env.cname.replace("1234.1", "1234.0")
+
+    for cname in (env.cname, other_cname, old_cname):
+        bucket.put_object(Key=f"meta/singles/{cname}", Body=f"cname: {cname}\n")
+
+    artifacts = S3Artifacts(env.bucket_name)
+
+    # Act
+    index_key = artifacts.upload_metadata_index("1234.1")
+
+    # Assert
+    assert index_key == "meta/index/1234.1.json.gz"
+    assert sorted(artifacts.build_metadata_index("1234.1").keys()) == sorted(
+        [env.cname, other_cname]
+    )
+
+    # Per-flavor objects are only read for cnames missing in the index
+    bucket.put_object(Key=f"meta/singles/{env.cname}", Body=b"cname: changed\n")
+    late_cname = env.cname.replace("container", "gcp")
+    bucket.put_object(Key=f"meta/singles/{late_cname}", Body=b"cname: late\n")
+
+    metadata = artifacts.get_metadata_documents(
+        [env.cname, late_cname, "missing"], "1234.1"
+    )
+
+    assert metadata == {
+        env.cname: {"cname": env.cname},
+        late_cname: {"cname": "late"},
+        "missing": None,
+    }
+
+    assert artifacts.get_metadata_documents([env.cname]) == {
+        env.cname: {"cname": "changed"}
+    }
+
+
+def test_upload_from_directory_removes_metadata_index(s3_setup: S3Env) -> None:
+    """
+    Ensure pushing metadata removes the now stale metadata index of the
+    version.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+    index_key = artifacts.upload_metadata_index("1234.1")
+
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw changed")
+
+    # Act
+    artifacts.upload_from_directory(env.cname, env.tmp_path, sync=True)
+
+    # Assert
+    bucket = env.s3.Bucket(env.bucket_name)
+    keys = [s3_object.key for s3_object in bucket.objects.all()]
+
+    metadata = artifacts.get_metadata_documents([env.cname], "1234.1")[env.cname]
+
+    assert index_key not in keys
+    assert md5(b"raw changed").hexdigest() in [
+        path["md5sum"] for path in metadata["paths"]
+    ]
+
+
+def test_upload_metadata_index_without_metadata_raises(s3_setup: S3Env) -> None:
+    """
+    Ensure no empty metadata index is uploaded.
+    """
+    env = s3_setup
+    artifacts = S3Artifacts(env.bucket_name)
+
+    with pytest.raises(RuntimeError, match="No S3 metadata found"):
+        artifacts.upload_metadata_index("1234.1")
+
+
+def test_get_metadata_documents_order(s3_setup: S3Env) -> None:
+    """
+    Ensure concurrently fetched metadata keeps the order of cnames given and
+    falls back to the first key starting with the cname.
+    """
+    # Arrange
+    env = s3_setup
+    bucket = env.s3.Bucket(env.bucket_name)
+    cnames = [f"{env.cname}-{index}" for index in range(20)]
+
+    for cname in cnames[1:]:
+        bucket.put_object(Key=f"meta/singles/{cname}", Body=f"cname: {cname}\n")
+
+    bucket.put_object(Key=f"meta/singles/{cnames[0]}-prefixed", Body=b"cname: 0\n")
+
+    # Act
+    metadata = S3Artifacts(env.bucket_name).get_metadata_documents(cnames)
+
+    # Assert
+    assert list(metadata.keys()) == cnames
+    assert metadata[cnames[0]] == {"cname": 0}
+    assert list(metadata.values())[1:] == [{"cname": cname} for cname in cnames[1:]]
+
+
+def test_download_to_directory_legacy_metadata(s3_setup: S3Env) -> None:
+    """
+    Ensure metadata carrying the SHA256 digest of empty input as published by
+    older releases is verified with the MD5 digest.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"0123456789")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    bucket = env.s3.Bucket(env.bucket_name)
+    metadata = yaml.safe_load(
+        bucket.Object(f"meta/singles/{env.cname}").get()["Body"].read()
+    )
+
+    for path in metadata["paths"]:
+        path["sha256sum"] = sha256(b"").hexdigest()
+
+    bucket.put_object(Key=f"meta/singles/{env.cname}", Body=yaml.dump(metadata))
+
+    with TemporaryDirectory() as tmpdir:
+        outdir = Path(tmpdir)
+
+        # Act
+        artifacts.download_to_directory(env.cname, outdir)
+
+        # Assert
+        assert (outdir / f"{env.cname}.raw").read_bytes() == b"0123456789"
+
+        # Arrange
+        bucket.put_object(
+            Key=f"objects/{env.cname}/{env.cname}.raw", Body=b"tampered!!"
+        )
+
+        (outdir / f"{env.cname}.raw").unlink()
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="failed verification"):
+            artifacts.download_to_directory(env.cname, outdir)
+
+        assert not (outdir / f"{env.cname}.raw").exists()
+
+
+def test_download_to_directory_without_digests(
+    s3_setup: S3Env, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Ensure artifacts without any digest in the metadata are downloaded
+    unverified.
+    """
+    # Arrange
+    env = s3_setup
+    (env.tmp_path / f"{env.cname}.release").write_text(RELEASE_DATA)
+    (env.tmp_path / f"{env.cname}.raw").write_bytes(b"raw")
+
+    artifacts = S3Artifacts(env.bucket_name)
+    artifacts.upload_from_directory(env.cname, env.tmp_path)
+
+    bucket = env.s3.Bucket(env.bucket_name)
+    metadata = yaml.safe_load(
+        bucket.Object(f"meta/singles/{env.cname}").get()["Body"].read()
+    )
+
+    for path in metadata["paths"]:
+        del path["md5sum"]
+        del path["sha256sum"]
+
+    bucket.put_object(Key=f"meta/singles/{env.cname}", Body=yaml.dump(metadata))
+
+    with TemporaryDirectory() as tmpdir:
+        outdir = Path(tmpdir)
+
+        # Act
+        artifacts.download_to_directory(env.cname, outdir)
+
+        # Assert
+        assert (outdir / f"{env.cname}.raw").read_bytes() == b"raw"
+        assert "No digest available" in caplog.text